@@ -7,6 +7,7 @@ System: Delta HPC Cluster (delta.cs.uwindsor.ca)
 Version: 1.0
 """
 import requests
+from requests.adapters import HTTPAdapter
 import json
 import re
 import sys
@@ -22,6 +23,12 @@ from dataclasses import dataclass
 from typing import Optional, Dict, Any
 import time
 
+# Shared keep-alive pool for the three tunneled Ollama ports, so each
+# inference reuses an open TCP connection (and SSH channel) instead of
+# opening a new one per request
+_OLLAMA_SESSION = requests.Session()
+_OLLAMA_SESSION.mount("http://", HTTPAdapter(pool_connections=3, pool_maxsize=16, pool_block=False))
+
 @dataclass
 class BrainResponse:
     """Structured response from Brain API."""
@@ -139,7 +146,7 @@ class DeltaBrain:
             if max_tokens:
                 payload["options"] = {"num_predict": max_tokens}
             
-            response = requests.post(url, json=payload, timeout=timeout)
+            response = _OLLAMA_SESSION.post(url, json=payload, timeout=timeout)
             
             if response.status_code == 200:
                 answer = response.json().get("response", "")
@@ -157,6 +164,14 @@ class DeltaBrain:
             log(f"⚠️  {model_name} error: {str(e)[:50]}")
         
         # STEP 2: FALLBACK to Gemini (Cloud)
+        return self._ask_gemini(prompt, log_callback)
+    
+    def _ask_gemini(self, prompt, log_callback=None):
+        """Cloud fallback shared by safe_ask and ask_stream; returns (text, model_used)"""
+        def log(msg):
+            if log_callback:
+                log_callback(msg)
+        
         try:
             log("☁️  Falling back to Gemini (Cloud)...")
             from src.brain.tools_gemini import generate_with_fallback
@@ -185,6 +200,74 @@ class DeltaBrain:
         response, model_used = self.safe_ask(prompt, mode, max_tokens)
         return response
     
+    def ask_stream(self, prompt, mode="balanced", max_tokens=None, on_chunk=None, log_callback=None):
+        """Like safe_ask, but streams Delta tokens to on_chunk as they arrive
+        
+        Args:
+            prompt: Your question or request
+            mode: "fast", "balanced", or "smart"
+            max_tokens: Optional max tokens for response
+            on_chunk: Optional function(text) called with each new piece of the answer
+            log_callback: Optional function(msg) to log decisions
+            
+        Returns:
+            Full AI response as string
+        """
+        def log(msg):
+            if log_callback:
+                log_callback(msg)
+        
+        def emit(text):
+            if on_chunk and text:
+                on_chunk(text)
+        
+        # Same concise-request cap as safe_ask
+        if max_tokens is None and any(k in prompt.lower() for k in ('concise', 'brief', 'short', 'quick', 'summary', 'tldr')):
+            max_tokens = 256
+        
+        port = self.ports[mode]
+        model = self.models[mode]
+        model_name = f"Delta-{model.split(':')[1].upper()}"
+        url = f"http://{self.host}:{port}/api/generate"
+        # Streaming: the timeout bounds each read (time to next token), not the whole answer
+        timeout = {"fast": 15, "balanced": 30, "smart": 60}.get(mode, 30)
+        
+        payload = {"model": model, "prompt": prompt, "stream": True}
+        if max_tokens:
+            payload["options"] = {"num_predict": max_tokens}
+        
+        parts = []
+        try:
+            log(f"🧠 Streaming from {model_name} (Local, Private, Free)...")
+            with _OLLAMA_SESSION.post(url, json=payload, timeout=timeout, stream=True) as response:
+                if response.status_code != 200:
+                    raise Exception(f"HTTP {response.status_code}")
+                # Ollama sends one JSON object per line: {"response": "...", "done": false}
+                for line in response.iter_lines():
+                    if not line:
+                        continue
+                    data = json.loads(line)
+                    piece = data.get("response", "")
+                    if piece:
+                        parts.append(piece)
+                        emit(piece)
+                    if data.get("done"):
+                        break
+            log(f"✅ {model_name} responded successfully")
+            return "".join(parts)
+        except Exception as e:
+            if parts:
+                # Part of the answer is already on screen; keep it rather than
+                # restarting on another model underneath it
+                log(f"⚠️  {model_name} stream interrupted: {str(e)[:50]}")
+                return "".join(parts)
+            log(f"⚠️  {model_name} stream failed: {str(e)[:50]}")
+        
+        # Delta unavailable: Gemini answers in one piece
+        response, _ = self._ask_gemini(prompt, log_callback)
+        emit(response)
+        return response
+    
     def ask_with_context(self, question, context_chunks, mode="balanced", max_tokens=None):
         """Ask a question with retrieved context chunks (RAG pattern)
         
@@ -311,7 +394,7 @@ Provide:
         for mode, port in self.ports.items():
             try:
                 url = f"http://{self.host}:{port}/api/version"
-                response = requests.get(url, timeout=5)
+                response = _OLLAMA_SESSION.get(url, timeout=5)
                 results[mode] = "✅ Connected" if response.ok else "❌ Error"
             except:
                 results[mode] = "❌ Not reachable"
@@ -20,7 +20,11 @@ except Exception:
     HAS_LANGCHAIN_GOOGLE_GENAI = False
     print("⚠️ langchain_google_genai not installed; falling back to simplified Tavily-only agent")
 from src.brain.core_tools import ALL_TOOLS
+from src.brain.embedding_index import EmbeddingIndex
+import functools
+import threading
 import time
+from collections import Counter, defaultdict
 
 # Load environment variables
 load_dotenv()
@@ -56,6 +60,23 @@ EXAMPLES OF CORRECT BEHAVIOR:
 
 You have the tools - USE THEM! Don't hallucinate actions."""
 
+# Tool pre-selection: bind only the TOOL_PRESELECT_K tools closest to the command
+# (plus MANDATORY_TOOLS) instead of sending all 41 schemas on every step
+TOOL_PRESELECT_K = 6
+MANDATORY_TOOLS = ("web_search_tavily", "general_chat")
+_tool_index = EmbeddingIndex([(t, f"{t.name}: {t.description}") for t in ALL_TOOLS])
+
+# Tool usage inertia: (anchor tool, previous tool) -> Counter of the tool the agent
+# called next, learned from finished runs. The anchor - the tool nearest the
+# query - stands in for a query cluster. Successors seen more than
+# INERTIA_THRESHOLD of the time are bound even if they rank outside the top K.
+INERTIA_THRESHOLD = 0.7
+_START = "<start>"
+_tool_graph = defaultdict(Counter)
+_tool_graph_lock = threading.Lock()
+
+llm = None
+
 # Initialize Gemini LLM - using models/ prefix for v1beta API
 if HAS_LANGCHAIN_GOOGLE_GENAI and ChatGoogleGenerativeAI:
     try:
@@ -76,7 +97,61 @@ else:
     agent = None
 
 
-def execute_autonomous(command: str, max_retries: int = 3, timeout: int = 90) -> str:
+def select_tools(command: str, embed, k: int = TOOL_PRESELECT_K, embed_many=None):
+    """
+    Pick the tools most relevant to command by embedding similarity (no LLM call)
+    
+    Args:
+        command: User query/command
+        embed: Function(text) -> embedding list or None (e.g. SynthRAG.get_embedding)
+        k: Number of top-ranked tools to keep
+        embed_many: Optional function(list of texts) -> list of embeddings
+            (e.g. SynthRAG.get_embeddings) to embed the tool descriptions in one batch
+        
+    Returns:
+        List of tools (top k, then the usual follow-up tools for this kind of
+        request, then MANDATORY_TOOLS) with the nearest tool first, or None if
+        embeddings are unavailable - callers should then use every tool
+    """
+    selected = _tool_index.rank(command, embed, embed_many, k=k)
+    if not selected:
+        return None
+    extra = set(_likely_tool_chain(selected[0].name)) | set(MANDATORY_TOOLS)
+    selected += [t for t in ALL_TOOLS if t.name in extra and t not in selected]
+    return selected
+
+
+def record_tool_sequence(anchor: str, tools_used):
+    """Count each prev -> next tool transition of a finished run under anchor"""
+    with _tool_graph_lock:
+        for prev, nxt in zip([_START, *tools_used], tools_used):
+            _tool_graph[(anchor, prev)][nxt] += 1
+
+
+def _likely_tool_chain(anchor: str, limit: int = 4):
+    """Follow the dominant (> INERTIA_THRESHOLD) successors from the start of a run"""
+    chain = []
+    prev = _START
+    with _tool_graph_lock:
+        while len(chain) < limit:
+            counts = _tool_graph.get((anchor, prev))
+            if not counts:
+                break
+            name, n = counts.most_common(1)[0]
+            if n / sum(counts.values()) <= INERTIA_THRESHOLD or name in chain:
+                break
+            chain.append(name)
+            prev = name
+    return chain
+
+
+@functools.lru_cache(maxsize=32)
+def _agent_for(tool_names: tuple):
+    """ReAct agent bound to just these tools (cached per tool set)"""
+    return create_react_agent(llm, [t for t in ALL_TOOLS if t.name in tool_names])
+
+
+def execute_autonomous(command: str, max_retries: int = 3, timeout: int = 90, tools=None) -> str:
     """
     Execute command autonomously - agent decides which tools to use
     
@@ -84,6 +159,8 @@ def execute_autonomous(command: str, max_retries: int = 3, timeout: int = 90) ->
         command: User query/command
         max_retries: Number of retry attempts on failure
         timeout: Max execution time in seconds
+        tools: Optional subset of ALL_TOOLS to bind (see select_tools); None = all.
+            The tools the run calls are recorded against tools[0]
         
     Returns:
         Agent's final response
@@ -97,10 +174,15 @@ def execute_autonomous(command: str, max_retries: int = 3, timeout: int = 90) ->
                 from src.brain.agent_simple import execute_autonomous as simple_execute
                 return simple_execute(command)
             
-            print(f"🤖 Full Agent: Processing with all 41 tools...")
+            if tools:
+                run_agent = _agent_for(tuple(sorted(t.name for t in tools)))
+                print(f"🤖 Full Agent: Processing with {len(tools)} pre-selected tools...")
+            else:
+                run_agent = agent
+                print(f"🤖 Full Agent: Processing with all 41 tools...")
             
             # Invoke agent with system prompt + user command
-            result = agent.invoke({
+            result = run_agent.invoke({
                 "messages": [
                     ("system", AGENT_SYSTEM_PROMPT),
                     ("user", command)
@@ -143,6 +225,10 @@ def execute_autonomous(command: str, max_retries: int = 3, timeout: int = 90) ->
             else:
                 final_content = str(final_message)
             
+            # Learn the sequence for next time (tools[0] is the query's anchor tool)
+            if tools and tools_used:
+                record_tool_sequence(tools[0].name, tools_used)
+            
             # Log what happened
             if tool_calls_found:
                 unique_tools = list(set(tools_used))
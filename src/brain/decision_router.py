@@ -9,12 +9,18 @@ Contract:
 - Input: query string, clipboard_text (maybe empty), config flags
 - Output: dict with keys: action (local|llm|web|rag), tool (callable name), preferred_models (list), reason (str)
 
+route_agent_query() is the embedding-based counterpart for the Agent button:
+it k-NN votes over labelled example queries to decide whether a request
+really needs the tool-using agent or a direct LLM answer is enough.
+
 """
 from __future__ import annotations
-from typing import Dict, List, TypedDict
+from typing import Callable, Dict, List, Optional, TypedDict
 import os
 import re
 
+from src.brain.embedding_index import EmbeddingIndex
+
 
 def _is_research_query(query: str) -> bool:
     q = query.lower()
@@ -121,3 +127,80 @@ def decide_tool_for_copy_and_explain(clipboard_text: str) -> Decision:
         'preferred_models': preferred_models,
         'reason': 'Clipboard explain'
     }
+
+
+# (query, route) exemplars for route_agent_query: 'agent' needs tools (files,
+# apps, system state, live web pages), 'llm' is answerable from model knowledge
+ROUTE_EXEMPLARS = [
+    ("open Safari and go to github.com", "agent"),
+    ("find all PDF files in my Downloads folder", "agent"),
+    ("how much free disk space do I have", "agent"),
+    ("what's my current battery level", "agent"),
+    ("close all Chrome windows", "agent"),
+    ("create a folder called reports on my desktop", "agent"),
+    ("move the screenshots on my desktop into a new folder", "agent"),
+    ("what's the weather in Toronto right now", "agent"),
+    ("show me the latest news about Apple", "agent"),
+    ("read this webpage and summarize it https://example.com", "agent"),
+    ("which apps are using the most memory", "agent"),
+    ("set the volume to 30 percent", "agent"),
+    ("copy the contents of notes.txt to my clipboard", "agent"),
+    ("search the web for the current bitcoin price", "agent"),
+    ("clean up my caches to free space", "agent"),
+    ("what is a hash table", "llm"),
+    ("explain the difference between TCP and UDP", "llm"),
+    ("write a haiku about autumn", "llm"),
+    ("translate 'good morning' into Spanish", "llm"),
+    ("what does FIPS 203 standardize", "llm"),
+    ("how do I reverse a list in Python", "llm"),
+    ("summarize the plot of Hamlet", "llm"),
+    ("what is the capital of Australia", "llm"),
+    ("give me a regex that matches email addresses", "llm"),
+    ("why is the sky blue", "llm"),
+    ("convert 5 miles to kilometers", "llm"),
+    ("rewrite this sentence to sound more formal: we need it asap", "llm"),
+    ("what are the SOLID principles", "llm"),
+    ("who wrote Pride and Prejudice", "llm"),
+    ("explain big O notation with an example", "llm"),
+]
+ROUTE_K = 5
+
+_exemplar_index = EmbeddingIndex([(route, text) for text, route in ROUTE_EXEMPLARS])
+
+
+def route_agent_query(query: str,
+                      embed: Callable[[str], Optional[List[float]]],
+                      k: int = ROUTE_K,
+                      embed_many: Optional[Callable[[List[str]], List[Optional[List[float]]]]] = None) -> Decision:
+    """Decide whether an Agent-button query needs the tool-using agent.
+
+    The k nearest ROUTE_EXEMPLARS (cosine over embed()) vote; a majority of
+    'llm' neighbours routes to a direct answer. When embeddings are
+    unavailable the query goes to the agent, which is what the user asked for.
+    embed_many (e.g. SynthRAG.get_embeddings) embeds the exemplars in one batch.
+
+    Returns a Decision with action 'agent' or 'llm'
+    """
+    nearest = _exemplar_index.rank(query, embed, embed_many, k=k)
+    if not nearest:
+        return {
+            'action': 'agent',
+            'tool': 'execute_autonomous',
+            'preferred_models': [],
+            'reason': 'Embeddings unavailable'
+        }
+
+    agent_votes = sum(route == 'agent' for route in nearest)
+    if agent_votes * 2 > len(nearest):
+        return {
+            'action': 'agent',
+            'tool': 'execute_autonomous',
+            'preferred_models': [],
+            'reason': f'{agent_votes}/{len(nearest)} nearest examples need tools'
+        }
+    return {
+        'action': 'llm',
+        'tool': 'llm_general_chat',
+        'preferred_models': [],
+        'reason': f'{len(nearest) - agent_votes}/{len(nearest)} nearest examples answered directly'
+    }
@@ -0,0 +1,73 @@
+"""
+Embedding Index - rank a fixed set of texts against a query by cosine similarity
+
+Shared by tool pre-selection (agent_core.select_tools) and the Agent-button
+router (decision_router.route_agent_query). The fixed texts are embedded on
+first use - in one batch when an embed_many function is given - and kept
+for the life of the process; no LLM call is involved.
+"""
+
+import math
+import threading
+from typing import Any, Callable, List, Optional, Sequence, Tuple
+
+Embedding = List[float]
+EmbedFn = Callable[[str], Optional[Embedding]]
+EmbedManyFn = Callable[[List[str]], List[Optional[Embedding]]]
+
+
+def unit(vector: Embedding) -> Embedding:
+    """Scale vector to length 1 so a dot product is the cosine similarity"""
+    norm = math.sqrt(sum(x * x for x in vector)) or 1.0
+    return [x / norm for x in vector]
+
+
+class EmbeddingIndex:
+    """(payload, text) pairs embedded once, ranked against queries"""
+
+    def __init__(self, items: Sequence[Tuple[Any, str]]):
+        """
+        Args:
+            items: (payload, text) pairs; rank() returns the payloads
+        """
+        self.items = list(items)
+        self._vectors = None  # [(payload, unit embedding)], built on first use
+        self._lock = threading.Lock()
+
+    def _ensure_vectors(self, embed: EmbedFn, embed_many: Optional[EmbedManyFn]) -> bool:
+        """Embed every item once; all or nothing, so a failure retries next call"""
+        with self._lock:
+            if self._vectors is None:
+                texts = [text for _, text in self.items]
+                embs = embed_many(texts) if embed_many else [embed(text) for text in texts]
+                if not embs or not all(embs):
+                    return False  # Try again next time (e.g. tunnel still starting)
+                self._vectors = [(payload, unit(emb)) for (payload, _), emb in zip(self.items, embs)]
+        return True
+
+    def rank(self, query: str, embed: EmbedFn,
+             embed_many: Optional[EmbedManyFn] = None,
+             k: Optional[int] = None) -> Optional[List[Any]]:
+        """
+        Payloads ordered by similarity of their text to query, nearest first
+
+        Args:
+            query: Text to rank against
+            embed: Function(text) -> embedding list or None (e.g. SynthRAG.get_embedding)
+            embed_many: Optional function(list of texts) -> list of embeddings
+                (e.g. SynthRAG.get_embeddings) to embed the items in one batch
+            k: Keep only the k nearest (all when None)
+
+        Returns:
+            List of payloads, or None if embeddings are unavailable
+        """
+        if not self._ensure_vectors(embed, embed_many):
+            return None
+        query_emb = embed(query)
+        if not query_emb:
+            return None
+        query_vec = unit(query_emb)
+        ranked = sorted(self._vectors,
+                        key=lambda pv: sum(a * b for a, b in zip(pv[1], query_vec)),
+                        reverse=True)
+        return [payload for payload, _ in ranked[:k]]
@@ -176,6 +176,37 @@ class SynthRAG:
             print(f"⚠️  Embedding error: {e}")
             return None
     
+    def get_embeddings(self, texts: List[str]) -> List[Optional[List[float]]]:
+        """
+        Embed several texts with one Ollama /api/embed request
+        
+        Falls back to one get_embedding() call per text on older Ollama
+        servers that lack the batch endpoint.
+        
+        Args:
+            texts: Texts to embed
+            
+        Returns:
+            One embedding (or None if it failed) per text, in order
+        """
+        if not texts:
+            return []
+        try:
+            url = f"http://{self.ollama_host}:{self.ollama_port}/api/embed"
+            response = requests.post(url, json={
+                "model": self.embedding_model,
+                "input": texts
+            }, timeout=60)
+            
+            if response.status_code == 200:
+                embeddings = response.json().get('embeddings', [])
+                if len(embeddings) == len(texts):
+                    return [e if len(e) == self.embedding_dim else None for e in embeddings]
+        except Exception as e:
+            print(f"⚠️  Batch embedding error: {e}")
+        
+        return [self.get_embedding(text) for text in texts]
+    
     def add_document(self, text: str, source: str, metadata: Optional[Dict] = None) -> bool:
         """
         Add single document to vector store
@@ -340,20 +371,51 @@ class SynthRAG:
         Returns:
             Number of results added
         """
-        count = 0
-        for result in results:
-            text = f"{result.title}\n\n{result.snippet}"
-            metadata = {
-                "url": result.url,
-                "source_type": result.source,
-                "query": query
-            }
-            if self.add_document(text, result.url, metadata):
-                count += 1
+        if not self.qdrant or not results:
+            return 0
         
-        return count
+        texts = [f"{result.title}\n\n{result.snippet}" for result in results]
+        
+        # Embed every result that doesn't carry a vector yet in one request,
+        # and keep it on the result so re-ingesting it is free
+        missing = [i for i, result in enumerate(results) if not getattr(result, 'embedding', None)]
+        for i, embedding in zip(missing, self.get_embeddings([texts[i] for i in missing])):
+            results[i].embedding = embedding
+        
+        timestamp = datetime.now().isoformat()
+        points = []
+        for result, text in zip(results, texts):
+            if not result.embedding:
+                print(f"⚠️  Failed to get embedding for: {text[:50]}...")
+                continue
+            points.append(PointStruct(
+                id=hashlib.md5(text.encode()).hexdigest(),
+                vector=result.embedding,
+                payload={
+                    "text": text,
+                    "source": result.url,
+                    "metadata": {
+                        "source": result.url,
+                        "timestamp": timestamp,
+                        "text_length": len(text),
+                        "url": result.url,
+                        "source_type": result.source,
+                        "query": query
+                    }
+                }
+            ))
+        
+        if not points:
+            return 0
+        try:
+            self.qdrant.upsert(collection_name=self.collection_name, points=points)
+            return len(points)
+        except Exception as e:
+            print(f"⚠️  Failed to add web results: {e}")
+            return 0
     
-    def search(self, query: str, top_k: int = 5, min_score: float = 0.3) -> List[Dict]:
+    def search(self, query: str, top_k: int = 5, min_score: float = 0.3,
+               query_embedding: Optional[List[float]] = None) -> List[Dict]:
         """
         Search vector store for relevant documents
         
@@ -361,6 +423,7 @@ class SynthRAG:
             query: Search query
             top_k: Number of results to return
             min_score: Minimum similarity score (0-1)
+            query_embedding: Precomputed embedding of query (skips the Ollama call)
             
         Returns:
             List of relevant documents with scores
@@ -370,7 +433,7 @@ class SynthRAG:
             
         try:
             # Get query embedding
-            query_embedding = self.get_embedding(query)
+            query_embedding = query_embedding or self.get_embedding(query)
             if not query_embedding:
                 return []
             
@@ -402,7 +465,8 @@ class SynthRAG:
             print(f"⚠️  Search failed: {e}")
             return []
     
-    def query(self, question: str, context_sources: Optional[List[str]] = None, top_k: int = 5, min_score: float = 0.5) -> Dict:
+    def query(self, question: str, context_sources: Optional[List[str]] = None, top_k: int = 5, min_score: float = 0.5,
+              query_embedding: Optional[List[float]] = None) -> Dict:
         """
         Main RAG query function - retrieves relevant context and formats for AI
         
@@ -411,12 +475,14 @@ class SynthRAG:
             context_sources: Optional list of sources to filter by
             top_k: Number of context chunks to retrieve
             min_score: Minimum similarity score (0-1, default 0.5)
+            query_embedding: Precomputed embedding of question (skips the Ollama call)
             
         Returns:
             Dict with context, sources, and formatted prompt
         """
         # Search for relevant documents
-        relevant_docs = self.search(question, top_k=top_k, min_score=min_score)
+        relevant_docs = self.search(question, top_k=top_k, min_score=min_score,
+                                    query_embedding=query_embedding)
         
         # Filter by sources if specified
         if context_sources:
@@ -0,0 +1,211 @@
+#!/usr/bin/env python3
+"""
+Response Cache for Synth
+Remembers Brain answers so a repeated (or reworded) Ask skips the LLM round-trip
+
+Two tiers: an in-memory exact-match LRU (normalized question + context + mode),
+checked before any embedding work, then a semantic lookup that embeds the
+question with the same Ollama model as SynthRAG and searches a separate Qdrant
+collection on the same local store, so cached answers survive restarts. A
+semantic hit needs cosine >= threshold AND the exact same context (clipboard,
+screen text) and mode - a similar question about different text is a miss.
+Web-search modes ("*_web") answer from live data with an empty context, so
+they only use the exact tier, with a much shorter TTL: "weather in Boston"
+must never be served for "weather in Austin", and a verbatim repeat only
+skips the search while the results can't have moved.
+
+Author: Project Synth
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import List, NamedTuple, Optional, Tuple
+
+try:
+    from qdrant_client.models import (Distance, VectorParams, PointStruct,
+                                      Filter, FieldCondition, MatchValue)
+    QDRANT_AVAILABLE = True
+except ImportError:
+    QDRANT_AVAILABLE = False
+
+
+class CacheSlot(NamedTuple):
+    """Where a get() miss should be stored; embedding is reusable for RAG search"""
+    exact: str
+    query: str
+    context: str
+    embedding: Optional[List[float]]
+    mode: str
+
+
+class ResponseCache:
+    """Exact-match + semantic cache of Brain responses, stored next to the SynthRAG collection"""
+
+    def __init__(self,
+                 rag,
+                 collection_name: str = "synth_response_cache",
+                 threshold: float = 0.95,
+                 ttl: float = 3600.0,
+                 exact_ttl: float = 420.0,
+                 exact_max_entries: int = 1000,
+                 live_ttl: float = 60.0):
+        """
+        Args:
+            rag: SynthRAG instance (provides the Qdrant client and embeddings)
+            collection_name: Qdrant collection for cached responses
+            threshold: Minimum cosine similarity for a hit
+            ttl: Seconds a cached answer stays valid (answers may cite live data)
+            exact_ttl: Seconds an exact-match entry stays valid - the same
+                question about the same text in the same mode, so only a
+                repeat within a few minutes is answered from memory
+            exact_max_entries: Exact-match entries kept before LRU eviction
+            live_ttl: Seconds a web-search ("*_web") answer stays valid; a
+                repeat after that re-runs the search for fresh news/prices
+        """
+        self.rag = rag
+        self.collection_name = collection_name
+        self.threshold = threshold
+        self.ttl = ttl
+        self.exact_ttl = exact_ttl
+        self.exact_max_entries = exact_max_entries
+        self.live_ttl = live_ttl
+        # exact key -> (expires at, response); most recently used last
+        self._exact: "OrderedDict[str, Tuple[float, str]]" = OrderedDict()
+        self._exact_lock = threading.Lock()
+        self.qdrant = getattr(rag, "qdrant", None) if QDRANT_AVAILABLE else None
+
+        if self.qdrant:
+            try:
+                names = [c.name for c in self.qdrant.get_collections().collections]
+                if collection_name not in names:
+                    self.qdrant.create_collection(
+                        collection_name=collection_name,
+                        vectors_config=VectorParams(size=rag.embedding_dim,
+                                                    distance=Distance.COSINE)
+                    )
+            except Exception as e:
+                print(f"⚠️  Response cache disabled: {e}")
+                self.qdrant = None
+
+    @staticmethod
+    def context_key(context: str, mode: str) -> str:
+        """Short fingerprint of the exact context + mode an answer was built from"""
+        digest = hashlib.blake2b((context or "").encode(), digest_size=8).hexdigest()
+        return f"{mode}:{digest}"
+
+    @staticmethod
+    def exact_key(query: str, context: str, mode: str) -> str:
+        """Fingerprint of the normalized question + exact context + mode"""
+        raw = f"{mode}|{query.strip().lower()}|{context or ''}"
+        return hashlib.blake2b(raw.encode()).hexdigest()
+
+    def _exact_get(self, key: str) -> Optional[str]:
+        with self._exact_lock:
+            entry = self._exact.get(key)
+            if entry is None:
+                return None
+            if time.time() > entry[0]:
+                del self._exact[key]
+                return None
+            self._exact.move_to_end(key)
+            return entry[1]
+
+    def _exact_put(self, key: str, response: str, ttl: float):
+        with self._exact_lock:
+            self._exact[key] = (time.time() + ttl, response)
+            self._exact.move_to_end(key)
+            while len(self._exact) > self.exact_max_entries:
+                self._exact.popitem(last=False)
+
+    @staticmethod
+    def is_live(mode: str) -> bool:
+        """Web-search modes answer from live data and skip the semantic tier"""
+        return mode.endswith("_web")
+
+    def get(self, query: str, context: str = "", mode: str = "") -> Tuple[Optional[str], Optional[CacheSlot]]:
+        """
+        Look up a cached answer: exact match first, then semantic
+
+        Returns:
+            (response or None, slot) - pass slot to put() after a miss so the
+            query isn't fingerprinted or embedded twice; slot.embedding can
+            also be handed to SynthRAG.query()
+        """
+        exact = self.exact_key(query, context, mode)
+        hit = self._exact_get(exact)
+        if hit is not None:
+            return hit, None
+
+        ctx = self.context_key(context, mode)
+        embedding = None
+        if self.qdrant and not self.is_live(mode):
+            embedding = self.rag.get_embedding(query)
+        slot = CacheSlot(exact, query, ctx, embedding, mode)
+        if not embedding:
+            return None, slot
+
+        try:
+            points = self.qdrant.query_points(
+                collection_name=self.collection_name,
+                query=embedding,
+                query_filter=Filter(must=[FieldCondition(key="context", match=MatchValue(value=ctx))]),
+                limit=1
+            ).points
+        except Exception as e:
+            print(f"⚠️  Response cache lookup failed: {e}")
+            return None, slot
+
+        if points and points[0].score >= self.threshold:
+            payload = points[0].payload or {}
+            response = payload.get("response")
+            if response and time.time() - payload.get("created", 0) <= self.ttl:
+                # Promote so the next identical ask skips the embedding call
+                self._exact_put(exact, response, self.exact_ttl)
+                return response, slot
+        return None, slot
+
+    def put(self, slot: Optional[CacheSlot], response: str) -> bool:
+        """Store response for the query/context of a get() miss; errors aren't cached"""
+        if slot is None or not response:
+            return False
+        if response.lstrip().startswith(("❌", "⚠️", "Error:")):
+            return False
+
+        exact, query, ctx, embedding, mode = slot
+        self._exact_put(exact, response, self.live_ttl if self.is_live(mode) else self.exact_ttl)
+        if not self.qdrant or not embedding:
+            return True
+        try:
+            self.qdrant.upsert(
+                collection_name=self.collection_name,
+                points=[PointStruct(
+                    id=hashlib.md5(f"{ctx}\n{query}".encode()).hexdigest(),
+                    vector=embedding,
+                    payload={"query": query, "context": ctx,
+                             "response": response, "created": time.time()}
+                )]
+            )
+            return True
+        except Exception as e:
+            print(f"⚠️  Response cache store failed: {e}")
+            return False
+
+    def clear(self) -> bool:
+        """Drop every cached response"""
+        with self._exact_lock:
+            self._exact.clear()
+        if not self.qdrant:
+            return False
+        try:
+            self.qdrant.delete_collection(self.collection_name)
+            self.qdrant.create_collection(
+                collection_name=self.collection_name,
+                vectors_config=VectorParams(size=self.rag.embedding_dim,
+                                            distance=Distance.COSINE)
+            )
+            return True
+        except Exception as e:
+            print(f"⚠️  Failed to clear response cache: {e}")
+            return False
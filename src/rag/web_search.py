@@ -20,6 +20,7 @@ class SearchResult:
     url: str
     snippet: str
     source: str
+    embedding: Optional[List[float]] = None  # filled once by SynthRAG.add_web_results
 
 
 class WebSearchRAG:
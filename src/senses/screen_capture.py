@@ -120,6 +120,51 @@ class ScreenCapture:
         
         return buffer.getvalue()
     
+    def prepare_for_ocr(self, img: Image.Image, max_edge: int = 2560) -> Image.Image:
+        """
+        Shrink and binarize a screenshot for OCR.
+        
+        Tesseract's runtime scales with pixel count, and 5K/6K Retina
+        captures are oversampled for reading UI text. Capping the long edge
+        at max_edge still keeps 13pt text at its 1x size. The image is then
+        Otsu-thresholded to black and white (single channel, a third of the
+        RGB bytes).
+        
+        Args:
+            img: PIL Image from capture()
+            max_edge: Longest side after downscaling, in pixels
+            
+        Returns:
+            Grayscale ('L') image holding only 0/255 pixels
+        """
+        scale = max_edge / max(img.size)
+        if scale < 1.0:
+            img = img.resize((int(img.width * scale), int(img.height * scale)),
+                             Image.Resampling.LANCZOS)
+        gray = img.convert('L')
+        
+        # Otsu: the threshold that maximizes between-class variance
+        hist = gray.histogram()
+        total = sum(hist)
+        sum_all = sum(i * n for i, n in enumerate(hist))
+        sum_bg = weight_bg = 0
+        best_var, threshold = -1.0, 127
+        for t, n in enumerate(hist):
+            weight_bg += n
+            if weight_bg == 0:
+                continue
+            weight_fg = total - weight_bg
+            if weight_fg == 0:
+                break
+            sum_bg += t * n
+            mean_bg = sum_bg / weight_bg
+            mean_fg = (sum_all - sum_bg) / weight_fg
+            between_var = weight_bg * weight_fg * (mean_bg - mean_fg) ** 2
+            if between_var > best_var:
+                best_var, threshold = between_var, t
+        
+        return gray.point([0 if i <= threshold else 255 for i in range(256)])
+    
     def get_size_info(self, monitor: int = 1) -> dict:
         """
         Get size information for captured and compressed image.
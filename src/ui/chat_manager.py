@@ -15,6 +15,14 @@ class ChatMessage:
         self.role = role  # 'user' or 'assistant'
         self.content = content
         self.timestamp = timestamp or datetime.now()
+        self._time_str = None
+    
+    @property
+    def time_str(self) -> str:
+        """Display time (HH:MM:SS AM/PM), formatted once and reused on re-renders"""
+        if self._time_str is None:
+            self._time_str = self.timestamp.strftime("%I:%M:%S %p")
+        return self._time_str
     
     def to_dict(self) -> Dict:
         return {
@@ -40,14 +48,16 @@ class ChatManager:
         self.max_history = max_history
         self.session_start = datetime.now()
     
-    def add_message(self, role: str, content: str):
-        """Add a message to the conversation"""
+    def add_message(self, role: str, content: str) -> ChatMessage:
+        """Add a message to the conversation and return it"""
         msg = ChatMessage(role, content)
         self.messages.append(msg)
         
         # Keep only recent messages if we exceed max
         if len(self.messages) > self.max_history:
             self.messages = self.messages[-self.max_history:]
+        
+        return msg
     
     def get_context(self, last_n: Optional[int] = None) -> str:
         """
@@ -91,9 +101,8 @@ class ChatManager:
         
         # Build message list efficiently
         for i, msg in enumerate(messages_to_show, 1):
-            time_str = msg.timestamp.strftime("%I:%M:%S %p")
             prefix = "👤 You" if msg.role == 'user' else "🤖 Synth"
-            parts.append(f"[{time_str}] {prefix}:")
+            parts.append(f"[{msg.time_str}] {prefix}:")
             parts.append(msg.content)
             parts.append("")  # Blank line between messages
         
@@ -32,6 +32,22 @@ from src.plugins.plugin_manager import PluginManager
 from src.plugins.base_plugin import PluginContext
 from src.senses.screen_capture import ScreenCapture
 
+# Whitespace control chars flattened to spaces in the one-line clipboard preview
+_NL_TABLE = str.maketrans('\n\r\t', '   ')
+
+# Plugin discovery walks the filesystem and imports every module, so the
+# loaded manager is shared by every panel instance
+_PLUGIN_MGR = None
+
+
+def _get_plugin_mgr(dirs):
+    """Return the process-wide PluginManager, loading plugins on first call"""
+    global _PLUGIN_MGR
+    if _PLUGIN_MGR is None:
+        _PLUGIN_MGR = PluginManager(plugin_dirs=list(dirs))
+        _PLUGIN_MGR.load_all_plugins()
+    return _PLUGIN_MGR
+
 
 class FloatingPanel(QMainWindow):
     """Siri-like floating panel for natural queries"""
@@ -40,15 +56,15 @@ class FloatingPanel(QMainWindow):
         super().__init__()
         self.brain = DeltaBrain()
         self.screen_capture = ScreenCapture()
+        # Resolve pyperclip's backend once instead of on every paste() call
+        self._paste = pyperclip.determine_clipboard()[1]
         self.init_plugins()
         self.init_ui()
         self.detected_context = ""
         
     def init_plugins(self):
         """Initialize plugin system"""
-        plugin_dirs = [str(project_root / "src" / "plugins" / "core")]
-        self.plugin_manager = PluginManager(plugin_dirs=plugin_dirs)
-        self.plugin_manager.load_all_plugins()
+        self.plugin_manager = _get_plugin_mgr((str(project_root / "src" / "plugins" / "core"),))
         
     def init_ui(self):
         """Setup the Siri-like floating panel UI"""
@@ -270,10 +286,10 @@ class FloatingPanel(QMainWindow):
         
         main_widget.setLayout(main_layout)
         
-        # Auto-detect timer
-        self.detect_timer = QTimer()
+        # Auto-detect timer - only runs while the panel is visible (see showEvent/hideEvent)
+        self.detect_timer = QTimer(self)
+        self.detect_timer.setInterval(2000)  # Check every 2 seconds
         self.detect_timer.timeout.connect(self.auto_detect_context)
-        self.detect_timer.start(2000)  # Check every 2 seconds
     
     def show_quick_actions_menu(self):
         """Show popup menu with Quick Actions"""
@@ -319,10 +335,10 @@ class FloatingPanel(QMainWindow):
         """Auto-detect context from clipboard (optional, not forced)"""
         try:
             # Get clipboard but don't force it into queries
-            clipboard_text = pyperclip.paste()
+            clipboard_text = self._paste()
             
             if clipboard_text and len(clipboard_text.strip()) > 3:
-                preview = clipboard_text[:80].replace('\n', ' ')
+                preview = clipboard_text[:80].translate(_NL_TABLE)
                 self.detected_context = clipboard_text
                 self.context_label.setText(f"📋 Context available: {preview}...")
             else:
@@ -345,8 +361,7 @@ class FloatingPanel(QMainWindow):
         if any(keyword in query.lower() for keyword in screen_keywords):
             # User wants actual screen analysis, not clipboard
             self.result_display.setText("📸 Capturing your screen for analysis...\n\nWindow will hide in 2 seconds!")
-            QApplication.processEvents()
-            self.analyze_screen()
+            QTimer.singleShot(0, self.analyze_screen)
             return
         
         # Build context only if clipboard seems relevant
@@ -357,23 +372,35 @@ class FloatingPanel(QMainWindow):
         
         final_query = full_context + query
         
+        self._ui_show_thinking(query)
+        # Queue the blocking call so the label paints on the way back to the event loop
+        QTimer.singleShot(0, lambda: self._run_brain(final_query))
+    
+    def _ui_show_thinking(self, query):
+        """Show the thinking state before the Brain call runs"""
         self.result_display.setText("🧠 Thinking...")
-        QApplication.processEvents()
         
         # Resize window based on expected response
         self.adjust_window_size(len(query))
-        
+    
+    def _run_brain(self, final_query):
+        """Ask Brain AI and render the response"""
         try:
-            # Ask Brain AI
             response = self.brain.ask(final_query, mode="balanced")
-            self.result_display.setText(response)
-            
-            # Expand window to fit response
-            self.adjust_window_size(len(response))
+            self._render_result(response)
             
         except Exception as e:
             self.result_display.setText(f"❌ Error: {str(e)}")
     
+    def _render_result(self, text):
+        """Show a response and grow the window to fit it in a single repaint"""
+        self.setUpdatesEnabled(False)
+        try:
+            self.result_display.setText(text)
+            self.adjust_window_size(len(text))
+        finally:
+            self.setUpdatesEnabled(True)
+    
     def adjust_window_size(self, content_length):
         """Dynamically adjust window height based on content - smooth expansion"""
         base_height = 400  # Compact starting size
@@ -498,10 +525,7 @@ class FloatingPanel(QMainWindow):
                         response = self.brain.ask(analysis_query, mode="balanced")
                         
                         final_result = f"📊 SCREEN ANALYSIS:\n\n{response}\n\n---\n📝 Extracted text preview:\n{extracted_text[:300]}..."
-                        self.result_display.setText(final_result)
-                        
-                        # Expand window for full analysis
-                        self.adjust_window_size(len(final_result))
+                        self._render_result(final_result)
                     else:
                         self.result_display.setText(f"📸 Screenshot captured!\n\n⚠️ No text detected. The screen might be mostly graphical or the image quality is low.")
                         
@@ -531,6 +555,16 @@ class FloatingPanel(QMainWindow):
             if event.modifiers() == Qt.KeyboardModifier.ControlModifier:
                 self.process_query()
     
+    def showEvent(self, event):
+        """Resume clipboard detection while the panel is on screen"""
+        self.detect_timer.start()
+        super().showEvent(event)
+    
+    def hideEvent(self, event):
+        """Pause clipboard detection while the panel is hidden"""
+        self.detect_timer.stop()
+        super().hideEvent(event)
+    
     # Removed focusOutEvent and check_and_hide - they were causing the window to close unexpectedly
     
     def show_panel(self):
@@ -563,13 +597,20 @@ class SynthMenuBar(rumps.App):
         
         # Initialize AI components
         self.brain = DeltaBrain()
-        self.screen_capture = ScreenCapture()
+        self._screen_capture = None  # Built on first screen analysis
         
         # Simple menu - just the input option
         self.menu = [
             rumps.MenuItem("Ask Synth...", callback=self.ask_inline, key="s")
         ]
     
+    @property
+    def screen_capture(self):
+        """Screen grabber, created the first time a capture is requested"""
+        if self._screen_capture is None:
+            self._screen_capture = ScreenCapture()
+        return self._screen_capture
+    
     def ask_inline(self, _=None):
         """Show inline text input window - Siri style"""
         # Create simple dialog window
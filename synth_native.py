@@ -15,16 +15,54 @@ import subprocess
 import threading
 import time
 import atexit
+import functools
+import hashlib
+import io
+import logging
 import os
 import re
+import shutil
+import errno
+import select
+import selectors
 import signal
+import socket
+import ctypes
+import ctypes.util
+import json
+import traceback
+from collections import OrderedDict
+from datetime import datetime
+import psutil
+from concurrent.futures import ThreadPoolExecutor
 from AppKit import (NSApplication, NSStatusBar, NSMenu, NSMenuItem,
                     NSTextField, NSButton, NSView, NSColor, NSFont,
                     NSNotificationCenter, NSUserNotification, NSUserNotificationCenter,
                     NSTextView, NSScrollView, NSPasteboard, NSApp, NSBox, NSPanel,
                     NSWindowStyleMaskBorderless, NSWindowStyleMaskNonactivatingPanel,
-                    NSBackingStoreBuffered, NSStatusWindowLevel)
-from Foundation import NSObject, NSMakeRect, NSMakeSize, NSPoint
+                    NSBackingStoreBuffered, NSStatusWindowLevel,
+                    NSVisualEffectView, NSVisualEffectBlendingModeBehindWindow,
+                    NSVisualEffectMaterialHUDWindow, NSPasteboardTypeString,
+                    NSScreen, NSApplicationDidChangeScreenParametersNotification,
+                    NSWindowDidResignKeyNotification, NSTextStorageDidProcessEditingNotification,
+                    NSForegroundColorAttributeName, NSFontAttributeName, NSWorkspace)
+try:
+    from AppKit import NSEventModifierFlagCommand
+except ImportError:  # older PyObjC without the 10.12+ constant name
+    NSEventModifierFlagCommand = 1 << 20
+try:
+    from AppKit import NSPasteboardDidChangeNotification
+except ImportError:  # not exposed by this macOS/PyObjC - clipboard monitor polls instead
+    NSPasteboardDidChangeNotification = None
+try:
+    from Quartz import (CGEventCreateKeyboardEvent, CGEventSetFlags, CGEventPost,
+                        kCGEventFlagMaskCommand, kCGHIDEventTap)
+    HAS_QUARTZ = True
+except ImportError:  # no Quartz bindings - capture_selected_text uses the AppleScript copy
+    HAS_QUARTZ = False
+from Foundation import (NSObject, NSMakeRect, NSMakeSize, NSPoint, NSAttributedString, NSString,
+                        NSTimer, NSRunLoop, NSRunLoopCommonModes, NSIntersectsRect,
+                        NSAppleScript)
 import objc
 from typing import Any, cast
 from src.brain.tools_gemini import web_search_tavily
@@ -44,11 +82,273 @@ NSView: Any = NSView
 NSColor: Any = NSColor
 NSFont: Any = NSFont
 NSPasteboard: Any = NSPasteboard
+NSWorkspace: Any = NSWorkspace
 NSApp: Any = NSApp
 NSPanel: Any = NSPanel
+NSAttributedString: Any = NSAttributedString
+NSTimer: Any = NSTimer
+NSRunLoop: Any = NSRunLoop
+NSVisualEffectView: Any = NSVisualEffectView
+NSScreen: Any = NSScreen
+NSAppleScript: Any = NSAppleScript
 NSUserNotification: Any = NSUserNotification
 NSUserNotificationCenter: Any = NSUserNotificationCenter
 
+# Quiet period after the last edit before on_text_change_callback fires
+_TEXT_CHANGE_DEBOUNCE = 0.06
+
+# Background result updates are coalesced and drawn at most this often
+_RESULT_DRAIN_INTERVAL = 0.05
+# Streamed answers: the first token is drawn at once, then each batch is
+# _STREAM_BATCH_GROWTH times larger (in tokens) up to _STREAM_MAX_BATCH
+_STREAM_MIN_BATCH = 1
+_STREAM_BATCH_GROWTH = 3
+_STREAM_MAX_BATCH = 50
+
+# Text colors shared by the input views, created once instead of per keystroke
+_ACTIVE_COLOR = NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95)
+_PLACEHOLDER_COLOR = NSColor.colorWithRed_green_blue_alpha_(0.5, 0.5, 0.55, 0.7)
+
+# SynthPanel chrome, computed once rather than on every panel creation
+_PANEL_BG_COLOR = NSColor.colorWithRed_green_blue_alpha_(0.12, 0.12, 0.15, 0.92)
+_SHADOW_COLOR = NSColor.blackColor().CGColor()
+_BORDER_COLOR = NSColor.colorWithRed_green_blue_alpha_(0.3, 0.6, 1.0, 0.5).CGColor()
+
+# create_input_view / create_styled_button chrome, shared by every panel build
+_COLOR_GLASS_BG = NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.94)
+_CG_GLASS_BG = _COLOR_GLASS_BG.CGColor()
+_COLOR_FIELD_BG = NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.88)
+_COLOR_RESULT_BORDER = NSColor.colorWithRed_green_blue_alpha_(0.3, 0.3, 0.35, 0.4)
+_COLOR_ACCENT = NSColor.colorWithRed_green_blue_alpha_(0.3, 0.7, 1.0, 1.0)
+_COLOR_FOCUS_BORDER = NSColor.colorWithRed_green_blue_alpha_(0.3, 0.7, 1.0, 0.9)
+_CG_FOCUS_BORDER = _COLOR_FOCUS_BORDER.CGColor()
+_CG_BUTTON_BLUE = NSColor.colorWithRed_green_blue_alpha_(0.25, 0.55, 1.0, 0.85).CGColor()
+_CG_BUTTON_GRAY = NSColor.colorWithRed_green_blue_alpha_(0.2, 0.2, 0.22, 0.6).CGColor()
+_FONT_RESULT = NSFont.systemFontOfSize_(13)
+_FONT_INPUT = NSFont.systemFontOfSize_(14)
+_FONT_BUTTON = NSFont.systemFontOfSize_weight_(13, 0.5)
+_FONT_RESULT_MONO = NSFont.monospacedSystemFontOfSize_weight_(12, 0)
+_COLOR_CHAT_BG = NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.92)
+_CG_CHAT_BG = _COLOR_CHAT_BG.CGColor()
+_CG_FIELD_BG = _COLOR_FIELD_BG.CGColor()
+_COLOR_PLACEHOLDER_DIM = NSColor.colorWithRed_green_blue_alpha_(0.5, 0.5, 0.55, 0.6)
+
+# The shared general pasteboard; every copy/paste/monitor path reuses this handle
+_PASTEBOARD = NSPasteboard.generalPasteboard()
+_PLAINTEXT_PBOARD_TYPES = frozenset(("public.utf8-plain-text", "public.plain-text", "NSStringPboardType"))
+
+
+def _bind_change_count():
+    """Return a zero-arg callable for _PASTEBOARD's changeCount.
+
+    Sends the message with a raw objc_msgSend through ctypes so the hot
+    polling path skips PyObjC's per-call marshalling; falls back to the
+    bound PyObjC method if libobjc can't be loaded.
+    """
+    try:
+        libobjc = ctypes.CDLL(ctypes.util.find_library("objc"))
+        libobjc.sel_registerName.restype = ctypes.c_void_p
+        libobjc.sel_registerName.argtypes = [ctypes.c_char_p]
+        msg_send = libobjc.objc_msgSend
+        msg_send.restype = ctypes.c_long
+        msg_send.argtypes = [ctypes.c_void_p, ctypes.c_void_p]
+        pasteboard_ptr = objc.pyobjc_id(_PASTEBOARD)  # _PASTEBOARD lives for the whole process
+        sel_change_count = libobjc.sel_registerName(b"changeCount")
+        return functools.partial(msg_send, pasteboard_ptr, sel_change_count)
+    except Exception:
+        return _PASTEBOARD.changeCount
+
+
+_pasteboard_change_count = _bind_change_count()
+
+# Ask queries run on pooled workers instead of a fresh thread per click. Two
+# workers so a superseded (uninterruptible) query can't hold up the next one.
+_ASK_EXECUTOR = ThreadPoolExecutor(max_workers=2, thread_name_prefix="synth-ask")
+# Chat turns share one worker: they run in order, so history appends never interleave
+_CHAT_EXECUTOR = ThreadPoolExecutor(max_workers=1, thread_name_prefix="synth-chat")
+# Agent / Ask-with-context / Screen requests: reused workers instead of a
+# fresh thread per click; extra clicks queue rather than piling up threads
+_BG_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="synth-bg")
+# Independent I/O for one query (web searches, the local RAG lookup) runs side by side
+_IO_EXECUTOR = ThreadPoolExecutor(max_workers=8, thread_name_prefix="synth-io")
+
+# Messages kept in the on-screen chat transcript
+_CHAT_DISPLAY_LIMIT = 20
+_RESULT_TEXT_ATTRS = {NSFontAttributeName: _FONT_RESULT_MONO,
+                      NSForegroundColorAttributeName: _ACTIVE_COLOR}
+
+
+def _utf16_len(text):
+    """Length of text in NSString units (emoji count as two), for text-storage ranges"""
+    return len(text.encode("utf-16-le")) // 2
+
+
+def _chat_block(msg):
+    """Transcript text for one ChatMessage"""
+    speaker = "👤 You" if msg.role == 'user' else "🤖 Synth"
+    return f"[{msg.time_str}] {speaker}:\n{msg.content}\n\n"
+
+
+# needs_web_search: keywords that ALWAYS trigger web search (plain substring
+# match on the lowercased query)
+_SEARCH_KEYWORDS = frozenset((
+    'latest', 'recent', 'current', 'news', 'today', 'yesterday',
+    'election', 'politics', 'score', 'weather', 'stock',
+    'what is', 'who is', 'when did', 'where is', 'how to',
+    'tell me about', 'information about', 'details about',
+    'research', 'find', 'search', 'explain', 'define',
+    'what are', 'what does', 'why is', 'why did'
+))
+# One linear pass over the query whatever the keyword count: an Aho-Corasick
+# automaton when pyahocorasick is installed, else a single alternation regex
+try:
+    import ahocorasick
+    _SEARCH_KW_AC = ahocorasick.Automaton()
+    for _kw in _SEARCH_KEYWORDS:
+        _SEARCH_KW_AC.add_word(_kw, _kw)
+    _SEARCH_KW_AC.make_automaton()
+    _SEARCH_KW_RE = None
+except ImportError:
+    _SEARCH_KW_AC = None
+    _SEARCH_KW_RE = re.compile("|".join(map(re.escape, sorted(_SEARCH_KEYWORDS))))
+# A whitespace-delimited word holding both a capital and a hyphen/digit,
+# e.g. "ML-KEM", "FIPS-203", "GPT4"
+_ACRONYM_RE = re.compile(r"(?<!\S)(?=\S*[-0-9])\S*[A-Z]")
+
+
+@functools.lru_cache(maxsize=512)
+def _needs_web_search(query: str) -> bool:
+    """
+    Determine if a query needs web search (RAG)
+    
+    Returns True for:
+    - Current events, news, elections
+    - "What is", "Who is", "When did", "Explain"
+    - Recent/latest information
+    - Technical concepts, acronyms, standards
+    """
+    # Keywords that ALWAYS trigger web search
+    query_lower = query.lower()
+    if (next(_SEARCH_KW_AC.iter(query_lower), None) if _SEARCH_KW_AC is not None
+            else _SEARCH_KW_RE.search(query_lower)):
+        return True
+    
+    # Check for technical indicators: acronyms, standards, year+technical term
+    # e.g., "ML-KEM", "FIPS 203", "2024 NIST"
+    if _ACRONYM_RE.search(query):
+        return True
+    
+    # Long specific questions likely need research
+    if '?' in query and len(query.split()) >= 8:
+        return True
+        
+    return False
+
+
+# process_query_with_context: search-term extraction from query + clipboard
+_WHAT_IS_RE = re.compile(r'what\s+is\s+([A-Z0-9\s\-]+?)(?:\?|$|in)', re.IGNORECASE)
+_EXPLAIN_RE = re.compile(r'explain\s+([A-Z0-9\s\-]+?)(?:\?|$|in)', re.IGNORECASE)
+_CLIP_ACRONYM_RE = re.compile(r'\b[A-Z][A-Z0-9\-]{2,15}\b')  # BAKE, NIST, ML-KEM
+_CLIP_STANDARD_RE = re.compile(r'\b[A-Z]+\s+\d{2,5}\b')  # FIPS 203, ISO 27001
+
+
+def _stable_order_key(text):
+    """Content-hash sort key: the same sources always land in the same prompt order"""
+    return hashlib.blake2b((text or "").encode(), digest_size=8).digest()
+
+
+@functools.lru_cache(maxsize=64)
+def _extract_terms(query: str, selected_text: str):
+    """Return (query_terms, clipboard_acronyms, clipboard_standards) as tuples"""
+    # A. Extract specific terms from query (e.g., "what is FIPS 203")
+    query_terms = tuple(m.group(1).strip() for m in (_WHAT_IS_RE.search(query),
+                                                     _EXPLAIN_RE.search(query)) if m)
+    # B. Extract technical terms from clipboard (sorted: set order varies per run)
+    acronyms = tuple(sorted(set(_CLIP_ACRONYM_RE.findall(selected_text))))
+    standards = tuple(sorted(set(_CLIP_STANDARD_RE.findall(selected_text))))
+    return query_terms, acronyms, standards
+
+
+# Prompt context is capped in tokens, not characters: code and non-English
+# text pack far more tokens per character than prose
+_TOKEN_ENC = None  # tiktoken encoding, set by _load_token_encoder once ready
+_CHARS_PER_TOKEN = 3  # conservative estimate until (or unless) tiktoken is ready
+
+
+def _load_token_encoder():
+    """Load tiktoken's cl100k_base encoding (downloads the BPE file on a cold cache)"""
+    global _TOKEN_ENC
+    try:
+        import tiktoken
+        _TOKEN_ENC = tiktoken.get_encoding("cl100k_base")
+    except Exception:  # not installed, or the encoding file can't be fetched offline
+        pass
+
+
+# Off the launch path: the download has no timeout and must not delay the menu
+# bar. A daemon thread rather than _IO_EXECUTOR, whose workers are joined at
+# interpreter exit - a hung download would otherwise block quitting.
+threading.Thread(target=_load_token_encoder, name="synth-tiktoken", daemon=True).start()
+_CLIPBOARD_TOKENS = 1200
+_SELECTION_TOKENS = 800
+_SELECTION_ONLY_TOKENS = 1200  # selection is the whole context, no web results
+_SCREEN_TOKENS = 1800
+
+
+def _token_prefix_chars(max_tokens):
+    """Characters of input _truncate_tokens(text, max_tokens) can keep, at most"""
+    return max_tokens * (8 if _TOKEN_ENC is not None else _CHARS_PER_TOKEN)
+
+
+def _truncate_tokens(text, max_tokens):
+    """Cut text to at most max_tokens tokens"""
+    if not text or len(text) <= max_tokens:  # every token covers at least one char
+        return text
+    if _TOKEN_ENC is None:
+        return text[:_token_prefix_chars(max_tokens)]
+    # Only tokenize a generous prefix - a multi-MB clipboard would otherwise
+    # be encoded in full just to keep its first few thousand characters
+    prefix = text[:_token_prefix_chars(max_tokens)]
+    ids = _TOKEN_ENC.encode(prefix, disallowed_special=())
+    return _TOKEN_ENC.decode(ids[:max_tokens]) if len(ids) > max_tokens else prefix
+
+
+# Screen button prompt: the fixed instructions lead, so every screen analysis
+# shares a byte-identical prefix the model's prompt/KV cache can reuse
+_SCREEN_PROMPT_PREFIX = """Instructions:
+1. The user wants help with what's VISIBLE on their screen
+2. If they ask to "explain" or "summarize": Focus on the screen content
+3. If they ask to "draft reply": Use names/context from screen
+4. Answer their request using the screen content as primary source
+5. Keep it natural and helpful
+6. Answer in ENGLISH ONLY - no other languages"""
+
+# Screen button: OCR text of recent screenshots keyed by a digest of their
+# pixels, so asking again about an unchanged screen skips Tesseract
+_OCR_CACHE_SIZE = 32
+_ocr_cache = OrderedDict()
+_ocr_cache_lock = threading.Lock()
+
+
+def _ocr_cached(img, ocr):
+    """Return ocr(img), reusing the text of an identical recent screenshot"""
+    key = hashlib.blake2b(img.tobytes(), digest_size=16).digest()
+    with _ocr_cache_lock:
+        text = _ocr_cache.get(key)
+        if text is not None:
+            _ocr_cache.move_to_end(key)
+            return text
+    text = ocr(img)
+    with _ocr_cache_lock:
+        _ocr_cache[key] = text
+        while len(_ocr_cache) > _OCR_CACHE_SIZE:
+            _ocr_cache.popitem(last=False)
+    return text
+
+
+# UI event chatter goes to debug (formatted only if enabled); problems to warning
+logger = logging.getLogger(__name__)
+
 # Add project paths
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
@@ -59,7 +359,31 @@ from src.plugins.plugin_manager import PluginManager
 from src.plugins.base_plugin import PluginContext
 from src.rag.web_search import WebSearchRAG
 from src.rag.local_rag import SynthRAG
+from src.rag.response_cache import ResponseCache
 from src.ui.chat_manager import ChatManager
+from src.brain.agent_modes import ask_mode_agent
+from src.brain.decision_router import route_agent_query
+try:
+    from src.brain.agent_core import execute_autonomous, select_tools
+    _AGENT_IMPORT_ERROR = None
+except (ImportError, ValueError) as exc:  # e.g. GEMINI_API_KEY missing from .env
+    execute_autonomous = select_tools = None
+    _AGENT_IMPORT_ERROR = str(exc)
+try:
+    from utils.ask_button_logger import get_logger
+except ImportError:  # optional Ask-session logger; handleQuery_ reports it if missing
+    get_logger = None
+# Tesseract's OpenMP fan-out slows single-image OCR; must be set before it loads
+# (also inherited by pytesseract's tesseract subprocess)
+os.environ.setdefault("OMP_THREAD_LIMIT", "1")
+try:
+    from tesserocr import PyTessBaseAPI, PSM, RIL
+except ImportError:  # optional in-process OCR; _ocr_text falls back to pytesseract
+    PyTessBaseAPI = None
+try:
+    import pytesseract
+except ImportError:  # capture_and_analyze reports that OCR is unavailable
+    pytesseract = None
 
 
 # ============================================================================
@@ -70,6 +394,153 @@ from src.ui.chat_manager import ChatManager
 ssh_tunnel_process = None
 ssh_connection_id = None  # Store SSH username@host for cleanup
 control_socket_path = None  # Full path to the ssh ControlPath socket
+_tunnel_thread = None  # Background thread running start_ssh_tunnel
+_tunnel_shutdown = threading.Event()  # Set by cleanup to abort an in-flight start
+_cleanup_done = False  # cleanup_tunnel already ran (quit fires it from several hooks)
+_cleanup_lock = threading.RLock()  # re-entrant: a signal can land while the main thread holds it
+
+TUNNEL_PORTS = (11434, 11435, 11436)  # Fast / Balanced / Smart model ports
+
+
+def _wait_for_ports(ports, timeout=6.0, connect_timeout=0.2, stop_event=None):
+    """
+    Wait until every localhost port in `ports` accepts TCP connections.
+
+    Each round issues all connects at once as non-blocking sockets and waits
+    on a single selector (kqueue on macOS) for them to become writable; ports
+    that refuse are retried with exponential backoff until `timeout` expires.
+
+    Returns:
+        True if all ports answered before the deadline, False otherwise
+        (including when `stop_event` is set while waiting)
+    """
+    deadline = time.monotonic() + timeout
+    pending = set(ports)
+    backoff = 0.025
+
+    while True:
+        sel = selectors.DefaultSelector()
+        socks = []
+        try:
+            for port in pending:
+                sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                sock.setblocking(False)
+                socks.append(sock)
+                rc = sock.connect_ex(("127.0.0.1", port))
+                # Refused connects fail immediately and are retried next round
+                if rc in (0, errno.EINPROGRESS, errno.EWOULDBLOCK):
+                    sel.register(sock, selectors.EVENT_WRITE, port)
+
+            round_deadline = min(deadline, time.monotonic() + connect_timeout)
+            while sel.get_map():
+                remaining = round_deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in sel.select(remaining):
+                    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        pending.discard(key.data)
+                    sel.unregister(key.fileobj)
+        finally:
+            sel.close()
+            for sock in socks:
+                sock.close()
+
+        if not pending:
+            return True
+        now = time.monotonic()
+        if now >= deadline:
+            return False
+
+        # exponential backoff and retry the ports that are still closed
+        delay = min(backoff, deadline - now)
+        if stop_event is not None:
+            if stop_event.wait(delay):
+                return False
+        else:
+            time.sleep(delay)
+        backoff = min(backoff * 2, 0.5)
+
+
+@functools.lru_cache(maxsize=None)
+def _tunnel_pattern(ssh_id):
+    """Compiled command-line pattern matching our ssh tunnel (scoped to the host when known)"""
+    if ssh_id and '@' in ssh_id:
+        return re.compile(r"ssh.*11434.*" + re.escape(ssh_id.split('@')[1]))
+    return re.compile(r"ssh.*11434")
+
+
+def _matching_ssh_pids(pattern):
+    """PIDs of processes whose full command line matches `pattern` (in-process pgrep -f)"""
+    own_pid = os.getpid()
+    pids = []
+    for proc in psutil.process_iter(['pid', 'cmdline']):
+        cmdline = proc.info['cmdline']
+        if cmdline and proc.info['pid'] != own_pid and pattern.search(' '.join(cmdline)):
+            pids.append(proc.info['pid'])
+    return pids
+
+
+@functools.lru_cache(maxsize=1)
+def _ssh_creds():
+    """Read (SSH_ID, SSH_PASSWD) from .env once; tunnel restarts reuse the result"""
+    from dotenv import load_dotenv
+    load_dotenv()
+    return os.getenv('SSH_ID'), os.getenv('SSH_PASSWD')
+
+
+@functools.lru_cache(maxsize=1)
+def _which_sshpass():
+    """Path to sshpass on $PATH (or None), resolved in-process once"""
+    return shutil.which("sshpass")
+
+
+@functools.lru_cache(maxsize=None)
+def _control_socket_for(ssh_id):
+    """Fixed per-host ControlPath, shared by every launch so a persisted master is found again"""
+    digest = hashlib.blake2b(ssh_id.encode(), digest_size=6).hexdigest()
+    return os.path.expanduser(f"~/.ssh/synth-tunnel-{digest}")
+
+
+def _tunnel_forward_args():
+    """-L arguments for every tunnelled model port"""
+    return [arg for port in TUNNEL_PORTS for arg in ("-L", f"{port}:localhost:{port}")]
+
+
+def _control_master_alive(ssh_id):
+    """Return True if an ssh control master is already listening on our ControlPath"""
+    try:
+        result = subprocess.run(
+            ["ssh", "-O", "check", "-o", f"ControlPath={_control_socket_for(ssh_id)}", ssh_id],
+            capture_output=True,
+            timeout=2
+        )
+        return result.returncode == 0
+    except Exception:
+        return False
+
+
+def _control_master_command(ssh_id, command):
+    """Send a control command (forward/cancel) for our model ports to the master"""
+    return subprocess.run(
+        ["ssh", "-O", command, "-o", f"ControlPath={_control_socket_for(ssh_id)}",
+         *_tunnel_forward_args(), ssh_id],
+        capture_output=True,
+        timeout=5
+    )
+
+
+def _report_tunnel_status(ports_ok):
+    """Print the final tunnel readiness banner"""
+    if ports_ok:
+        logger.info("✅ DELTA BRAIN TUNNEL ESTABLISHED")
+        logger.info("   Fast (3B):     localhost:11434")
+        logger.info("   Balanced (7B): localhost:11435")
+        logger.info("   Smart (14B):   localhost:11436")
+    else:
+        logger.warning("⚠️  Ports not responding after wait - tunnel is running but remote services may be down")
+        logger.warning("   Brain may fall back to Gemini until Delta becomes available")
+    
+
 
 def start_ssh_tunnel():
     """
@@ -87,50 +558,51 @@ def start_ssh_tunnel():
     """
     global ssh_tunnel_process, ssh_connection_id
     
-    # Load credentials from .env
-    from dotenv import load_dotenv
-    load_dotenv()
-    
-    ssh_id = os.getenv('SSH_ID')
-    ssh_passwd = os.getenv('SSH_PASSWD')
+    # Load credentials from .env (parsed once per process)
+    ssh_id, ssh_passwd = _ssh_creds()
     
     if not ssh_id or not ssh_passwd:
-        print("❌ SSH credentials not found in .env file")
-        print("   Required: SSH_ID and SSH_PASSWD")
-        print("   App will continue with Gemini fallback only")
+        logger.error("❌ SSH credentials not found in .env file")
+        logger.error("   Required: SSH_ID and SSH_PASSWD")
+        logger.error("   App will continue with Gemini fallback only")
         return
     
     ssh_connection_id = ssh_id  # Store for cleanup
-    # Use an absolute control socket path (avoid ~ expansion problems)
+    # Absolute, per-host control socket path: every app launch targeting the
+    # same host shares one persistent master, and Python can check the file
     global control_socket_path
-    control_socket_path = os.path.expanduser(f"~/.ssh/synth-tunnel-{os.getpid()}")
+    control_socket_path = _control_socket_for(ssh_id)
     
-    print("\n" + "="*60)
-    print("🔌 STARTING DELTA BRAIN SSH TUNNEL")
-    print("="*60)
-    print(f"   Using credentials from .env: {ssh_id.split('@')[0]}@***")
+    logger.info("🔌 STARTING DELTA BRAIN SSH TUNNEL")
+    logger.info("   Using credentials from .env: %s@***", ssh_id.split('@')[0])
+    
+    # Reuse a still-running control master (ControlPersist) instead of paying
+    # for a fresh TCP + key exchange + auth handshake. Checked before the
+    # process scan: the persisted master's command line matches that pattern.
+    if _control_master_alive(ssh_id):
+        logger.info("♻️  Reusing existing SSH control master - skipping new handshake")
+        try:
+            _control_master_command(ssh_id, "forward")
+        except Exception as e:
+            logger.warning("⚠️  Could not request port forwards on existing master: %s", e)
+        _report_tunnel_status(_wait_for_ports(TUNNEL_PORTS, timeout=6.0, stop_event=_tunnel_shutdown))
+        return
     
     # Check if tunnel already exists
     try:
-        result = subprocess.run(
-            ["pgrep", "-f", f"ssh.*11434.*{ssh_id.split('@')[1]}"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
-            print("⚠️  SSH tunnel already running (PID: {})".format(result.stdout.strip()))
-            print("   Skipping tunnel creation...")
+        existing_pids = _matching_ssh_pids(_tunnel_pattern(ssh_id))
+        if existing_pids:
+            logger.warning("⚠️  SSH tunnel already running (PID: %s)", " ".join(map(str, existing_pids)))
+            logger.warning("   Skipping tunnel creation...")
             return
     except Exception:
         pass
     
     # Check if sshpass is installed
-    try:
-        subprocess.run(["which", "sshpass"], capture_output=True, check=True)
-    except subprocess.CalledProcessError:
-        print("❌ sshpass not installed - required for automated SSH")
-        print("   Install: brew install sshpass")
-        print("   App will continue with Gemini fallback only")
+    if _which_sshpass() is None:
+        logger.error("❌ sshpass not installed - required for automated SSH")
+        logger.error("   Install: brew install sshpass")
+        logger.error("   App will continue with Gemini fallback only")
         return
     
     # SSH command with sshpass for non-interactive authentication
@@ -143,82 +615,129 @@ def start_ssh_tunnel():
         "-o", "ServerAliveInterval=30",     # Keep connection alive
         "-o", "ServerAliveCountMax=3",      # Retry 3 times
         "-o", "ControlMaster=auto",         # Enable control socket
-        "-o", f"ControlPath={control_socket_path}",  # Unique socket per app instance (absolute path)
-        "-L", "11434:localhost:11434",     # Fast model (3B)
-        "-L", "11435:localhost:11435",     # Balanced model (7B)
-        "-L", "11436:localhost:11436",     # Smart model (14B)
+        "-o", f"ControlPath={control_socket_path}",  # Per-host socket shared across launches (absolute path)
+        "-o", "ControlPersist=10m",         # Keep master alive for warm reconnects
+        *_tunnel_forward_args(),           # Fast (3B) / Balanced (7B) / Smart (14B) model ports
         ssh_id
     ]
     
+    if _tunnel_shutdown.is_set():
+        logger.warning("⚠️  App is shutting down - tunnel launch cancelled")
+        return
+    
     try:
-        print("📡 Launching SSH tunnel with sshpass...")
-        print(f"   Target: {ssh_id}")
+        logger.info("📡 Launching SSH tunnel with sshpass...")
+        logger.info("   Target: %s", ssh_id)
         
         # Start SSH process in background
         ssh_tunnel_process = subprocess.Popen(
             ssh_command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            preexec_fn=os.setsid  # Create new process group for clean shutdown
+            # Nothing reads these pipes; DEVNULL keeps a long-lived ssh from
+            # blocking once ~64KB of keepalive/diagnostic output fills a PIPE
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True  # New session/process group (PGID == PID) for clean shutdown
         )
         
-        print(f"✅ SSH tunnel started (PID: {ssh_tunnel_process.pid})")
-        print("   Waiting for connection to establish and verifying forwarded ports...")
+        logger.info("✅ SSH tunnel started (PID: %s)", ssh_tunnel_process.pid)
+        logger.info("   Waiting for connection to establish and verifying forwarded ports...")
 
         # Wait / retry for ports to become available (tunnel may be up before remote services)
-        ports_ok = False
-        max_attempts = 12  # up to ~12 * 0.5s = 6s total wait
-        for attempt in range(max_attempts):
-            all_ok = True
-            for port in [11434, 11435, 11436]:
-                try:
-                    result = subprocess.run(
-                        ["nc", "-z", "localhost", str(port)],
-                        capture_output=True,
-                        timeout=1
-                    )
-                    if result.returncode != 0:
-                        all_ok = False
-                        break
-                except Exception:
-                    all_ok = False
-                    break
-
-            if all_ok:
-                ports_ok = True
-                break
-
-            # short backoff and retry
-            time.sleep(0.5)
+        ports_ok = _wait_for_ports(TUNNEL_PORTS, timeout=6.0, stop_event=_tunnel_shutdown)
 
         # Report final status
-        if ports_ok:
-            print("\n✅ DELTA BRAIN TUNNEL ESTABLISHED")
-            print("   Fast (3B):     localhost:11434")
-            print("   Balanced (7B): localhost:11435")
-            print("   Smart (14B):   localhost:11436")
-        else:
-            print("\n⚠️  Ports not responding after wait - tunnel is running but remote services may be down")
-            print("   Brain may fall back to Gemini until Delta becomes available")
-        
-        print("="*60 + "\n")
+        _report_tunnel_status(ports_ok)
         
     except Exception as e:
-        print(f"❌ Failed to start SSH tunnel: {e}")
-        print("   App will continue with Gemini fallback only")
+        logger.error("❌ Failed to start SSH tunnel: %s", e)
+        logger.error("   App will continue with Gemini fallback only")
         ssh_tunnel_process = None
 
 
+def _wait_for_exit(proc, timeout):
+    """
+    Block until `proc` exits or `timeout` seconds pass, without polling.
+
+    Uses a kqueue EVFILT_PROC/NOTE_EXIT event on macOS/BSD and a pidfd on
+    Linux so the wait is a single kernel event; other platforms fall back to
+    Popen.wait(). The child is reaped through the Popen handle on exit.
+
+    Returns:
+        True if the process exited, False if the timeout expired
+    """
+    pid = proc.pid
+    try:
+        if hasattr(select, "kqueue"):
+            kq = select.kqueue()
+            try:
+                kev = select.kevent(
+                    pid,
+                    filter=select.KQ_FILTER_PROC,
+                    flags=select.KQ_EV_ADD | select.KQ_EV_ENABLE | select.KQ_EV_ONESHOT,
+                    fflags=select.KQ_NOTE_EXIT,
+                )
+                exited = bool(kq.control([kev], 1, timeout))
+            finally:
+                kq.close()
+        elif hasattr(os, "pidfd_open"):
+            pidfd = os.pidfd_open(pid)
+            try:
+                exited = bool(select.select([pidfd], [], [], timeout)[0])
+            finally:
+                os.close(pidfd)
+        else:
+            proc.wait(timeout=timeout)
+            return True
+    except ProcessLookupError:
+        exited = True  # already gone before we could register for the event
+    except subprocess.TimeoutExpired:
+        return False
+
+    if exited:
+        proc.wait()
+    return exited
+
+
+def start_ssh_tunnel_async():
+    """
+    Run start_ssh_tunnel on a background thread so the menu bar appears
+    immediately instead of waiting out the ssh launch and port checks.
+    cleanup_tunnel cancels and joins this thread before tearing down.
+    """
+    global _tunnel_thread, _cleanup_done
+    _tunnel_shutdown.clear()
+    with _cleanup_lock:
+        _cleanup_done = False
+    _tunnel_thread = threading.Thread(target=start_ssh_tunnel, name="ssh-tunnel", daemon=True)
+    _tunnel_thread.start()
+    return _tunnel_thread
+
+
 def cleanup_tunnel():
     """
     Clean up SSH tunnel on app exit - BOTH on Mac AND Delta
     
-    This ensures:
+    If the control master is alive, only its port forwards are cancelled: the
+    master stays up for ControlPersist so the next launch skips the handshake.
+    Otherwise this ensures:
     1. Local SSH process is killed (Mac side) - INCLUDING sshpass parent
-    2. Remote control socket is cleaned up (Delta side)
-    3. No orphaned processes remain on either system
+    2. No orphaned processes remain
+    3. A stale local control socket file is removed
+    
+    Runs once: quitting reaches it from applicationWillTerminate_, the signal
+    handler and atexit, and later calls return immediately.
     """
-    global ssh_tunnel_process, ssh_connection_id
+    global ssh_tunnel_process, ssh_connection_id, _cleanup_done
+    
+    with _cleanup_lock:
+        if _cleanup_done:
+            return
+        _cleanup_done = True
+    
+    # Stop an in-flight start first so it cannot launch ssh after we clean up
+    _tunnel_shutdown.set()
+    if _tunnel_thread is not None and _tunnel_thread is not threading.current_thread():
+        _tunnel_thread.join(timeout=10)
     
     # If we have no reference to the SSH process but a control socket exists,
     # still attempt cleanup (covers edge cases where start detected an
@@ -227,130 +746,100 @@ def cleanup_tunnel():
     if ssh_tunnel_process is None and not control_socket_path:
         return
     
-    print("\n" + "="*60)
-    print("🔌 CLEANING UP DELTA BRAIN SSH TUNNEL")
-    print("="*60)
+    logger.info("🔌 CLEANING UP DELTA BRAIN SSH TUNNEL")
+    
+    # Persisted master: free the local model ports and leave it for the next launch
+    if ssh_connection_id and _control_master_alive(ssh_connection_id):
+        try:
+            _control_master_command(ssh_connection_id, "cancel")
+            logger.info("✅ Port forwards cancelled - SSH control master kept for the next launch")
+        except Exception as e:
+            logger.warning("⚠️  Could not cancel port forwards: %s", e)
+        # Our ssh is a -N mux client of the backgrounded master (which left its
+        # process group); end it so it doesn't outlive the app or hold the
+        # master's session open past ControlPersist
+        if ssh_tunnel_process:
+            try:
+                os.killpg(ssh_tunnel_process.pid, signal.SIGTERM)
+                if not _wait_for_exit(ssh_tunnel_process, timeout=3):
+                    os.killpg(ssh_tunnel_process.pid, signal.SIGKILL)
+                    ssh_tunnel_process.wait()
+            except ProcessLookupError:
+                pass
+            except Exception as e:
+                logger.warning("⚠️  Could not stop the tunnel client: %s", e)
+        ssh_tunnel_process = None
+        ssh_connection_id = None
+        control_socket_path = None
+        return
     
     # STEP 1: Kill ALL SSH tunnels to Delta (in case sshpass creates orphans)
     try:
-        print("📡 Killing all SSH tunnels related to this connection (including orphaned processes)...")
+        logger.debug("📡 Killing all SSH tunnels related to this connection (including orphaned processes)...")
         # Prefer using the actual host from SSH_ID when available
-        host_part = None
-        try:
-            if ssh_connection_id and '@' in ssh_connection_id:
-                host_part = ssh_connection_id.split('@')[1]
-        except:
-            host_part = None
+        tunnel_pattern = _tunnel_pattern(ssh_connection_id)
 
-        if host_part:
-            pkill_pattern = f"ssh.*11434.*{host_part}"
-        else:
-            pkill_pattern = "ssh.*11434"
-
-        # Use pkill to ensure we get ALL related processes
-        subprocess.run(
-            ["pkill", "-f", pkill_pattern],
-            capture_output=True,
-            timeout=5
-        )
-        print("✅ pkill executed (if any matching SSH processes existed)")
-    except subprocess.TimeoutExpired:
-        print("⚠️  Process cleanup timed out")
+        # One in-process scan finds ALL related processes
+        for pid in _matching_ssh_pids(tunnel_pattern):
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except (ProcessLookupError, PermissionError):
+                pass
+        logger.debug("✅ SIGTERM sent (if any matching SSH processes existed)")
     except Exception as e:
-        print(f"⚠️  pkill error: {e}")
-    
-    # STEP 2: Clean up remote control socket (Delta side)
-    if ssh_connection_id:
-        try:
-            print("📡 Cleaning up remote control socket (if present) using ssh -O exit...")
-            # Use the same control socket path we created (absolute path)
-            if control_socket_path:
-                control_path_arg = control_socket_path
-            else:
-                # Fallback to previous behavior (may be incorrect if PIDs differ)
-                control_path_arg = os.path.expanduser(f"~/.ssh/synth-tunnel-{ssh_tunnel_process.pid if ssh_tunnel_process else 'unknown'}")
-
-            subprocess.run(
-                ["ssh", "-O", "exit", "-o", f"ControlPath={control_path_arg}", ssh_connection_id],
-                capture_output=True,
-                timeout=5
-            )
-            print("✅ Remote control socket cleaned up (ssh -O exit attempted)")
-        except subprocess.TimeoutExpired:
-            print("⚠️  Remote cleanup timed out (socket may already be closed)")
-        except Exception as e:
-            print(f"⚠️  Remote cleanup error: {e}")
+        logger.warning("⚠️  Process scan error: %s", e)
     
-    # STEP 3: Kill local SSH process group (backup cleanup)
+    # STEP 2: Kill local SSH process group (backup cleanup)
     try:
         # If we have a live Popen handle, try to terminate its process group
         if ssh_tunnel_process:
-            pgid = os.getpgid(ssh_tunnel_process.pid)
-            print(f"📡 Terminating process group (PID: {ssh_tunnel_process.pid}, PGID: {pgid})")
+            pgid = ssh_tunnel_process.pid  # start_new_session makes the child its own group leader
+            logger.debug("📡 Terminating process group (PID/PGID: %s)", pgid)
             os.killpg(pgid, signal.SIGTERM)
 
             # Wait for process to terminate (with timeout)
-            try:
-                ssh_tunnel_process.wait(timeout=3)
-                print("✅ Process group terminated cleanly")
-            except subprocess.TimeoutExpired:
+            if _wait_for_exit(ssh_tunnel_process, timeout=3):
+                logger.debug("✅ Process group terminated cleanly")
+            else:
                 # Force kill if graceful termination fails
-                print("⚠️  Graceful termination timed out, forcing...")
+                logger.warning("⚠️  Graceful termination timed out, forcing...")
                 os.killpg(pgid, signal.SIGKILL)
                 ssh_tunnel_process.wait()
-                print("✅ Process group force-killed")
+                logger.debug("✅ Process group force-killed")
         else:
-            print("ℹ️ No local Popen handle; pkill/ssh -O exit were used as best-effort cleanup")
+            logger.debug("ℹ️ No local Popen handle; the process scan was used as best-effort cleanup")
 
     except ProcessLookupError:
-        print("⚠️  Process group already terminated")
+        logger.debug("⚠️  Process group already terminated")
     except Exception as e:
-        print(f"⚠️  Process group cleanup error: {e}")
+        logger.warning("⚠️  Process group cleanup error: %s", e)
     
-    # STEP 4: Final verification - ensure no processes remain
+    # STEP 3: Final verification - ensure no processes remain
     try:
         # Final verification - try to find any remaining ssh processes matching our host
-        if ssh_connection_id and '@' in ssh_connection_id:
-            host_part = ssh_connection_id.split('@')[1]
-            pgrep_pattern = f"ssh.*11434.*{host_part}"
-        else:
-            pgrep_pattern = "ssh.*11434"
-
-        result = subprocess.run(
-            ["pgrep", "-f", pgrep_pattern],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            remaining_pids = [p for p in result.stdout.strip().split('\n') if p.strip()]
-            print(f"⚠️  Found {len(remaining_pids)} remaining processes, force-killing...")
+        remaining_pids = _matching_ssh_pids(_tunnel_pattern(ssh_connection_id))
+        if remaining_pids:
+            logger.warning("⚠️  Found %s remaining processes, force-killing...", len(remaining_pids))
             for pid in remaining_pids:
                 try:
-                    os.kill(int(pid), signal.SIGKILL)
-                    print(f"   ✅ Killed PID {pid}")
+                    os.kill(pid, signal.SIGKILL)
+                    logger.debug("   ✅ Killed PID %s", pid)
                 except Exception:
                     pass
         else:
-            print("✅ No remaining SSH processes found")
+            logger.debug("✅ No remaining SSH processes found")
     except Exception as e:
-        print(f"⚠️  Final verification error: {e}")
+        logger.warning("⚠️  Final verification error: %s", e)
     
-    # STEP 5: Clean up local control socket file
+    # STEP 4: Clean up a stale local control socket file (its master is gone)
     try:
-        # Remove the exact control socket path we created earlier if present
-        if control_socket_path:
-            control_path = control_socket_path
-        else:
-            control_path = os.path.expanduser(f"~/.ssh/synth-tunnel-{ssh_tunnel_process.pid if ssh_tunnel_process else 'unknown'}")
-
-        if control_path and os.path.exists(control_path):
-            os.remove(control_path)
-            print("✅ Local control socket file removed")
+        if control_socket_path and os.path.exists(control_socket_path):
+            os.remove(control_socket_path)
+            logger.debug("✅ Local control socket file removed")
     except Exception as e:
-        print(f"⚠️  Could not remove control socket: {e}")
+        logger.warning("⚠️  Could not remove control socket: %s", e)
     
-    print("✅ TUNNEL CLEANUP COMPLETE (Mac + Delta)")
-    print("="*60 + "\n")
+    logger.info("✅ TUNNEL CLEANUP COMPLETE")
     
     ssh_tunnel_process = None
     ssh_connection_id = None
@@ -360,6 +849,15 @@ def cleanup_tunnel():
 class CopyableTextView(NSTextView):
     """Custom NSTextView that properly handles copy/paste in menu bars"""
     
+    def initWithFrame_(self, frame):
+        """Initialize per-view state so hot paths can use plain attribute access"""
+        self = objc.super(CopyableTextView, self).initWithFrame_(frame)
+        if self is None:
+            return None
+        self._is_placeholder = False
+        self._pending_cb = None
+        return self
+    
     def acceptsFirstResponder(self):
         """Allow this view to become first responder"""
         return True
@@ -371,84 +869,102 @@ class CopyableTextView(NSTextView):
     
     def performKeyEquivalent_(self, event):
         """Handle keyboard shortcuts for copy/paste/cut/select all"""
+        # Plain typing never carries the Command flag - hand it straight back
+        if not (event.modifierFlags() & NSEventModifierFlagCommand):
+            return objc.super(CopyableTextView, self).performKeyEquivalent_(event)
         try:
-            modifierFlags = event.modifierFlags()
             characters = event.charactersIgnoringModifiers()
             if characters:
                 try:
                     characters = characters.lower()
                 except:
                     pass
-            # Command key mask (1 << 20)
-            if modifierFlags & (1 << 20):
-                if characters == 'c':
-                    # Prefer copying from the window first responder if it's not this view
-                    try:
-                        w = self.window()
-                        if w:
-                            fr = w.firstResponder()
-                            if fr is not None and fr is not self and hasattr(fr, 'copy_'):
-                                try:
-                                    fr.copy_(None)
-                                    return True
-                                except:
-                                    pass
-                    except Exception:
-                        pass
-                    # Fallback: copy from this view
+            handler = self._CMD_ACTIONS.get(characters)
+            if handler and handler(self):
+                return True
+        except Exception as e:
+            logger.warning("Keyboard shortcut error: %s", e)
+        # Let parent handle other shortcuts
+        return objc.super(CopyableTextView, self).performKeyEquivalent_(event)
+    
+    def _handle_copy(self):
+        """Cmd+C: prefer copying from the window first responder if it's not this view"""
+        try:
+            w = self.window()
+            if w:
+                fr = w.firstResponder()
+                if fr is not None and fr is not self and hasattr(fr, 'copy_'):
                     try:
-                        self.copy_(None)
+                        fr.copy_(None)
                         return True
                     except:
                         pass
-                elif characters == 'v':
-                    # If this view is editable, paste here; otherwise try forwarding to window first responder
-                    try:
-                        if getattr(self, 'isEditable') and self.isEditable():
-                            self.paste_(None)
-                            return True
-                        else:
-                            w = self.window()
-                            if w:
-                                fr = w.firstResponder()
-                                if fr and hasattr(fr, 'paste_'):
-                                    try:
-                                        fr.paste_(None)
-                                        return True
-                                    except:
-                                        pass
-                    except Exception:
-                        pass
-                elif characters == 'x':
-                    try:
-                        if getattr(self, 'isEditable') and self.isEditable():
-                            self.cut_(None)
+        except Exception:
+            pass
+        # Fallback: copy from this view
+        try:
+            self.copy_(None)
+            return True
+        except:
+            return False
+    
+    def _handle_paste(self):
+        """Cmd+V: paste here if editable; otherwise try forwarding to window first responder"""
+        try:
+            if self.isEditable():
+                self.paste_(None)
+                return True
+            else:
+                w = self.window()
+                if w:
+                    fr = w.firstResponder()
+                    if fr and hasattr(fr, 'paste_'):
+                        try:
+                            fr.paste_(None)
                             return True
-                    except:
-                        pass
-                elif characters == 'a':
-                    # Forward selectAll to first responder if possible
-                    try:
-                        w = self.window()
-                        if w:
-                            fr = w.firstResponder()
-                            if fr is not None and fr is not self and hasattr(fr, 'selectAll_'):
-                                try:
-                                    fr.selectAll_(None)
-                                    return True
-                                except:
-                                    pass
-                    except Exception:
-                        pass
+                        except:
+                            pass
+        except Exception:
+            pass
+        return False
+    
+    def _handle_cut(self):
+        """Cmd+X: cut from this view when editable"""
+        try:
+            if self.isEditable():
+                self.cut_(None)
+                return True
+        except:
+            pass
+        return False
+    
+    def _handle_select_all(self):
+        """Cmd+A: forward selectAll to first responder if possible"""
+        try:
+            w = self.window()
+            if w:
+                fr = w.firstResponder()
+                if fr is not None and fr is not self and hasattr(fr, 'selectAll_'):
                     try:
-                        self.selectAll_(None)
+                        fr.selectAll_(None)
                         return True
                     except:
                         pass
-        except Exception as e:
-            print(f"Keyboard shortcut error: {e}")
-        # Let parent handle other shortcuts
-        return objc.super(CopyableTextView, self).performKeyEquivalent_(event)
+        except Exception:
+            pass
+        try:
+            self.selectAll_(None)
+            return True
+        except:
+            return False
+    
+    # Cmd-key dispatch table, built once per class (plain functions taking self)
+    _CMD_ACTIONS = {
+        'c': _handle_copy,
+        'v': _handle_paste,
+        'x': _handle_cut,
+        'a': _handle_select_all,
+    }
     
     def validateUserInterfaceItem_(self, item):
         """Validate menu items like Copy, Paste, Select All"""
@@ -464,8 +980,8 @@ class CopyableTextView(NSTextView):
             text = ""
             try:
                 if selectedRange and selectedRange.length > 0:
-                    s = str(self.string())
-                    text = s[selectedRange.location:selectedRange.location + selectedRange.length]
+                    # Only bridge the selected slice, not the whole buffer
+                    text = str(self.string().substringWithRange_(selectedRange))
                 else:
                     text = str(self.string())
             except Exception:
@@ -474,13 +990,13 @@ class CopyableTextView(NSTextView):
             if not text:
                 return False
 
-            pasteboard = NSPasteboard.generalPasteboard()
+            pasteboard = _PASTEBOARD
             pasteboard.clearContents()
             pasteboard.setString_forType_(text, "public.utf8-plain-text")
 
             return True
         except Exception as e:
-            print(f"❌ Copy error: {e}")
+            logger.error("❌ Copy error: %s", e)
             import traceback
             traceback.print_exc()
             return False
@@ -489,18 +1005,16 @@ class CopyableTextView(NSTextView):
         """Handle paste in menu bar context - bypasses window responder chain"""
         try:
             # Get pasteboard directly (works in menu bars)
-            pasteboard = NSPasteboard.generalPasteboard()
-            text = pasteboard.stringForType_("public.utf8-plain-text")
-            
-            if not text:
-                # Try alternate type
-                text = pasteboard.stringForType_("NSStringPboardType")
+            pasteboard = _PASTEBOARD
+            # One read for any string flavour instead of probing type by type
+            objs = pasteboard.readObjectsForClasses_options_([NSString], None)
+            text = objs[0] if objs else None
             
             if text:
                 # Clear placeholder
-                if getattr(self, '_is_placeholder', False):
+                if self._is_placeholder:
                     self.setString_("")
-                    self.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95))
+                    self.setTextColor_(_ACTIVE_COLOR)
                     self._is_placeholder = False
                 
                 # Insert text at cursor position
@@ -509,36 +1023,51 @@ class CopyableTextView(NSTextView):
                 # Use insertText_ which inserts into the view
                 self.insertText_(text)
                 
-                # Trigger callback
-                try:
-                    cb = getattr(self, 'on_text_change_callback', None)
-                    if cb:
-                        cb()
-                except:
-                    pass
+                # Trigger callback (debounced)
+                self.scheduleTextChangeCallback()
                 
                 # pasted into view (silent)
                 return True
             else:
-                print("⚠️ No text in clipboard")
+                logger.debug("⚠️ No text in clipboard")
                 return False
                 
         except Exception as e:
-            print(f"❌ Paste error: {e}")
+            logger.error("❌ Paste error: %s", e)
             import traceback
             traceback.print_exc()
             return False
     
+    def scheduleTextChangeCallback(self):
+        """Coalesce bursts of edits into one on_text_change_callback after a short quiet period"""
+        if getattr(self, 'on_text_change_callback', None) is None:
+            return
+        if self._pending_cb is not None:
+            self._pending_cb.invalidate()
+        self._pending_cb = NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            _TEXT_CHANGE_DEBOUNCE, self, "fireTextChangeCallback:", None, False
+        )
+    
+    def fireTextChangeCallback_(self, timer):
+        """Timer target: run the pending text change callback"""
+        self._pending_cb = None
+        try:
+            cb = getattr(self, 'on_text_change_callback', None)
+            if cb:
+                cb()
+        except Exception:
+            pass
+    
     def selectAll_(self, sender):
         """Select all text - works with Cmd+A"""
         try:
-            length = len(self.string())
+            length = self.string().length()  # NSString length, no Python copy
             self.setSelectedRange_((0, length))
             # selection updated
             self.setNeedsDisplay_(True)
             return True
         except Exception as e:
-            print(f"⚠️ selectAll_ error: {e}")
+            logger.warning("⚠️ selectAll_ error: %s", e)
             return False
     
     def cut_(self, sender):
@@ -547,8 +1076,8 @@ class CopyableTextView(NSTextView):
             return False
         selectedRange = self.selectedRange()
         if selectedRange.length > 0:
-            selectedText = self.string()[selectedRange.location:selectedRange.location + selectedRange.length]
-            pasteboard = NSPasteboard.generalPasteboard()
+            selectedText = self.string().substringWithRange_(selectedRange)
+            pasteboard = _PASTEBOARD
             pasteboard.clearContents()
             pasteboard.setString_forType_(selectedText, "public.utf8-plain-text")
             self.delete_(sender)
@@ -576,9 +1105,9 @@ class InputTextView(CopyableTextView):
         """Insert text and make it visible"""
         # Clear placeholder when actual text is inserted
         try:
-            if getattr(self, '_is_placeholder', False):
+            if self._is_placeholder:
                 self.setString_("")
-                self.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95))
+                self.setTextColor_(_ACTIVE_COLOR)
                 self._is_placeholder = False
         except Exception:
             pass
@@ -587,40 +1116,28 @@ class InputTextView(CopyableTextView):
         if isinstance(text, str) and '\n' in text:
             text = text.replace('\n', ' ')
         
-        # Manual text insertion (parent class doesn't work in menu bar)
-        current_text = str(self.string())
+        # Manual text insertion (parent class doesn't work in menu bar).
+        # Mutate only the selected range of the text storage so AppKit does an
+        # incremental layout instead of re-laying out the whole document; the
+        # typing attributes keep the inserted run in the current font/color.
         selected_range = self.selectedRange()
-        
-        # Build new text
-        before = current_text[:selected_range.location]
-        after = current_text[selected_range.location + selected_range.length:]
-        new_text = before + text + after
-        
-        # Set new text
-        self.setString_(new_text)
+        inserted = NSAttributedString.alloc().initWithString_attributes_(text, self.typingAttributes())
+        self.textStorage().replaceCharactersInRange_withAttributedString_(selected_range, inserted)
         
         # Move cursor to end of inserted text
         new_position = selected_range.location + len(text)
         self.setSelectedRange_((new_position, 0))
         
-        # Force display update
-        self.setNeedsDisplay_(True)
-        
-        # Invoke text change callback if present
-        try:
-            cb = getattr(self, 'on_text_change_callback', None)
-            if cb:
-                cb()
-        except Exception:
-            pass
+        # Invoke text change callback if present (debounced)
+        self.scheduleTextChangeCallback()
 
     def keyDown_(self, event):
         """Handle key press events"""
         # Clear placeholder when typing
         try:
-            if getattr(self, '_is_placeholder', False):
+            if self._is_placeholder:
                 self.setString_("")
-                self.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95))
+                self.setTextColor_(_ACTIVE_COLOR)
                 self._is_placeholder = False
         except Exception:
             pass
@@ -644,13 +1161,8 @@ class InputTextView(CopyableTextView):
         # Call parent to handle normal typing
         objc.super(InputTextView, self).keyDown_(event)
         
-        # Trigger callback
-        try:
-            cb = getattr(self, 'on_text_change_callback', None)
-            if cb:
-                cb()
-        except Exception:
-            pass
+        # Trigger callback (debounced)
+        self.scheduleTextChangeCallback()
 
     def setPlaceholder_(self, placeholder):
         # NSTextView doesn't have a native placeholder; we simply use setString_ if it's empty
@@ -658,7 +1170,7 @@ class InputTextView(CopyableTextView):
             if not self.string() or self.string().strip() == '':
                 self.setString_(placeholder)
                 # Set placeholder color (lighter gray)
-                self.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(0.5, 0.5, 0.55, 0.7))
+                self.setTextColor_(_PLACEHOLDER_COLOR)
                 # Use a flag to indicate this is placeholder text so it can be cleared on focus
                 self._is_placeholder = True
         except Exception:
@@ -667,9 +1179,9 @@ class InputTextView(CopyableTextView):
     def focusIn_(self, sender):
         # Clear placeholder when focused
         try:
-            if getattr(self, '_is_placeholder', False):
+            if self._is_placeholder:
                 self.setString_("")
-                self.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95))
+                self.setTextColor_(_ACTIVE_COLOR)
                 self._is_placeholder = False
         except Exception:
             pass
@@ -689,7 +1201,10 @@ class CopyableTextField(NSTextField):
 
     def performKeyEquivalent_(self, event):
         """Handle common command key equivalents: copy/paste/cut/select all."""
-        modifierFlags = event.modifierFlags()
+        # Plain typing never carries the Command flag - hand it straight back
+        if not (event.modifierFlags() & NSEventModifierFlagCommand):
+            return objc.super(CopyableTextField, self).performKeyEquivalent_(event)
+
         characters = event.charactersIgnoringModifiers()
         if characters:
             try:
@@ -697,35 +1212,24 @@ class CopyableTextField(NSTextField):
             except:
                 pass
 
-        # 1<<20 is the NSCommandKeyMask in older headers, use it consistently
-        if modifierFlags & (1 << 20):
-            if characters == 'c':
-                # Call the standard copy action (forward to editor if needed)
-                try:
-                    self.copy_(None)
-                except Exception:
-                    pass
-                return True
-            elif characters == 'v':
-                try:
-                    self.paste_(None)
-                except Exception:
-                    pass
-                return True
-            elif characters == 'x':
-                try:
-                    self.cut_(None)
-                except Exception:
-                    pass
-                return True
-            elif characters == 'a':
-                try:
-                    self.selectAll_(None)
-                except Exception:
-                    pass
-                return True
+        action_name = self._CMD_ACTIONS.get(characters)
+        if action_name:
+            # Call the standard action (forward to editor if needed)
+            try:
+                getattr(self, action_name)(None)
+            except Exception:
+                pass
+            return True
         return objc.super(CopyableTextField, self).performKeyEquivalent_(event)
 
+    # Cmd-key dispatch table, built once per class
+    _CMD_ACTIONS = {
+        'c': 'copy_',
+        'v': 'paste_',
+        'x': 'cut_',
+        'a': 'selectAll_',
+    }
+
     def validateUserInterfaceItem_(self, item):
         action = item.action()
         if action in ('copy:', 'paste:', 'selectAll:', 'cut:'):
@@ -737,6 +1241,17 @@ class CopyableTextField(NSTextField):
 # Now using CopyableTextField directly with native NSTextField methods (stringValue/setStringValue_)
 
 
+class SynthRootView(NSView):
+    """Panel root view that never goes through drawRect_ (layer-only updates)"""
+    
+    def wantsUpdateLayer(self):
+        return True
+    
+    def updateLayer(self):
+        # Nothing to paint; the background box and subviews composite over this
+        self.layer().setBackgroundColor_(NSColor.clearColor().CGColor())
+
+
 class SynthPanel(NSPanel):
     """Custom NSPanel that acts as a pinned popover window (like Spotlight/Siri)"""
     
@@ -761,13 +1276,11 @@ class SynthPanel(NSPanel):
         self.setLevel_(NSStatusWindowLevel)
         
         # Glassmorphism: semi-transparent background with blur (more opaque)
-        bg_color = NSColor.colorWithRed_green_blue_alpha_(0.12, 0.12, 0.15, 0.92)  # More opaque
-        self.setBackgroundColor_(bg_color)
+        self.setBackgroundColor_(_PANEL_BG_COLOR)  # More opaque
         self.setOpaque_(False)  # Allow transparency
         
         # Add blur effect (vibrancy)
         try:
-            from AppKit import NSVisualEffectView, NSVisualEffectBlendingModeBehindWindow, NSVisualEffectMaterialHUDWindow
             effect_view = NSVisualEffectView.alloc().initWithFrame_(content_rect)
             effect_view.setBlendingMode_(NSVisualEffectBlendingModeBehindWindow)
             effect_view.setMaterial_(NSVisualEffectMaterialHUDWindow)
@@ -778,16 +1291,18 @@ class SynthPanel(NSPanel):
         
         # Add rounded corners and subtle shadow with proper clipping
         try:
-            self.contentView().setWantsLayer_(True)
-            self.contentView().layer().setCornerRadius_(20.0)  # More rounded edges
-            self.contentView().layer().setMasksToBounds_(True)  # Clip to rounded corners
-            self.contentView().layer().setShadowColor_(NSColor.blackColor().CGColor())
-            self.contentView().layer().setShadowOpacity_(0.5)
-            self.contentView().layer().setShadowOffset_(NSMakeSize(0, -4))
-            self.contentView().layer().setShadowRadius_(12.0)
+            content_view = self.contentView()
+            content_view.setWantsLayer_(True)
+            layer = content_view.layer()
+            layer.setCornerRadius_(20.0)  # More rounded edges
+            layer.setMasksToBounds_(True)  # Clip to rounded corners
+            layer.setShadowColor_(_SHADOW_COLOR)
+            layer.setShadowOpacity_(0.5)
+            layer.setShadowOffset_(NSMakeSize(0, -4))
+            layer.setShadowRadius_(12.0)
             # Add blue border
-            self.contentView().layer().setBorderWidth_(1.5)  # Thinner border
-            self.contentView().layer().setBorderColor_(NSColor.colorWithRed_green_blue_alpha_(0.3, 0.6, 1.0, 0.5).CGColor())  # More subtle
+            layer.setBorderWidth_(1.5)  # Thinner border
+            layer.setBorderColor_(_BORDER_COLOR)  # More subtle
         except:
             pass
         
@@ -811,6 +1326,63 @@ class SynthPanel(NSPanel):
         return True
 
 
+@functools.lru_cache(maxsize=1)
+def _copy_selection_script():
+    """Compiled in-process Cmd+C AppleScript (fallback when Quartz is unavailable)"""
+    script = NSAppleScript.alloc().initWithSource_(
+        'tell application "System Events" to keystroke "c" using command down'
+    )
+    script.compileAndReturnError_(None)
+    return script
+
+
+_EDIT_MENU_INSTALLED = False  # Set once the app's Edit menu exists
+
+
+def _install_edit_menu_once():
+    """Create Edit menu for Copy/Paste keyboard shortcuts (CRITICAL for panel text editing)"""
+    global _EDIT_MENU_INSTALLED
+    if _EDIT_MENU_INSTALLED:
+        return
+    
+    # Get main menu
+    main_menu = NSApp.mainMenu()
+    if main_menu is None:
+        main_menu = NSMenu.alloc().init()
+        NSApp.setMainMenu_(main_menu)
+    
+    # Check if Edit menu already exists
+    for i in range(main_menu.numberOfItems()):
+        item = main_menu.itemAtIndex_(i)
+        if item and item.submenu() and item.submenu().title() == "Edit":
+            logger.debug("✅ Edit menu already exists")
+            _EDIT_MENU_INSTALLED = True
+            return
+    
+    # Create Edit menu
+    edit_menu = NSMenu.alloc().init()
+    edit_menu.setTitle_("Edit")
+    edit_menu.setAutoenablesItems_(True)
+    
+    # Add standard edit menu items
+    edit_menu.addItemWithTitle_action_keyEquivalent_("Undo", "undo:", "z")
+    edit_menu.addItemWithTitle_action_keyEquivalent_("Redo", "redo:", "Z")
+    edit_menu.addItem_(NSMenuItem.separatorItem())
+    edit_menu.addItemWithTitle_action_keyEquivalent_("Cut", "cut:", "x")
+    edit_menu.addItemWithTitle_action_keyEquivalent_("Copy", "copy:", "c")
+    edit_menu.addItemWithTitle_action_keyEquivalent_("Paste", "paste:", "v")
+    edit_menu.addItemWithTitle_action_keyEquivalent_("Delete", "delete:", "")
+    edit_menu.addItemWithTitle_action_keyEquivalent_("Select All", "selectAll:", "a")
+    
+    # Add Edit menu to main menu
+    edit_item = NSMenuItem.alloc().init()
+    edit_item.setSubmenu_(edit_menu)
+    main_menu.addItem_(edit_item)
+    _EDIT_MENU_INSTALLED = True
+    
+    logger.debug("✅ Edit menu created with full copy/paste support")
+
+
 class SynthMenuBarNative(NSObject):
     """Native macOS menu bar with embedded text input"""
     
@@ -824,26 +1396,35 @@ class SynthMenuBarNative(NSObject):
         self.screen_capture = ScreenCapture()
         self.web_search = WebSearchRAG()  # Web search (renamed from rag)
         self.rag = SynthRAG()  # Local vector RAG with Qdrant
+        self.response_cache = ResponseCache(self.rag)  # Reuses answers to repeat/reworded questions
+        self._tess_api = None  # tesserocr API, created on first Screen ask (model load ~once)
+        self._tess_lock = threading.Lock()
         
-        print(f"🧠 Brain: Connected")
-        print(f"🌐 Web Search: Ready") 
-        print(f"💾 Local RAG: {self.rag.get_stats()['status']}")
+        logger.info("🧠 Brain: Connected")
+        logger.info("🌐 Web Search: Ready")
+        logger.info("💾 Local RAG: %s", self.rag.get_stats()['status'])
         
         # Initialize Plugin Manager
-        print("🔌 Loading plugins...")
+        logger.info("🔌 Loading plugins...")
         self.plugin_manager = PluginManager()
         self.plugin_manager.load_all_plugins()
-        print(f"✅ Loaded {len(self.plugin_manager.plugins)} plugins")
+        logger.info("✅ Loaded %s plugins", len(self.plugin_manager.plugins))
         
         # Initialize Chat Manager
         self.chat_manager = ChatManager(max_history=50)
-        print("💬 Chat manager initialized")
+        logger.info("💬 Chat manager initialized")
         
         # Chat Mode State
         self.chat_mode_active = False
         
-        # Event monitor for click-outside-to-close
-        self.click_monitor = None
+        # Click-outside-to-close: panel resign-key observer, gated by this flag
+        self._monitor_active = False
+        
+        # NSScreen.screens(), refreshed only when the display setup changes
+        self._screens_cache = None
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self, "screenParametersChanged:", NSApplicationDidChangeScreenParametersNotification, None
+        )
         
         # UI sizing + layout guard rails
         self.default_width = 500
@@ -859,9 +1440,16 @@ class SynthMenuBarNative(NSObject):
         # Clipboard state tracking - stores clipboard text captured by user
         self.captured_clipboard = None  # Text user copied with Cmd+C
         self.clipboard_timestamp = None  # When it was captured
+        self._clipboard_lock = threading.Lock()  # Keeps text + timestamp paired for worker reads
         self.clipboard_min_chars = 5  # Allow shorter snippets to flow through
         self.clipboard_max_age = 300   # Seconds before clipboard text expires
-        self.start_clipboard_monitor()  # Monitor for Cmd+C events
+        self.clipboard_poll_interval = 0.1  # Seconds between changeCount checks while active
+        self.clipboard_poll_max = 2.0  # Backoff ceiling once the pasteboard is idle
+        self.clipboard_idle_ticks_before_backoff = 5  # Unchanged checks before backing off
+        self.clipboard_timer = None  # Only runs while the panel is open
+        self._pasteboard_observing = False  # Using the change notification instead of the timer
+        # Baseline so text copied before launch isn't treated as a new copy
+        self._last_change_count = _pasteboard_change_count()
         
         # Create status bar item and set its button target/action (more reliable)
         self.statusbar = NSStatusBar.systemStatusBar()
@@ -887,6 +1475,39 @@ class SynthMenuBarNative(NSObject):
             except:
                 pass
         
+        # Store original compact size for reset
+        self.original_compact_height = 190
+        # Flag to suppress background updates during UI transitions
+        self._suppress_bg_updates = False
+        # Latest result text from worker threads, drained by a main-thread timer
+        self._pending_result = None
+        self._pending_lock = threading.Lock()
+        self._last_drawn_result = None
+        self._deferred_result = None  # Arrived while hidden; drawn on next show
+        self._result_len = 0  # NSTextStorage length after the last draw
+        self._result_lines = 1  # Line count of the last draw, kept up to date on appends
+        # On-screen chat transcript: (UTF-16 length, newlines) per message block,
+        # or None when the result view is showing something else
+        self._chat_blocks = None
+        self._chat_header = ""  # "Chat Mode" banner above the blocks
+        self._chat_status = ""  # Progress line after the last block
+        self._cached_input_str = None  # Python copy of the input text, dropped on edit
+        # In-flight Ask query (Future) and the event that mutes its UI updates
+        self._ask_future = None
+        self._ask_cancel = threading.Event()
+        
+        # Panel, views and Edit menu are built on first open (_ensure_panel_built)
+        self.panel = None
+        
+        # Action already attached to status item/button above
+        
+        return self
+    
+    def _ensure_panel_built(self):
+        """Build the panel UI the first time it is needed, not at launch"""
+        if self.panel is not None:
+            return
+        
         # Create custom panel (replaces NSMenu)
         self.panel = SynthPanel.alloc().init()
         
@@ -895,34 +1516,42 @@ class SynthMenuBarNative(NSObject):
         
         # Set content view
         self.panel.setContentView_(self.input_view)
-
-        # Store original compact size for reset
-        self.original_compact_height = 190
-        # Flag to suppress background updates during UI transitions
-        self._suppress_bg_updates = False
         
+        # Close on click-outside: the panel resigns key when another app's window is clicked
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self, "panelResignedKey:", NSWindowDidResignKeyNotification, self.panel
+        )
+
         # Ensure outer panel has rounded corners so the glassmorphed background
         # appears rounded at the window level (round both contentView and its
         # superview/theme frame). Keep panel non-opaque so transparency shows.
         try:
             self.panel.setOpaque_(False)
-            # Round content view (clips inner content)
+            # Round content view. No masksToBounds: clipping forces an
+            # offscreen pass every frame, so the rounded background is drawn
+            # by an NSBox behind the content instead (subviews are inset by
+            # the padding and never reach the corners).
             cv = self.panel.contentView()
             if cv is not None:
                 try:
                     cv.setWantsLayer_(True)
                 except Exception as e:
-                    print(f"⚠️ Failed to set wantsLayer on contentView: {e}")
+                    logger.warning("⚠️ Failed to set wantsLayer on contentView: %s", e)
                 try:
                     cv.layer().setCornerRadius_(20.0)
-                    cv.layer().setMasksToBounds_(True)
+                    cv.layer().setCornerCurve_("continuous")  # kCACornerCurveContinuous (10.15+)
                 except Exception:
-                    try:
-                        l = cv.layer()
-                        setattr(l, 'cornerRadius', 20.0)
-                        setattr(l, 'masksToBounds', True)
-                    except:
-                        print("⚠️ Failed to set layer attributes on contentView theme layer")
+                    pass
+                try:
+                    bg_box = NSBox.alloc().initWithFrame_(cv.bounds())
+                    bg_box.setBoxType_(4)  # NSBoxCustom
+                    bg_box.setBorderWidth_(0)
+                    bg_box.setCornerRadius_(20.0)
+                    bg_box.setFillColor_(_PANEL_BG_COLOR)
+                    bg_box.setAutoresizingMask_(18)  # Width + height sizable
+                    cv.addSubview_positioned_relativeTo_(bg_box, -1, None)  # NSWindowBelow
+                except Exception as e:
+                    logger.warning("⚠️ Failed to add rounded background box: %s", e)
 
             # Also round the containing theme frame / superview so the
             # outermost window edges are rounded (this fixes the sharp outer
@@ -944,7 +1573,7 @@ class SynthMenuBarNative(NSObject):
                     try:
                         theme_view.setWantsLayer_(True)
                     except Exception as e:
-                        print(f"⚠️ Failed to set wantsLayer on theme_view: {e}")
+                        logger.warning("⚠️ Failed to set wantsLayer on theme_view: %s", e)
                     try:
                         # Do NOT maskToBounds on the theme frame so shadows can draw
                         theme_view.layer().setCornerRadius_(20.0)
@@ -954,51 +1583,42 @@ class SynthMenuBarNative(NSObject):
                             try:
                                 setattr(theme_view.layer(), 'masksToBounds', False)
                             except Exception as e:
-                                print(f"⚠️ Failed to set masksToBounds on theme_view.layer: {e}")
+                                logger.warning("⚠️ Failed to set masksToBounds on theme_view.layer: %s", e)
                     except Exception:
                         try:
                             l2 = theme_view.layer()
                             setattr(l2, 'cornerRadius', 20.0)
                             setattr(l2, 'masksToBounds', False)
                         except Exception as e:
-                            print(f"⚠️ Failed to set fallback layer attributes on theme_view: {e}")
+                            logger.warning("⚠️ Failed to set fallback layer attributes on theme_view: %s", e)
             except Exception:
                 pass
 
-            # Restore a semi-transparent background (do NOT make fully clear)
-            # so the panel keeps its glassmorphic look but shows rounded edges.
+            # The window itself is clear; the rounded box above paints the
+            # semi-transparent glassmorphic fill, so no square corners show.
             try:
-                self.panel.setBackgroundColor_(NSColor.colorWithRed_green_blue_alpha_(0.12, 0.12, 0.15, 0.92))
+                self.panel.setBackgroundColor_(NSColor.clearColor())
             except Exception as e:
-                print(f"⚠️ Failed to set panel background color: {e}")
+                logger.warning("⚠️ Failed to set panel background color: %s", e)
 
             # Ensure the panel remains movable by dragging its background
             try:
                 self.panel.setMovableByWindowBackground_(True)
             except Exception as e:
-                print(f"⚠️ Failed to make panel movable by background: {e}")
+                logger.warning("⚠️ Failed to make panel movable by background: %s", e)
         except Exception as e:
-            print(f"⚠️ Error during panel rounding/background setup: {e}")
-        
-        # Action already attached to status item/button above
+            logger.warning("⚠️ Error during panel rounding/background setup: %s", e)
         
         # Create Edit menu for Copy/Paste support (CRITICAL for text editing)
-        self.create_edit_menu()
-        
-        return self
+        _install_edit_menu_once()
     
     def create_input_view(self):
         """Create custom view with embedded text field and result area"""
 
         # Container view - compact initial size (2 rows of buttons)
-        self.input_view = NSView.alloc().initWithFrame_(NSMakeRect(0, 0, self.default_width, 190))
-        self.input_view.setWantsLayer_(True)
-        
-        # Glassmorphism background
-        try:
-            self.input_view.layer().setBackgroundColor_(NSColor.clearColor().CGColor())
-        except:
-            pass
+        # Layer-only root view: once it is the panel's contentView the rounding
+        # block layer-backs it, and redraws go through updateLayer, not drawRect_.
+        self.input_view = SynthRootView.alloc().initWithFrame_(NSMakeRect(0, 0, self.default_width, 190))
 
         # Layout constants - better spacing
         padding = 16
@@ -1006,23 +1626,19 @@ class SynthMenuBarNative(NSObject):
         result_view_height = self.default_result_height
         
         # Glassmorphism border color - subtle and elegant
-        border_color = NSColor.colorWithRed_green_blue_alpha_(0.3, 0.3, 0.35, 0.4)
+        border_color = _COLOR_RESULT_BORDER
 
         # ============ RESULT VIEW (TOP) - Scrollable output ============
-        # Use NSBox for border, with scroll_view inside
-        border_box = NSBox.alloc().initWithFrame_(NSMakeRect(padding, 132, inner_width, result_view_height))
-        border_box.setBoxType_(4)  # NSBoxCustom
-        border_box.setBorderType_(1)  # NSLineBorder
-        border_box.setBorderWidth_(0.5)  # Very thin border
-        border_box.setBorderColor_(border_color)
-        border_box.setCornerRadius_(18.0)  # More rounded
-        border_box.setFillColor_(NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.94))  # More opaque
-
-        # Create scroll view INSIDE the border box
-        scroll_view = NSScrollView.alloc().initWithFrame_(NSMakeRect(0, 0, inner_width, result_view_height))
+        # The scroll view's own layer draws the rounded border (no NSBox wrapper)
+        scroll_view = NSScrollView.alloc().initWithFrame_(NSMakeRect(padding, 132, inner_width, result_view_height))
         scroll_view.setBorderType_(0)  # No border
+        scroll_view.setWantsLayer_(True)
+        scroll_view.layer().setCornerRadius_(18.0)  # More rounded
+        scroll_view.layer().setMasksToBounds_(True)
+        scroll_view.layer().setBorderWidth_(0.5)  # Very thin border
+        scroll_view.layer().setBorderColor_(border_color.CGColor())
         scroll_view.setDrawsBackground_(True)
-        scroll_view.setBackgroundColor_(NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.88))
+        scroll_view.setBackgroundColor_(_COLOR_FIELD_BG)
         scroll_view.setHasVerticalScroller_(True)
         scroll_view.setHasHorizontalScroller_(False)
         scroll_view.setAutohidesScrollers_(True)  # Auto-hide scrollers
@@ -1035,7 +1651,7 @@ class SynthMenuBarNative(NSObject):
         self.result_view.setEditable_(False)
         self.result_view.setSelectable_(True)
         self.result_view.setRichText_(False)
-        mono_font = NSFont.systemFontOfSize_(13)  # System font
+        mono_font = _FONT_RESULT  # System font
         self.result_view.setFont_(mono_font)
         try:
             text_storage = self.result_view.textStorage()
@@ -1044,8 +1660,8 @@ class SynthMenuBarNative(NSObject):
         except:
             pass
         self.result_view.textContainer().setLineFragmentPadding_(8.0)
-        self.result_view.setBackgroundColor_(NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.88))
-        self.result_view.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95))  # Bright white
+        self.result_view.setBackgroundColor_(_COLOR_FIELD_BG)
+        self.result_view.setTextColor_(_ACTIVE_COLOR)  # Bright white
         self.result_view.setAllowsUndo_(False)
         self.result_view.setVerticallyResizable_(True)
         self.result_view.setHorizontallyResizable_(False)
@@ -1071,9 +1687,8 @@ class SynthMenuBarNative(NSObject):
         # Add bottom padding so last line is visible
         self.result_view.setTextContainerInset_(NSMakeSize(5, 15))  # 5px horizontal, 15px bottom padding
         scroll_view.setDocumentView_(self.result_view)
-        border_box.setContentView_(scroll_view)
         self.scroll_view = scroll_view
-        self.scroll_border_box = border_box
+        self.scroll_border_box = scroll_view  # Kept for the show/hide/resize callers
 
         # ============ INPUT TEXT VIEW (MIDDLE) - Editable WITH SCROLL ============
         input_container_height = 46
@@ -1082,11 +1697,13 @@ class SynthMenuBarNative(NSObject):
         self.input_container.setWantsLayer_(True)
         try:
             # Glassmorphism input - black, not blue
-            self.input_container.layer().setBackgroundColor_(NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.94).CGColor())  # More opaque
+            self.input_container.layer().setBackgroundColor_(_CG_GLASS_BG)  # More opaque
             self.input_container.layer().setBorderWidth_(1.0)  # More visible border
             self.input_container.layer().setBorderColor_(border_color.CGColor())
             self.input_container.layer().setCornerRadius_(12.0)  # Properly rounded
-            self.input_container.layer().setMasksToBounds_(True)
+            # No masksToBounds (offscreen pass per caret blink); the text view is
+            # inset by input_padding so nothing reaches the rounded corners
+            self.input_container.layer().setCornerCurve_("continuous")
         except:
             pass
         
@@ -1103,18 +1720,25 @@ class SynthMenuBarNative(NSObject):
         
         # Input text view inside scroll view - horizontal layout with center-left cursor
         self.input_text_view = InputTextView.alloc().initWithFrame_(NSMakeRect(0, 0, 10000, input_container_height - 10))
+        # Any edit to the storage (typing or setString_) invalidates _input_text()'s cache
+        NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+            self, "inputTextDidChange:", NSTextStorageDidProcessEditingNotification,
+            self.input_text_view.textStorage()
+        )
         self.input_text_view.setEditable_(True)
         self.input_text_view.setSelectable_(True)
         self.input_text_view.setRichText_(False)
-        self.input_text_view.setFont_(NSFont.systemFontOfSize_(14))
-        self.input_text_view.setBackgroundColor_(NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.88))  # Less transparent
-        self.input_text_view.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95))
-        self.input_text_view.setInsertionPointColor_(NSColor.colorWithRed_green_blue_alpha_(0.3, 0.7, 1.0, 1.0))  # Bright blue cursor
+        self.input_text_view.setFont_(_FONT_INPUT)
+        self.input_text_view.setBackgroundColor_(_COLOR_FIELD_BG)  # Less transparent
+        self.input_text_view.setTextColor_(_ACTIVE_COLOR)
+        self.input_text_view.setInsertionPointColor_(_COLOR_ACCENT)  # Bright blue cursor
         try:
             self.input_text_view.setInsertionPointWidth_(2.5)
         except:
             pass
-        self.input_text_view.setDrawsBackground_(True)
+        # The container layer paints the (rounded) background; a square text view
+        # fill would poke out of the corners now that the container doesn't clip
+        self.input_text_view.setDrawsBackground_(False)
         self.input_text_view.setVerticallyResizable_(False)  # No vertical resize
         self.input_text_view.setHorizontallyResizable_(True)  # Horizontal resize
         # Center cursor vertically by adjusting textContainerInset
@@ -1123,10 +1747,19 @@ class SynthMenuBarNative(NSObject):
         # Store references for focus handling
         self.placeholder_text = "Ask Synth"
         self.showing_placeholder = True
+        # Pre-styled contents for the placeholder <-> empty transitions, so each swap
+        # is a single text-storage replacement rather than a string + colour relayout
+        self._input_typing_attrs = {NSFontAttributeName: _FONT_INPUT,
+                                    NSForegroundColorAttributeName: _ACTIVE_COLOR}
+        self._placeholder_attr = NSAttributedString.alloc().initWithString_attributes_(
+            self.placeholder_text, {NSFontAttributeName: _FONT_INPUT,
+                                    NSForegroundColorAttributeName: _COLOR_PLACEHOLDER_DIM})
+        self._empty_attr = NSAttributedString.alloc().initWithString_attributes_(
+            "", self._input_typing_attrs)
         
         # Store border color for focus effect
         self.default_border_color = border_color
-        self.focus_border_color = NSColor.colorWithRed_green_blue_alpha_(0.3, 0.7, 1.0, 0.9)  # Bright blue border on focus
+        self.focus_border_color = _COLOR_FOCUS_BORDER  # Bright blue border on focus
         try:
             self.input_text_view.setAutomaticTextReplacementEnabled_(False)
             self.input_text_view.setAutomaticQuoteSubstitutionEnabled_(False)
@@ -1151,7 +1784,7 @@ class SynthMenuBarNative(NSObject):
 
         def handleQuery_(self, sender):
             """Handle ASK button - Fast intelligent agent with Live Tools"""
-            query = str(self.input_text_view.string()).strip()
+            query = self._input_text().strip()
             if not query:
                 return
             self.scroll_border_box.setHidden_(False)
@@ -1160,17 +1793,17 @@ class SynthMenuBarNative(NSObject):
             import threading, time, traceback
             def process_in_background():
                 from utils.ask_button_logger import get_logger
-                logger = get_logger()
+                ask_log = get_logger()
                 start_time = time.time()
-                logger.log_query(query)
+                ask_log.log_query(query)
                 try:
                     clipboard_text = self.get_recent_clipboard_text()
                     if clipboard_text:
-                        logger.log_event("CLIPBOARD_CONTEXT", {"length": len(clipboard_text)})
+                        ask_log.log_event("CLIPBOARD_CONTEXT", {"length": len(clipboard_text)})
                         self.safe_update_result(f"� Using clipboard ({len(clipboard_text)} chars) | 🤖 Processing...")
                     from src.brain.agent_modes import ask_mode_agent
                     def log_event_callback(event_type, data):
-                        logger.log_event(event_type, data)
+                        ask_log.log_event(event_type, data)
                     response = ask_mode_agent(
                         query,
                         clipboard_text=None,
@@ -1178,36 +1811,30 @@ class SynthMenuBarNative(NSObject):
                         log_callback=log_event_callback
                     )
                     total_time = time.time() - start_time
-                    logger.log_response(response)
-                    logger.log_timing("total", total_time)
+                    ask_log.log_response(response)
+                    ask_log.log_timing("total", total_time)
                     self.safe_update_result(response + f"\n\n⏱️ Completed in {total_time:.1f}s")
-                    print(f"✅ Ask mode completed in {total_time:.1f}s")
+                    logger.info("✅ Ask mode completed in %.1fs", total_time)
                 except Exception as e:
                     error_msg = str(e)
                     tb = traceback.format_exc()
-                    logger.log_error(error_msg, tb)
+                    ask_log.log_error(error_msg, tb)
                     total_time = time.time() - start_time
-                    logger.log_timing("total_failed", total_time)
+                    ask_log.log_timing("total_failed", total_time)
                     friendly_error = f"""❌ Error: {error_msg[:200]}
 
     Something went wrong. Please try again or rephrase your question.
 
     Log file: logs/ask_button/ask_session_*.log"""
                     self.safe_update_result(friendly_error)
-                    print(f"❌ Error:\n{tb}")
+                    logger.error("❌ Error:\n%s", tb)
             thread = threading.Thread(target=process_in_background)
             thread.daemon = True
             thread.start()
         
         # Ensure input is editable and selectable
         self.input_text_view.setEditable_(True)
-        self.input_text_view.setSelectable_(True)
-        # Avoid using field editor behavior inside menu panel (can interfere with rendering)
-        try:
-            self.input_text_view.setFieldEditor_(True)
-        except:
-            # If not available, ignore
-            pass
+        self.input_text_view.setSelectable_(True)
         self.input_text_view.setRichText_(False)  # Keep plain text
         # Enable standard edit operations
         try:
@@ -1231,45 +1858,37 @@ class SynthMenuBarNative(NSObject):
             btn = NSButton.alloc().initWithFrame_(frame)
             btn.setTitle_(title)
             btn.setBezelStyle_(4)
-            btn.setFont_(NSFont.systemFontOfSize_weight_(13, 0.5))
+            btn.setFont_(_FONT_BUTTON)
             btn.setWantsLayer_(True)
             try:
                 btn.layer().setCornerRadius_(8.0)  # Rounded corners
                 btn.layer().setBorderWidth_(0)  # No border
                 if is_blue:
                     # Blue button with solid background
-                    btn.layer().setBackgroundColor_(NSColor.colorWithRed_green_blue_alpha_(0.25, 0.55, 1.0, 0.85).CGColor())
+                    btn.layer().setBackgroundColor_(_CG_BUTTON_BLUE)
                 else:
                     # Regular buttons with subtle gray background (macOS style)
-                    btn.layer().setBackgroundColor_(NSColor.colorWithRed_green_blue_alpha_(0.2, 0.2, 0.22, 0.6).CGColor())
+                    btn.layer().setBackgroundColor_(_CG_BUTTON_GRAY)
             except:
                 pass
             return btn
         
-        # Button 1: Ask (BLUE)
-        self.ask_button = create_styled_button(NSMakeRect(padding, btn_y, btn_width, btn_height), "Ask", is_blue=True)
-        self.ask_button.setTarget_(self)
-        self.ask_button.setAction_("handleQuery:")
-        
-        # Button 2: Agent
-        self.agent_button = create_styled_button(NSMakeRect(padding + (btn_width + btn_spacing) * 1, btn_y, btn_width, btn_height), "🤖 Agent", is_blue=False)
-        self.agent_button.setTarget_(self)
-        self.agent_button.setAction_("handleAgentQuery:")
-        
-        # Button 3: Screen
-        self.screen_button = create_styled_button(NSMakeRect(padding + (btn_width + btn_spacing) * 2, btn_y, btn_width, btn_height), "📸 Screen", is_blue=False)
-        self.screen_button.setTarget_(self)
-        self.screen_button.setAction_("handleScreen:")
-        
-        # Button 4: Copy
-        self.copy_button = create_styled_button(NSMakeRect(padding + (btn_width + btn_spacing) * 3, btn_y, btn_width, btn_height), "Copy", is_blue=False)
-        self.copy_button.setTarget_(self)
-        self.copy_button.setAction_("copyResults:")
-        
-        # Button 5: Clear
-        self.clear_button = create_styled_button(NSMakeRect(padding + (btn_width + btn_spacing) * 4, btn_y, btn_width, btn_height), "Clear", is_blue=False)
-        self.clear_button.setTarget_(self)
-        self.clear_button.setAction_("clearResults:")
+        # Row 1: Ask (BLUE), Agent, Screen, Copy, Clear - frames computed in one pass
+        row_buttons = (
+            ('ask_button', "Ask", "handleQuery:"),
+            ('agent_button', "🤖 Agent", "handleAgentQuery:"),
+            ('screen_button', "📸 Screen", "handleScreen:"),
+            ('copy_button', "Copy", "copyResults:"),
+            ('clear_button', "Clear", "clearResults:"),
+        )
+        buttons = []
+        for i, (attr, title, action) in enumerate(row_buttons):
+            x = padding + (btn_width + btn_spacing) * i
+            btn = create_styled_button(NSMakeRect(x, btn_y, btn_width, btn_height), title, is_blue=(i == 0))
+            btn.setTarget_(self)
+            btn.setAction_(action)
+            setattr(self, attr, btn)
+            buttons.append(btn)
 
         # ============ BUTTON 6 (ROW 2) - CHAT ============
         chat_btn_y = 6  # Bottom row
@@ -1277,59 +1896,18 @@ class SynthMenuBarNative(NSObject):
         self.chat_button.setTarget_(self)
         self.chat_button.setAction_("toggleChatMode:")
         
-        # Add all views
-        self.input_view.addSubview_(border_box)
-        self.input_view.addSubview_(self.input_container)
-        self.input_view.addSubview_(self.ask_button)
-        self.input_view.addSubview_(self.agent_button)
-        self.input_view.addSubview_(self.screen_button)
-        self.input_view.addSubview_(self.copy_button)
-        self.input_view.addSubview_(self.clear_button)
-        self.input_view.addSubview_(self.chat_button)
-
-        # Show output window by default with welcome message
+        # Add all views in a single hierarchy mutation
+        self.input_view.setSubviews_([scroll_view, self.input_container, *buttons, self.chat_button])
+
+        # Show output window by default with welcome message, unless a result
+        # arrived before the first open (togglePanel_ draws that instead)
         self.scroll_border_box.setHidden_(False)
-        self.safe_update_result("✨ Welcome to Synth\n\nAsk me anything!")
-    
-    def create_edit_menu(self):
-        """Create Edit menu for Copy/Paste keyboard shortcuts (CRITICAL for panel text editing)"""
-        # Get main menu
-        main_menu = NSApp.mainMenu()
-        if main_menu is None:
-            main_menu = NSMenu.alloc().init()
-            NSApp.setMainMenu_(main_menu)
-        
-        # Check if Edit menu already exists
-        for i in range(main_menu.numberOfItems()):
-            item = main_menu.itemAtIndex_(i)
-            if item and item.submenu() and item.submenu().title() == "Edit":
-                print("✅ Edit menu already exists")
-                return
-        
-        # Create Edit menu
-        edit_menu = NSMenu.alloc().init()
-        edit_menu.setTitle_("Edit")
-        edit_menu.setAutoenablesItems_(True)
-        
-        # Add standard edit menu items
-        edit_menu.addItemWithTitle_action_keyEquivalent_("Undo", "undo:", "z")
-        edit_menu.addItemWithTitle_action_keyEquivalent_("Redo", "redo:", "Z")
-        edit_menu.addItem_(NSMenuItem.separatorItem())
-        edit_menu.addItemWithTitle_action_keyEquivalent_("Cut", "cut:", "x")
-        edit_menu.addItemWithTitle_action_keyEquivalent_("Copy", "copy:", "c")
-        edit_menu.addItemWithTitle_action_keyEquivalent_("Paste", "paste:", "v")
-        edit_menu.addItemWithTitle_action_keyEquivalent_("Delete", "delete:", "")
-        edit_menu.addItemWithTitle_action_keyEquivalent_("Select All", "selectAll:", "a")
-        
-        # Add Edit menu to main menu
-        edit_item = NSMenuItem.alloc().init()
-        edit_item.setSubmenu_(edit_menu)
-        main_menu.addItem_(edit_item)
-        
-        print("✅ Edit menu created with full copy/paste support")
+        if self._deferred_result is None:
+            self.safe_update_result("✨ Welcome to Synth\n\nAsk me anything!")
     
     def togglePanel_(self, sender):
         """Toggle panel visibility and ALWAYS position it under the status item (like Spotlight)"""
+        self._ensure_panel_built()
         if self.panel.isVisible():
             # Close via centralized helper (restores original size/position)
             try:
@@ -1340,6 +1918,8 @@ class SynthMenuBarNative(NSObject):
                 except:
                     pass
         else:
+            self.start_clipboard_monitor()
+            
             # Restore original frame if available before showing
             try:
                 opf = getattr(self, 'original_panel_frame', None)
@@ -1360,12 +1940,21 @@ class SynthMenuBarNative(NSObject):
 
             NSApp.activateIgnoringOtherApps_(True)
             self.panel.makeKeyAndOrderFront_(None)
+            if self._deferred_result is not None:
+                text, self._deferred_result = self._deferred_result, None
+                self.updateResultText_(text)
             try:
                 self.prepare_prompt_entry()
             except Exception:
                 pass
             self.start_click_monitor()
     
+    def close_panel(self):
+        """Hide the panel and pause everything that only matters while it is open"""
+        self.panel.orderOut_(None)
+        self.stop_click_monitor()
+        self.stop_clipboard_monitor()
+    
     def position_panel_under_status_item(self):
         """Position panel centered under the status item - called EVERY time panel opens or expands"""
         try:
@@ -1392,7 +1981,7 @@ class SynthMenuBarNative(NSObject):
                     # NOTE: suppress noisy reposition messages to the output/result view
                     return
         except Exception as e:
-            print(f"⚠️ Error positioning panel: {e}")
+            logger.warning("⚠️ Error positioning panel: %s", e)
         
         # Fallback: center on screen near top
         try:
@@ -1405,7 +1994,7 @@ class SynthMenuBarNative(NSObject):
                 self.panel.setFrameOrigin_(NSPoint(x, y))
                 # Suppress fallback reposition message
         except Exception as e:
-            print(f"❌ Failed to position panel: {e}")
+            logger.error("❌ Failed to position panel: %s", e)
 
     def is_panel_on_any_screen(self):
         """Return True if the panel overlaps any visible screen area.
@@ -1413,73 +2002,67 @@ class SynthMenuBarNative(NSObject):
         Used to avoid forcibly repositioning a panel the user dragged onto another area.
         """
         try:
-            from AppKit import NSScreen
-            screens = NSScreen.screens()
+            if self._screens_cache is None:
+                self._screens_cache = NSScreen.screens()
             panel_frame = self.panel.frame()
-            for s in screens:
-                sf = s.visibleFrame()
-                # Check for rectangle overlap
-                if not (
-                    (panel_frame.origin.x + panel_frame.size.width) < sf.origin.x or
-                    (panel_frame.origin.x) > (sf.origin.x + sf.size.width) or
-                    (panel_frame.origin.y + panel_frame.size.height) < sf.origin.y or
-                    (panel_frame.origin.y) > (sf.origin.y + sf.size.height)
-                ):
+            for s in self._screens_cache:
+                if NSIntersectsRect(panel_frame, s.visibleFrame()):
                     return True
             return False
         except Exception:
             # If anything fails, conservatively return True so we don't jump the panel
             return True
     
+    def screenParametersChanged_(self, notification):
+        """Displays were added/removed/rearranged - drop the cached screen list"""
+        self._screens_cache = None
+    
     def start_click_monitor(self):
-        """Start monitoring for clicks outside the panel"""
-        from AppKit import NSEvent, NSEventMaskLeftMouseDown, NSEventMaskRightMouseDown
-        
-        # Remove existing monitor if any
-        self.stop_click_monitor()
-        
-        def click_handler(event):
-            """Handle mouse clicks - close panel if click is outside"""
-            try:
-                # Get click location in screen coordinates
-                click_location = NSEvent.mouseLocation()
-                
-                # Get panel frame
-                panel_frame = self.panel.frame()
-                
-                # Check if click is inside panel
-                if not (panel_frame.origin.x <= click_location.x <= panel_frame.origin.x + panel_frame.size.width and
-                        panel_frame.origin.y <= click_location.y <= panel_frame.origin.y + panel_frame.size.height):
-                    # Click is outside panel - close it via helper so size resets
-                    try:
-                        self.close_panel()
-                    except Exception:
-                        try:
-                            self.panel.orderOut_(None)
-                        except:
-                            pass
-            except Exception as e:
-                print(f"⚠️ Click monitor error: {e}")
-            
-            # Return event so it's processed normally
-            return event
-        
-        # Monitor left and right mouse clicks globally
-        self.click_monitor = NSEvent.addGlobalMonitorForEventsMatchingMask_handler_(
-            NSEventMaskLeftMouseDown | NSEventMaskRightMouseDown,
-            click_handler
-        )
+        """Start closing the panel when the user clicks outside it.
+
+        Instead of a global mouse-down monitor (a Python callback for every
+        click anywhere in the OS), watch for the panel resigning key: clicking
+        another app's window takes key status away from the panel.
+        """
+        self._monitor_active = True
     
     def stop_click_monitor(self):
-        """Stop monitoring for clicks outside the panel"""
-        if self.click_monitor:
-            from AppKit import NSEvent
-            NSEvent.removeMonitor_(self.click_monitor)
-            self.click_monitor = None
+        """Stop reacting to clicks outside the panel (the observer stays registered)"""
+        self._monitor_active = False
+    
+    def remove_click_monitor(self):
+        """Unregister the panel resign-key observer (app shutdown only)"""
+        self._monitor_active = False
+        if self.panel is not None:
+            NSNotificationCenter.defaultCenter().removeObserver_name_object_(
+                self, NSWindowDidResignKeyNotification, self.panel
+            )
+    
+    def panelResignedKey_(self, notification):
+        """Panel lost key status (click outside it) - close it via helper so size resets"""
+        if not self._monitor_active or not self.panel.isVisible():
+            return
+        try:
+            self.close_panel()
+        except Exception:
+            try:
+                self.panel.orderOut_(None)
+            except:
+                pass
 
     # Panel visibility is now handled by togglePanel: method
     # No need for menuWillOpen_/menuDidClose_ delegates
 
+    def inputTextDidChange_(self, notification):
+        """Input text storage was edited - drop the cached Python copy"""
+        self._cached_input_str = None
+    
+    def _input_text(self):
+        """Current input text as a Python str, bridged from NSString once per edit"""
+        if self._cached_input_str is None:
+            self._cached_input_str = str(self.input_text_view.string())
+        return self._cached_input_str
+    
     def prepare_prompt_entry(self):
         """Focus the text field on the main thread."""
         try:
@@ -1487,7 +2070,7 @@ class SynthMenuBarNative(NSObject):
                 "focusTextField:", None, False
             )
         except Exception as exc:
-            print(f"⚠️ Unable to schedule prompt focus: {exc}")
+            logger.warning("Unable to schedule prompt focus: %s", exc)
 
     def focusTextField_(self, _):
         """Selector helper that safely focuses the input text view and handles placeholder."""
@@ -1501,30 +2084,28 @@ class SynthMenuBarNative(NSObject):
                 if success:
                     # Clear placeholder when focused
                     if self.showing_placeholder:
-                        self.input_text_view.setString_("")
-                        self.input_text_view.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(1.0, 1.0, 1.0, 0.95))
+                        self._set_input_empty()
                         self.showing_placeholder = False
                     
                     # Blue border on focus
-                    try:
-                        self.input_container.layer().setBorderColor_(self.focus_border_color.CGColor())
-                        self.input_container.layer().setBorderWidth_(1.5)
-                    except:
-                        pass
+                    layer = self.input_container.layer()
+                    if layer is not None:
+                        layer.setBorderColor_(_CG_FOCUS_BORDER)
+                        layer.setBorderWidth_(1.5)
                     
                     # Move cursor to end
                     try:
-                        text_length = len(str(self.input_text_view.string()))
+                        text_length = self.input_text_view.textStorage().length()
                         self.input_text_view.setSelectedRange_((text_length, 0))
-                        print("✅ Input view is first responder")
+                        logger.debug("Input view is first responder")
                     except Exception:
                         pass
                 else:
-                    print("⚠️ Failed to make input view first responder")
+                    logger.warning("Failed to make input view first responder")
                     # Force it anyway
                     self.input_text_view.becomeFirstResponder()
         except Exception as exc:
-            print(f"⚠️ Unable to focus input view: {exc}")
+            logger.warning("Unable to focus input view: %s", exc)
 
     def reset_to_compact_view(self):
         """Hide result pane and shrink container back to compact height with welcome message."""
@@ -1549,10 +2130,15 @@ class SynthMenuBarNative(NSObject):
         self.expand_view_for_content(100)
         
         # Restore placeholder if input is empty
-        if not str(self.input_text_view.string()).strip():
-            self.input_text_view.setString_(self.placeholder_text)
-            self.input_text_view.setTextColor_(NSColor.colorWithRed_green_blue_alpha_(0.5, 0.5, 0.55, 0.6))  # Gray placeholder
+        if not self._input_text().strip():
+            self.input_text_view.textStorage().setAttributedString_(self._placeholder_attr)
             self.showing_placeholder = True
+
+    def _set_input_empty(self):
+        """Empty the input view in one storage edit, keeping typed text white."""
+        self.input_text_view.textStorage().setAttributedString_(self._empty_attr)
+        # An empty storage carries no attributes; typing picks these up instead
+        self.input_text_view.setTypingAttributes_(self._input_typing_attrs)
     
     def showPluginInfo_(self, sender):
         """Execute plugin action when clicked"""
@@ -1582,12 +2168,13 @@ The plugin will automatically activate when relevant to your query."""
     def clearResults_(self, sender):
         """Clear the result area and reset to original welcome state"""
         # Clear input text
-        self.input_text_view.setString_("")
+        self._set_input_empty()
         self.input_text_view.setEditable_(True)
         
         # RESET CLIPBOARD STATE - user must do Cmd+C again to capture new text
-        self.captured_clipboard = None
-        self.clipboard_timestamp = None
+        with self._clipboard_lock:
+            self.captured_clipboard = None
+            self.clipboard_timestamp = None
         
         # Clear chat history
         self.chat_manager.clear()
@@ -1600,7 +2187,7 @@ The plugin will automatically activate when relevant to your query."""
             self.expand_view_for_content(100)
         else:
             # Normal mode: return to original compact welcome state
-            print("🔄 Cleared: Returning to welcome screen")
+            logger.debug("Cleared: returning to welcome screen")
             self.reset_to_compact_view()
         
         # Focus back on input so user can type immediately
@@ -1611,7 +2198,7 @@ The plugin will automatically activate when relevant to your query."""
         result_text = str(self.result_view.string())
         if result_text:
             # Get the general pasteboard
-            pasteboard = NSPasteboard.generalPasteboard()
+            pasteboard = _PASTEBOARD
             pasteboard.clearContents()
             pasteboard.setString_forType_(result_text, "public.utf8-plain-text")
             
@@ -1621,93 +2208,125 @@ The plugin will automatically activate when relevant to your query."""
             # Also update button text temporarily
             self.copy_button.setTitle_("✓ Copied!")
             
-            # Reset button text after 1 second
-            import threading
-            def reset_button():
-                import time
-                time.sleep(1)
-                try:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "resetCopyButton:", None, False
-                    )
-                except:
-                    pass
-            
-            thread = threading.Thread(target=reset_button)
-            thread.daemon = True
-            thread.start()
+            # Reset button text after 1 second (one-shot timer on this main-thread run loop)
+            NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+                1.0, self, "resetCopyButton:", None, False
+            )
     
     def resetCopyButton_(self, sender):
         """Reset copy button text"""
         self.copy_button.setTitle_("Copy")
     
     def start_clipboard_monitor(self):
-        """Monitor clipboard for Cmd+C events - captures text when user copies"""
-        def monitor_clipboard():
-            pasteboard = NSPasteboard.generalPasteboard()
-            last_change_count = pasteboard.changeCount()
-            
-            while True:
-                try:
-                    current_change_count = pasteboard.changeCount()
-                    
-                    # Clipboard changed - user did Cmd+C!
-                    if current_change_count != last_change_count:
-                        last_change_count = current_change_count
-                        
-                        # Get clipboard text
-                        clipboard_text = pasteboard.stringForType_("public.utf8-plain-text")
-
-                        normalized = clipboard_text.strip() if clipboard_text else ""
-                        if normalized and len(normalized) >= self.clipboard_min_chars:
-                            # Capture this text - user intentionally copied it
-                            self.captured_clipboard = normalized
-                            self.clipboard_timestamp = time.time()
-                    
-                    time.sleep(0.5)  # Check every 500ms
-                except Exception as e:
-                    print(f"Clipboard monitor error: {e}")
-                    time.sleep(1)
-        
-        # Start monitor in background
-        monitor_thread = threading.Thread(target=monitor_clipboard, daemon=True)
-        monitor_thread.start()
-        print("👀 Clipboard monitor started")
+        """Monitor clipboard for Cmd+C events - captures text when user copies.
 
-    def get_recent_clipboard_text(self):
-        """Return recently captured clipboard text that still meets freshness rules."""
-        if not self.captured_clipboard:
-            return self._read_live_clipboard_fallback()
-        text = self.captured_clipboard.strip()
-        if len(text) < self.clipboard_min_chars:
-            return self._read_live_clipboard_fallback()
-        if self.clipboard_timestamp is None:
-            return text
-        age = time.time() - self.clipboard_timestamp
-        if age > self.clipboard_max_age:
-            return self._read_live_clipboard_fallback()
-        return text
+        Runs as a one-shot NSTimer on the main run loop (common modes, so it
+        keeps firing during menu tracking), re-armed after every check with an
+        adaptive interval: clipboard_poll_interval while copies are happening,
+        doubling up to clipboard_poll_max once the pasteboard sits idle. Only
+        active while the panel is open; a copy made while it was closed is
+        picked up by the immediate check on start.
+
+        Where AppKit exposes NSPasteboardDidChangeNotification the timer is
+        skipped entirely and the notification drives the same check.
+
+        A GCD timer source on a background queue would not save anything: its
+        handler is still a Python callable that takes the GIL on every fire,
+        and the capture has to hop back to the main thread anyway.
+        """
+        if self.clipboard_timer is not None or self._pasteboard_observing:
+            return
+        self._check_clipboard()
+        if NSPasteboardDidChangeNotification is not None:
+            NSNotificationCenter.defaultCenter().addObserver_selector_name_object_(
+                self, "pasteboardChanged:", NSPasteboardDidChangeNotification,
+                _PASTEBOARD
+            )
+            self._pasteboard_observing = True
+            return
+        self._clipboard_interval = self.clipboard_poll_interval
+        self._clipboard_idle_ticks = 0
+        self._arm_clipboard_timer()
+
+    def stop_clipboard_monitor(self):
+        """Stop the clipboard timer or observer (panel hidden or app quitting)"""
+        if self._pasteboard_observing:
+            NSNotificationCenter.defaultCenter().removeObserver_name_object_(
+                self, NSPasteboardDidChangeNotification, None
+            )
+            self._pasteboard_observing = False
+        if self.clipboard_timer is not None:
+            self.clipboard_timer.invalidate()
+            self.clipboard_timer = None
+
+    def pasteboardChanged_(self, notification):
+        """NSPasteboardDidChangeNotification handler - same capture as the timer"""
+        self._check_clipboard()
+
+    def _arm_clipboard_timer(self):
+        """Schedule the next changeCount check after the current interval"""
+        interval = self._clipboard_interval
+        self.clipboard_timer = NSTimer.timerWithTimeInterval_target_selector_userInfo_repeats_(
+            interval, self, "tickClipboard:", None, False
+        )
+        # Let macOS coalesce fires (App Nap) - exact timing doesn't matter here
+        self.clipboard_timer.setTolerance_(interval / 2)
+        NSRunLoop.currentRunLoop().addTimer_forMode_(self.clipboard_timer, NSRunLoopCommonModes)
+
+    def tickClipboard_(self, timer):
+        """Timer callback: check the pasteboard, adapt the interval, re-arm"""
+        if self._check_clipboard():
+            self._clipboard_interval = self.clipboard_poll_interval
+            self._clipboard_idle_ticks = 0
+        else:
+            self._clipboard_idle_ticks += 1
+            if self._clipboard_idle_ticks >= self.clipboard_idle_ticks_before_backoff:
+                self._clipboard_interval = min(self._clipboard_interval * 2, self.clipboard_poll_max)
+        self._arm_clipboard_timer()
 
-    def _read_live_clipboard_fallback(self):
-        """Look directly at the pasteboard in case monitor missed the copy event."""
+    def _check_clipboard(self):
+        """Read the pasteboard only when its changeCount advanced; True if it did"""
         try:
-            pasteboard = NSPasteboard.generalPasteboard()
-            live_text = pasteboard.stringForType_("public.utf8-plain-text")
-            if live_text:
-                normalized = live_text.strip()
-                if len(normalized) >= self.clipboard_min_chars:
+            current_change_count = _pasteboard_change_count()
+            if current_change_count == self._last_change_count:
+                return False
+            pasteboard = _PASTEBOARD
+            
+            # Clipboard changed - user did Cmd+C!
+            self._last_change_count = current_change_count
+            clipboard_text = pasteboard.stringForType_(NSPasteboardTypeString)
+
+            normalized = clipboard_text.strip() if clipboard_text else ""
+            if normalized and len(normalized) >= self.clipboard_min_chars:
+                # Capture this text - user intentionally copied it
+                with self._clipboard_lock:
                     self.captured_clipboard = normalized
                     self.clipboard_timestamp = time.time()
-                    return normalized
-        except Exception as exc:
-            print(f"⚠️ Live clipboard fallback failed: {exc}")
-        return None
+            return True
+        except Exception as e:
+            logger.warning("Clipboard monitor error: %s", e)
+            return False
+
+    def get_recent_clipboard_text(self):
+        """Return recently captured clipboard text that still meets freshness rules.
+
+        Served from what the clipboard monitor already captured (it checks the
+        changeCount as soon as the panel opens), so no pasteboard read here.
+        """
+        with self._clipboard_lock:
+            text = self.captured_clipboard
+            captured_at = self.clipboard_timestamp
+        if not text or captured_at is None:
+            return None
+        if time.time() - captured_at > self.clipboard_max_age:
+            return None
+        return text
 
     
     def capture_selected_text(self):
         """
         Capture currently selected text from the active application.
-        Uses improved AppleScript to get selected text.
+        Sends a synthetic Cmd+C via Quartz and waits on the pasteboard changeCount.
         
         Returns:
             str: Selected text from active app, or clipboard text as fallback
@@ -1716,80 +2335,65 @@ The plugin will automatically activate when relevant to your query."""
         saved_pasteboard_items = None
         try:
             # Save current clipboard content first (we'll restore it before returning)
-            pasteboard = NSPasteboard.generalPasteboard()
+            pasteboard = _PASTEBOARD
             original_clipboard = pasteboard.stringForType_("public.utf8-plain-text")
-            # Try to backup all pasteboard types so we can faithfully restore them
-            try:
-                saved_pasteboard_items = {}
-                types = pasteboard.types() or []
-                for t in types:
-                    try:
-                        data = pasteboard.dataForType_(t)
-                        if data:
-                            saved_pasteboard_items[t] = data
-                            continue
-                    except Exception:
-                        pass
-                    try:
-                        s = pasteboard.stringForType_(t)
-                        if s is not None:
-                            saved_pasteboard_items[t] = s
-                    except Exception:
-                        pass
-                if not saved_pasteboard_items:
-                    saved_pasteboard_items = None
-            except Exception:
-                saved_pasteboard_items = None
-            
-            # METHOD 1: Try to get selected text using improved AppleScript
-            script = '''
-            tell application "System Events"
-                set frontApp to name of first application process whose frontmost is true
-                -- Don't copy if we're the active app
-                if frontApp is not "Python" and frontApp is not "Synth" then
-                    keystroke "c" using command down
-                    delay 0.15
-                end if
-            end tell
+            # Back up every pasteboard type so we can faithfully restore them.
+            # dataForType_ covers text types too and returns None (doesn't raise)
+            # for a type the owner can't provide, so no per-type string fallback
+            types = pasteboard.types() or []
+            # Plain text only: the original_clipboard string restores it,
+            # no need for a per-type byte backup
+            if not set(types) <= _PLAINTEXT_PBOARD_TYPES:
+                saved_pasteboard_items = {
+                    t: data for t in types if (data := pasteboard.dataForType_(t)) is not None
+                } or None
             
-            -- Get clipboard content
-            set clipboardContent to the clipboard as text
-            return clipboardContent
-            '''
-            
-            result = subprocess.run(
-                ['osascript', '-e', script],
-                capture_output=True,
-                text=True,
-                timeout=3
-            )
+            # METHOD 1: Post ⌘C straight into the HID event stream and wait for
+            # the pasteboard changeCount to move (no osascript fork, no fixed delay)
+            front_app = NSWorkspace.sharedWorkspace().frontmostApplication()
+            # Don't copy if we're the active app
+            if front_app is not None and front_app.processIdentifier() != os.getpid():
+                initial_count = _pasteboard_change_count()
+                if HAS_QUARTZ:
+                    for key_down in (True, False):
+                        event = CGEventCreateKeyboardEvent(None, 8, key_down)  # kVK_ANSI_C
+                        CGEventSetFlags(event, kCGEventFlagMaskCommand)
+                        CGEventPost(kCGHIDEventTap, event)
+                else:
+                    # No Quartz bindings: run the cached, precompiled AppleScript
+                    # in-process rather than forking osascript
+                    _copy_selection_script().executeAndReturnError_(None)
+                # Up to ~50ms for the frontmost app to service the copy
+                for _ in range(20):
+                    if _pasteboard_change_count() != initial_count:
+                        break
+                    time.sleep(0.0025)
             
-            if result.returncode == 0 and result.stdout.strip():
-                selected_text = result.stdout.strip()
+            copied = pasteboard.stringForType_("public.utf8-plain-text")
+            if copied and copied.strip():
+                selected_text = copied.strip()
                 # Only return if it's different from original clipboard (means new text was selected)
                 if selected_text and selected_text != original_clipboard:
-                    print(f"✅ Captured selected text: {len(selected_text)} chars")
+                    logger.debug("Captured selected text: %d chars", len(selected_text))
                     # Restore the original clipboard so we don't surprise the user
                     try:
-                        pasteboard = NSPasteboard.generalPasteboard()
-                        pasteboard.clearContents()
+                        pasteboard = _PASTEBOARD
                         if saved_pasteboard_items:
-                            # Restore all types we captured
+                            # Restore all types we captured: one declaration (which
+                            # also clears the pasteboard), then fill in the data
+                            pasteboard.declareTypes_owner_(list(saved_pasteboard_items), None)
                             for k, v in saved_pasteboard_items.items():
-                                try:
-                                    if isinstance(v, str):
-                                        pasteboard.setString_forType_(v, k)
-                                    else:
-                                        pasteboard.setData_forType_(v, k)
-                                except Exception:
+                                if not pasteboard.setData_forType_(v, k) and original_clipboard:
                                     # Fall back to plaintext for safety
-                                    if original_clipboard:
-                                        pasteboard.setString_forType_(original_clipboard, "public.utf8-plain-text")
-                                        break
-                        elif original_clipboard:
-                            pasteboard.setString_forType_(original_clipboard, "public.utf8-plain-text")
+                                    pasteboard.clearContents()
+                                    pasteboard.setString_forType_(original_clipboard, "public.utf8-plain-text")
+                                    break
+                        else:
+                            pasteboard.clearContents()
+                            if original_clipboard:
+                                pasteboard.setString_forType_(original_clipboard, "public.utf8-plain-text")
                     except Exception as exc:
-                        print(f"⚠️ Failed to restore original clipboard: {exc}")
+                        logger.warning("Failed to restore original clipboard: %s", exc)
                     return selected_text
             
             # METHOD 2: Fallback - just read current clipboard
@@ -1800,18 +2404,18 @@ The plugin will automatically activate when relevant to your query."""
             return ""
             
         except Exception as e:
-            print(f"⚠️ Error capturing text: {e}")
+            logger.warning("Error capturing text: %s", e)
             # Final fallback - just read clipboard
             try:
-                pasteboard = NSPasteboard.generalPasteboard()
+                pasteboard = _PASTEBOARD
                 clipboard_text = pasteboard.stringForType_("public.utf8-plain-text")
                 return clipboard_text if clipboard_text else ""
             except:
                 return ""
         finally:
-            # Always restore original clipboard if it was changed by the AppleScript
+            # Always restore original clipboard if it was changed by the synthetic copy
             try:
-                pasteboard = NSPasteboard.generalPasteboard()
+                pasteboard = _PASTEBOARD
                 current = pasteboard.stringForType_("public.utf8-plain-text")
                 if saved_pasteboard_items:
                     # If we have a backup of items, ensure they are still set; otherwise restore
@@ -1862,17 +2466,13 @@ The plugin will automatically activate when relevant to your query."""
             
             # Keep black background in chat mode - no blue tint
             # Just slightly less transparent for better readability
-            chat_bg_color = NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.92)
-            chat_result_bg = NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.92)
-            
-            self.input_text_view.setBackgroundColor_(chat_bg_color)
-            self.result_view.setBackgroundColor_(chat_result_bg)
+            self.input_text_view.setBackgroundColor_(_COLOR_CHAT_BG)
+            self.result_view.setBackgroundColor_(_COLOR_CHAT_BG)
             
             # Update container background too
-            try:
-                self.input_container.layer().setBackgroundColor_(chat_bg_color.CGColor())
-            except:
-                pass
+            layer = self.input_container.layer()
+            if layer is not None:
+                layer.setBackgroundColor_(_CG_CHAT_BG)
             
             # Show chat mode message with clear instructions
             welcome_msg = """💬 Chat Mode Active
@@ -1896,7 +2496,7 @@ Ready to chat! What would you like to know?"""
             self.scroll_view.setHidden_(False)
             self.expand_view_for_content(250)
             
-            print("✅ Chat Mode ACTIVATED - Web search enabled, conversation memory active")
+            logger.debug("Chat mode activated - web search enabled, conversation memory active")
             
         else:
             # ═══════ DEACTIVATE CHAT MODE ═══════
@@ -1909,17 +2509,13 @@ Ready to chat! What would you like to know?"""
             self.screen_button.setEnabled_(True)
             
             # Restore original background colors - black, not blue
-            normal_input_bg = NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.88)
-            normal_result_bg = NSColor.colorWithRed_green_blue_alpha_(0.08, 0.08, 0.10, 0.88)
-            
-            self.input_text_view.setBackgroundColor_(normal_input_bg)
-            self.result_view.setBackgroundColor_(normal_result_bg)
+            self.input_text_view.setBackgroundColor_(_COLOR_FIELD_BG)
+            self.result_view.setBackgroundColor_(_COLOR_FIELD_BG)
             
             # Restore container background too
-            try:
-                self.input_container.layer().setBackgroundColor_(normal_input_bg.CGColor())
-            except:
-                pass
+            layer = self.input_container.layer()
+            if layer is not None:
+                layer.setBackgroundColor_(_CG_FIELD_BG)
             
             # Show exit message
             exit_msg = """✅ Exited Chat Mode
@@ -1937,14 +2533,14 @@ Use the buttons below for:
             self.scroll_view.setHidden_(False)
             self.expand_view_for_content(150)
             
-            print("❌ Chat Mode DEACTIVATED - Returned to normal mode")
+            logger.debug("Chat mode deactivated - returned to normal mode")
         
         # Focus input field
         self.prepare_prompt_entry()
     
     def handleScreen_(self, sender):
         """Handle Screen button"""
-        query = str(self.input_text_view.string()).strip()
+        query = self._input_text().strip()
         
         # Clear input text after Enter (show in output window instead)
         if query:
@@ -1966,7 +2562,7 @@ Use the buttons below for:
         - Remembers previous conversation
         - Logs to logs/chat_button/
         """
-        query = str(self.input_text_view.string()).strip()
+        query = self._input_text().strip()
         
         if not query:
             # Show conversation history if no input
@@ -1983,44 +2579,42 @@ Use the buttons below for:
         self.scroll_view.setHidden_(False)
         self.expand_view_for_content(100)
         
-        # Add user message to history
-        from datetime import datetime
-        self.chat_manager.add_message('user', query)
-        
-        # Show immediate progress
-        current_time = datetime.now().strftime("%I:%M:%S %p")
-        loading_msg = f"💬 Chat Mode\n\n[{current_time}] 👤 You:\n{query}\n\n"
-        self.safe_update_result(loading_msg + "💭 Processing...")
-        
-        import threading
-        import time as time_module
+        # Add user message to history and show it under the transcript right away
+        user_msg = self.chat_manager.add_message('user', query)
+        self.appendChatMessages_([user_msg])
+        self.setChatStatus_("💭 Processing...")
         
         def process_chat():
-            from datetime import datetime
-            import json
-            import os
-            import traceback
-            
-            # Create chat log directory
+            # Create session log file in the chat log directory
             log_dir = "logs/chat_button"
-            os.makedirs(log_dir, exist_ok=True)
-            
-            # Create session log file
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             log_file = os.path.join(log_dir, f"chat_session_{timestamp}.log")
+            # One handle for the whole turn instead of an open/close per event.
+            # A log that can't be opened (permissions, disk full) must not
+            # swallow the turn: say so and answer without it.
+            try:
+                os.makedirs(log_dir, exist_ok=True)
+                log_fh = open(log_file, 'a', buffering=1)
+            except OSError as e:
+                log_fh = None
+                logger.warning("Chat session log unavailable: %s", e)
+                self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                    "setChatStatus:", f"⚠️ Chat log unavailable ({e}) - continuing without it", False
+                )
             
             def log_event(event: str, data: dict):
                 """Log events to file"""
+                if log_fh is None:
+                    return
                 try:
-                    with open(log_file, 'a') as f:
-                        entry = {
-                            "timestamp": datetime.now().isoformat(),
-                            "event": event,
-                            "data": data
-                        }
-                        f.write(json.dumps(entry) + "\n")
+                    entry = {
+                        "timestamp": datetime.now().isoformat(),
+                        "event": event,
+                        "data": data
+                    }
+                    log_fh.write(json.dumps(entry) + "\n")
                 except Exception as e:
-                    print(f"⚠️ Logging error: {e}")
+                    logger.warning("Chat session logging error: %s", e)
             
             try:
                 # Log session start
@@ -2031,23 +2625,22 @@ Use the buttons below for:
                 context = self.chat_manager.get_context(last_n=10)
                 log_event("CONVERSATION_CONTEXT", {"length": len(context)})
                 
-                # Import ask_mode_agent function
-                from src.brain.agent_modes import ask_mode_agent
-                
                 # Use ask_mode_agent with ORIGINAL query for routing
                 # Context is stored in chat history, not needed for tool selection
-                print(f"💬 Chat mode - routing with original query: {query}")
+                logger.debug("Chat mode - routing with original query: %s", query)
                 
                 # Progress callback
                 def progress_cb(msg):
-                    self.safe_update_result(loading_msg + msg)
-                    print(f"📊 {msg}")
+                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                        "setChatStatus:", msg, False
+                    )
+                    logger.debug("Chat progress: %s", msg)
                 
                 # Logging callback
                 def log_cb(event, data):
                     log_event(event, data)
                     if event == "TOOL_SELECTED":
-                        print(f"🔧 Tool: {data.get('tool_name', 'unknown')}")
+                        logger.debug("Chat tool: %s", data.get('tool_name', 'unknown'))
                 
                 response = ask_mode_agent(
                     query,  # Use ORIGINAL query for proper tool routing!
@@ -2062,42 +2655,22 @@ Use the buttons below for:
                     response = response[1:].strip()
                 
                 # Add assistant response to history
-                self.chat_manager.add_message('assistant', response)
+                assistant_msg = self.chat_manager.add_message('assistant', response)
                 log_event("RESPONSE", {
                     "response_length": len(response),
                     "response_preview": response[:200]
                 })
                 
-                # Build conversation display (last 20 messages)
-                conversation_display = "💬 Chat Mode\n\n"
-                
-                messages_to_show = self.chat_manager.messages[-20:] if len(self.chat_manager.messages) > 20 else self.chat_manager.messages
-                
-                if len(self.chat_manager.messages) > 20:
-                    conversation_display += f"(Showing last 20 of {len(self.chat_manager.messages)} messages)\n\n"
-                
-                # Build conversation
-                for msg in messages_to_show:
-                    time_str = msg.timestamp.strftime("%I:%M:%S %p")
-                    if msg.role == 'user':
-                        conversation_display += f"[{time_str}] 👤 You:\n{msg.content}\n\n"
-                    else:
-                        conversation_display += f"[{time_str}] 🤖 Synth:\n{msg.content}\n\n"
-                
-                # Display
-                self.safe_update_result(conversation_display)
+                # Display: append just the reply to the on-screen transcript
+                self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                    "appendChatMessages:", [assistant_msg], False
+                )
                 
                 # Log timing
                 log_event("TIMING", {"stage": "total", "message": "Chat completed"})
                 
-                # Single scroll to bottom after display
-                time_module.sleep(0.05)
-                try:
-                    self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                        "forceScrollToBottom:", None, False
-                    )
-                except:
-                    pass
+                # No separate scroll dispatch: appendChatMessages_ scrolls to the
+                # bottom (and flashes the scrollers in chat mode) when it draws
                 
             except Exception as e:
                 error_msg = f"❌ Chat Error: {str(e)[:200]}\n\nPlease try again."
@@ -2109,15 +2682,16 @@ Use the buttons below for:
                     pass
                 
                 self.safe_update_result(error_msg)
-                print(f"❌ Full error:\n{traceback.format_exc()}")
+                logger.exception("Chat turn failed")
                 
                 # Log error
                 log_event("ERROR", {"error": str(e), "traceback": traceback.format_exc()})
+            finally:
+                if log_fh is not None:
+                    log_fh.close()
         
         # Run in background
-        thread = threading.Thread(target=process_chat)
-        thread.daemon = True
-        thread.start()
+        _CHAT_EXECUTOR.submit(process_chat)
     
     def handleQuery_(self, sender):
         """Handle ASK button - Fast intelligent agent with Live Tools
@@ -2128,7 +2702,7 @@ Use the buttons below for:
         - Fast: 1-5 seconds for Live Tools, 5-15s for web search
         - Full logging to logs/ask_button/ask_session_TIMESTAMP.log
         """
-        query = str(self.input_text_view.string()).strip()
+        query = self._input_text().strip()
         if not query:
             return
 
@@ -2142,19 +2716,27 @@ Use the buttons below for:
         # Show loading immediately
         self.safe_update_result("💭 Analyzing query...")
 
-        import threading
-        import time
-        import traceback
+        # Supersede any earlier Ask: drop it if still queued, mute it if running
+        if self._ask_future is not None and not self._ask_future.done():
+            self._ask_future.cancel()
+            self._ask_cancel.set()
+        cancelled = self._ask_cancel = threading.Event()
+
+        def update(msg):
+            if not cancelled.is_set():
+                self.safe_update_result(msg)
 
         def process_in_background():
             # ═══════════════════════════════════════════════════════════
             # STEP 1: Initialize Logger
             # ═══════════════════════════════════════════════════════════
-            from utils.ask_button_logger import get_logger
-            logger = get_logger()
+            if get_logger is None:
+                update("❌ Error: Ask logger (utils.ask_button_logger) is not installed")
+                return
+            ask_log = get_logger()
 
             start_time = time.time()
-            logger.log_query(query)
+            ask_log.log_query(query)
 
             try:
                 # ═══════════════════════════════════════════════════════════
@@ -2163,22 +2745,21 @@ Use the buttons below for:
                 clipboard_text = self.get_recent_clipboard_text()
 
                 if clipboard_text:
-                    logger.log_event("CLIPBOARD_CONTEXT", {"length": len(clipboard_text)})
-                    self.safe_update_result(f"� Using clipboard ({len(clipboard_text)} chars) | 🤖 Processing...")
+                    ask_log.log_event("CLIPBOARD_CONTEXT", {"length": len(clipboard_text)})
+                    update(f"� Using clipboard ({len(clipboard_text)} chars) | 🤖 Processing...")
 
                 # ═══════════════════════════════════════════════════════════
                 # STEP 3: Execute Agent (replaces all routing logic)
                 # ═══════════════════════════════════════════════════════════
-                from src.brain.agent_modes import ask_mode_agent
 
                 # Define log callback for detailed events
                 def log_event_callback(event_type, data):
-                    logger.log_event(event_type, data)
+                    ask_log.log_event(event_type, data)
 
                 response = ask_mode_agent(
                     query,
                     clipboard_text=None,  # ASK MODE = NO MEMORY!
-                    progress_callback=lambda msg: self.safe_update_result(msg),
+                    progress_callback=update,
                     log_callback=log_event_callback  # NEW: Detailed logging!
                 )
 
@@ -2187,14 +2768,14 @@ Use the buttons below for:
                 # ═══════════════════════════════════════════════════════════
                 total_time = time.time() - start_time
 
-                logger.log_response(response)
-                logger.log_timing("total", total_time)
+                ask_log.log_response(response)
+                ask_log.log_timing("total", total_time)
 
                 # ═══════════════════════════════════════════════════════════
                 # STEP 5: Update UI
                 # ═══════════════════════════════════════════════════════════
-                self.safe_update_result(response + f"\n\n⏱️ Completed in {total_time:.1f}s")
-                print(f"✅ Ask mode completed in {total_time:.1f}s")
+                update(response + f"\n\n⏱️ Completed in {total_time:.1f}s")
+                logger.info("✅ Ask mode completed in %.1fs", total_time)
 
             except Exception as e:
                 # ═══════════════════════════════════════════════════════════
@@ -2202,10 +2783,10 @@ Use the buttons below for:
                 # ═══════════════════════════════════════════════════════════
                 error_msg = str(e)
                 tb = traceback.format_exc()
-                logger.log_error(error_msg, tb)
+                ask_log.log_error(error_msg, tb)
 
                 total_time = time.time() - start_time
-                logger.log_timing("total_failed", total_time)
+                ask_log.log_timing("total_failed", total_time)
 
                 friendly_error = f"""❌ Error: {error_msg[:200]}
 
@@ -2213,17 +2794,15 @@ Something went wrong. Please try again or rephrase your question.
 
 Log file: logs/ask_button/ask_session_*.log"""
 
-                self.safe_update_result(friendly_error)
-                print(f"❌ Error:\n{tb}")
+                update(friendly_error)
+                logger.error("❌ Error:\n%s", tb)
 
-        # Run in background thread so Mac doesn't freeze
-        thread = threading.Thread(target=process_in_background)
-        thread.daemon = True
-        thread.start()
+        # Run on the Ask worker pool so Mac doesn't freeze
+        self._ask_future = _ASK_EXECUTOR.submit(process_in_background)
     
     def handleAgentQuery_(self, sender):
         """Handle AGENT button - Full autonomous mode with all 41 tools"""
-        query = str(self.input_text_view.string()).strip()
+        query = self._input_text().strip()
 
         if not query:
             return
@@ -2238,40 +2817,61 @@ Log file: logs/ask_button/ask_session_*.log"""
         # Show loading immediately
         self.result_view.setString_("🤖 Autonomous Agent Mode - Using all 41 tools...\n\nAnalyzing your request...")
 
-        import threading
-
         def process_in_background():
             try:
                 # Use the autonomous agent directly with execute_autonomous
-                from src.brain.agent_core import execute_autonomous
+                if execute_autonomous is None:
+                    self.safe_update_result(f"❌ Agent Error: {_AGENT_IMPORT_ERROR}")
+                    return
+                
+                # The router and select_tools both embed the query; embed it once
+                embed = functools.lru_cache(maxsize=1)(self.rag.get_embedding)
+                
+                # Plain knowledge questions don't need the tool loop - a direct
+                # answer is several LLM round-trips cheaper
+                route = route_agent_query(query, embed, embed_many=self.rag.get_embeddings)
+                logger.debug("Agent route: %s (%s)", route['action'], route['reason'])
+                if route['action'] == 'llm':
+                    self.safe_update_result("⚡ No tools needed - answering directly...")
+                    self.safe_update_result(self._ask_streaming(query, mode="fast"))
+                    return
                 
                 self.safe_update_result("🤖 Agent thinking...\n\nUsing: File operations, App control, System monitoring, AI processing, Web search...")
                 
+                # Narrow the 41 tools to the few closest to the request by embedding
+                # similarity (None when embeddings are unavailable: use them all)
+                tools = select_tools(query, embed, embed_many=self.rag.get_embeddings)
+                
                 # Execute with autonomous agent (uses LangGraph to pick tools)
-                result = execute_autonomous(query, max_retries=2, timeout=90)
+                result = execute_autonomous(query, max_retries=2, timeout=90, tools=tools)
                 
                 # Display result
                 self.safe_update_result(result)
                 
             except Exception as e:
-                import traceback
                 error_msg = f"❌ Agent Error: {str(e)}\n\n{traceback.format_exc()}"
                 self.safe_update_result(error_msg)
         
-        # Run in background thread so Mac doesn't freeze
-        thread = threading.Thread(target=process_in_background)
-        thread.daemon = True
-        thread.start()
+        # Run in background so Mac doesn't freeze
+        _BG_EXECUTOR.submit(process_in_background)
     
     def expand_view_for_content(self, content_height):
         """Expand the view to fit content - grows DOWNWARD from top-left anchor"""
+        if self.panel is None:
+            return  # Built (at its default size) on first open
         # Calculate new total height with guard rails
         result_height = min(self.max_result_height, max(100, content_height))
         new_total_height = result_height + 142  # Account for input + buttons (2 rows)
-        self.current_result_height = result_height
         
         # Store current top-left position
         panel_frame = self.panel.frame()
+        # Already this size (e.g. every streamed frame once the 700px cap is hit):
+        # skip the frame changes and the synchronous window redisplay
+        if (result_height == self.current_result_height
+                and panel_frame.size.height == new_total_height
+                and not self.scroll_border_box.isHidden()):
+            return
+        self.current_result_height = result_height
         original_top = panel_frame.origin.y + panel_frame.size.height
         
         # Resize scroll view (result area)
@@ -2288,50 +2888,34 @@ Log file: logs/ask_button/ask_session_*.log"""
         self.panel.setFrame_display_(panel_frame, True)
     
     def needs_web_search(self, query: str) -> bool:
+        """Determine if a query needs web search (RAG); see _needs_web_search"""
+        return _needs_web_search(query)
+    
+    def _ask_streaming(self, prompt, mode="balanced", max_tokens=None):
+        """brain.ask that draws the answer into the result view as it is generated.
+
+        Tokens are batched with a growing batch size - 1, 3, 9, 27, then 50 -
+        so typing shows up immediately but a long answer costs few redraws.
+        A batch is also flushed once 50ms have passed since the last update.
         """
-        Determine if a query needs web search (RAG)
-        
-        Returns True for:
-        - Current events, news, elections
-        - "What is", "Who is", "When did", "Explain"
-        - Recent/latest information
-        - Technical concepts, acronyms, standards
-        """
-        query_lower = query.lower()
-        
-        # Keywords that ALWAYS trigger web search
-        search_keywords = [
-            'latest', 'recent', 'current', 'news', 'today', 'yesterday',
-            'election', 'politics', 'score', 'weather', 'stock',
-            'what is', 'who is', 'when did', 'where is', 'how to',
-            'tell me about', 'information about', 'details about',
-            'research', 'find', 'search', 'explain', 'define',
-            'what are', 'what does', 'why is', 'why did'
-        ]
-        
-        # Check if any keyword is in the query
-        for keyword in search_keywords:
-            if keyword in query_lower:
-                return True
-        
-        # Check for technical indicators: acronyms, standards, year+technical term
-        # e.g., "ML-KEM", "FIPS 203", "2024 NIST"
-        words = query.split()
-        for word in words:
-            # Detect acronyms (2-10 caps letters with optional hyphens/numbers)
-            if len(word) >= 2 and any(c.isupper() for c in word) and any(c in word for c in ['-', '0', '1', '2', '3', '4', '5', '6', '7', '8', '9']):
-                return True
-        
-        # Long specific questions likely need research
-        if len(query.split()) >= 8 and '?' in query:
-            return True
-            
-        return False
+        buf = io.StringIO()
+        # Tokens since the last update, current batch size, time of the last update
+        state = [0, _STREAM_MIN_BATCH, time.monotonic()]
+
+        def on_chunk(piece):
+            buf.write(piece)
+            state[0] += 1
+            now = time.monotonic()
+            if state[0] >= state[1] or now - state[2] > 0.05:
+                self.safe_update_result(buf.getvalue())
+                state[0] = 0
+                state[1] = min(_STREAM_MAX_BATCH, state[1] * _STREAM_BATCH_GROWTH)
+                state[2] = now
+
+        return self.brain.ask_stream(prompt, mode=mode, max_tokens=max_tokens, on_chunk=on_chunk)
     
     def process_query(self, query):
         """Process query from Ask button - ALWAYS checks clipboard for highlighted text"""
-        import threading
-        
         # Show loading immediately
         self.result_view.setString_("🧠 Thinking...")
         
@@ -2345,7 +2929,7 @@ Log file: logs/ask_button/ask_session_*.log"""
                     enhanced_query = f"""QUESTION: {query}
 
 HIGHLIGHTED TEXT:
-{clipboard_text[:4000]}
+{_truncate_tokens(clipboard_text, _CLIPBOARD_TOKENS)}
 
 CRITICAL INSTRUCTIONS:
 - Answer ONLY based on the highlighted text above
@@ -2356,28 +2940,37 @@ CRITICAL INSTRUCTIONS:
 
 ANSWER:"""
                     
-                    result = self.brain.ask(enhanced_query, mode="balanced", max_tokens=400)
+                    cached, cache_slot = self.response_cache.get(query, clipboard_text, "ask_clipboard")
+                    if cached:
+                        self.safe_update_result(cached)
+                        return
+                    result = self._ask_streaming(enhanced_query, mode="balanced", max_tokens=400)
                     try:
                         from src.brain.tools_gemini import LAST_USED_MODEL
-                        print(f"Model used (Ask button): {LAST_USED_MODEL}")
+                        logger.debug("Model used (Ask button): %s", LAST_USED_MODEL)
                     except Exception:
                         pass
+                    self.response_cache.put(cache_slot, result)
                     self.safe_update_result(result)
                     return
                 elif self.captured_clipboard and not clipboard_text:
                     # Clipboard exists but expired/too short - guide user silently
-                    print("⚠️ Captured clipboard text is stale or too short. Waiting for a fresh Cmd+C event.")
+                    logger.debug("⚠️ Captured clipboard text is stale or too short. Waiting for a fresh Cmd+C event.")
                 
                 # No captured clipboard - continue with normal flow (web search/plugins)
                 # Check if query needs web search (RAG)
                 if self.needs_web_search(query):
+                    # Answered recently? Skip both the search and the LLM
+                    cached, cache_slot = self.response_cache.get(query, "", "ask_web")
+                    if cached:
+                        self.safe_update_result(cached)
+                        return
                     self.safe_update_result("🔍 Searching web for latest information...")
                     
                     # Perform web search
                     search_results = self.web_search.search(query, include_news=True)
                     
                     if search_results['sources_count'] > 0:
-                        from datetime import datetime
                         current_date = datetime.now().strftime("%B %d, %Y")
                         
                         # Create enhanced prompt with web context
@@ -2395,15 +2988,10 @@ ANSWER:"""
                         self.safe_update_result(f"✅ Found {search_results['sources_count']} sources. Analyzing...\n\n🧠 Generating answer...")
                         
                         # Send to Brain with web context
-                        result = self.brain.ask(enhanced_query, mode="balanced")
-                        try:
-                            from src.brain.tools_gemini import LAST_USED_MODEL
-                            print(f"Model used (Web RAG): {LAST_USED_MODEL}")
-                        except Exception:
-                            pass
+                        result = self._ask_streaming(enhanced_query, mode="balanced")
                         try:
                             from src.brain.tools_gemini import LAST_USED_MODEL
-                            print(f"Model used (Web RAG): {LAST_USED_MODEL}")
+                            logger.debug("Model used (Web RAG): %s", LAST_USED_MODEL)
                         except Exception:
                             pass
                         
@@ -2412,6 +3000,7 @@ ANSWER:"""
                         for i, res in enumerate(search_results['results'][:5], 1):
                             sources_text += f"{i}. {res.title}\n   {res.source}\n"
                         
+                        self.response_cache.put(cache_slot, result + sources_text)
                         self.safe_update_result(result + sources_text)
                         return
                     else:
@@ -2419,8 +3008,6 @@ ANSWER:"""
                         self.safe_update_result("⚠️ No web results found. Using AI knowledge...\n\n")
                 
                 # STEP 2: Try plugins - use query as clipboard_text
-                from src.plugins.base_plugin import PluginContext
-                
                 context = PluginContext(
                     clipboard_text=query,  # Treat query as clipboard text
                     content_type="text"
@@ -2457,23 +3044,25 @@ ANSWER:"""
                 
                 else:
                     # STEP 3: No plugin matched, use Brain directly
-                    result = self.brain.ask(query, mode="balanced")
+                    cached, cache_slot = self.response_cache.get(query, "", "ask")
+                    if cached:
+                        self.safe_update_result(cached)
+                        return
+                    result = self._ask_streaming(query, mode="balanced")
                     try:
                         from src.brain.tools_gemini import LAST_USED_MODEL
-                        print(f"Model used (Fallback): {LAST_USED_MODEL}")
+                        logger.debug("Model used (Fallback): %s", LAST_USED_MODEL)
                     except Exception:
                         pass
+                    self.response_cache.put(cache_slot, result)
                     self.safe_update_result(result)
                 
             except Exception as e:
-                import traceback
                 error_msg = f"❌ Error: {str(e)}\n\n{traceback.format_exc()}"
                 self.safe_update_result(error_msg)
         
-        # Run in background thread so Mac doesn't freeze
-        thread = threading.Thread(target=process_in_background)
-        thread.daemon = True
-        thread.start()
+        # Run in background so Mac doesn't freeze
+        _BG_EXECUTOR.submit(process_in_background)
     
     def process_query_with_context(self, query, selected_text):
         """
@@ -2485,35 +3074,19 @@ ANSWER:"""
         # Ensure input is editable and selectable
         self.input_text_view.setEditable_(True)
         self.input_text_view.setSelectable_(True)
-        # Avoid using field editor behavior inside menu panel (can interfere with rendering)
-        try:
-            self.input_text_view.setFieldEditor_(False)
-        except:
-            # If not available, ignore
-            pass
         def process_in_background():
-            query_lower = query.lower()
-
-            # A. Extract specific terms from query (e.g., "what is FIPS 203")
-            query_terms_to_search = []
-
-            # Pattern: "what is X", "explain X", "define X"
-            what_is_match = re.search(r'what\s+is\s+([A-Z0-9\s\-]+?)(?:\?|$|in)', query, re.IGNORECASE)
-            if what_is_match:
-                query_terms_to_search.append(what_is_match.group(1).strip())
-
-            explain_match = re.search(r'explain\s+([A-Z0-9\s\-]+?)(?:\?|$|in)', query, re.IGNORECASE)
-            if explain_match:
-                query_terms_to_search.append(explain_match.group(1).strip())
+            # Same question about the same selection: reuse the answer, skip RAG/web/LLM
+            cached, cache_slot = self.response_cache.get(query, selected_text, "context")
+            if cached:
+                self.safe_update_result(cached)
+                return
 
-            # B. Extract technical terms from clipboard
-            # Pattern 1: All-caps acronyms (BAKE, NIST, ML-KEM)
-            acronym_pattern = r'\b[A-Z][A-Z0-9\-]{2,15}\b'
-            clipboard_acronyms = list(set(re.findall(acronym_pattern, selected_text)))
+            query_lower = query.lower()
 
-            # Pattern 2: CAPS + numbers (FIPS 203, ISO 27001)
-            caps_num_pattern = r'\b[A-Z]+\s+\d{2,5}\b'
-            clipboard_standards = list(set(re.findall(caps_num_pattern, selected_text)))
+            # Query terms ("what is X", "explain X") plus clipboard acronyms and
+            # standards; memoized, so a repeated Ask skips the regex passes
+            query_terms_to_search, clipboard_acronyms, clipboard_standards = \
+                _extract_terms(query, selected_text)
 
             # Combine all technical terms
             all_technical_terms = query_terms_to_search + clipboard_acronyms + clipboard_standards
@@ -2522,18 +3095,18 @@ ANSWER:"""
             # DON'T add clipboard to RAG - causes pollution
             # We'll use clipboard directly in context instead
 
-            # STEP 2: Query RAG for relevant context (from previous knowledge only)
-            self.safe_update_result("💾 Searching local knowledge base...")
-            rag_result = self.rag.query(query, top_k=3, min_score=0.5)
-
-            # Add web search results to RAG too
-            self.safe_update_result("🌐 Searching web for additional context...")
-
-            # STEP 3: ALWAYS search web if we have technical terms OR explanatory query
+            # STEP 2: ALWAYS search web if we have technical terms OR explanatory query
             needs_web = (all_technical_terms and len(all_technical_terms) > 0) or \
                        any(word in query_lower for word in ['explain', 'what', 'define', 'meaning', 'describe'])
 
             if needs_web:
+                # STEP 3: Query RAG for relevant context (from previous knowledge only),
+                # in the background while the web searches below run
+                self.safe_update_result("💾 Searching local knowledge base and web...")
+                # (reusing the embedding the response cache lookup already computed)
+                rag_future = _IO_EXECUTOR.submit(self.rag.query, query, top_k=3, min_score=0.5,
+                                                 query_embedding=cache_slot.embedding if cache_slot else None)
+
                 # FORCE web search for better context - show brief preview
                 if all_technical_terms:
                     terms_preview = ', '.join(all_technical_terms[:5])
@@ -2565,12 +3138,19 @@ ANSWER:"""
                 if not terms_to_search:
                     terms_to_search = [query]
 
-                # Search for each term
-                for term in terms_to_search[:4]:  # Limit to 4 searches
+                # Search for each term - all at once, results kept in priority order
+                selected_lower = selected_text.lower()
+                has_crypto_ctx = any(word in selected_lower for word in ('crypto', 'security', 'key'))
+                futures = [
+                    (term, _IO_EXECUTOR.submit(
+                        self.web_search.search,
+                        f"{term} cryptography" if has_crypto_ctx else term,  # Search with context keywords
+                        include_news=False))
+                    for term in terms_to_search[:4]  # Limit to 4 searches
+                ]
+                for term, future in futures:
                     try:
-                        # Search with context keywords
-                        search_query = f"{term} cryptography" if any(word in selected_text.lower() for word in ['crypto', 'security', 'key']) else term
-                        search_results = self.web_search.search(search_query, include_news=False)
+                        search_results = future.result(timeout=10)
 
                         if search_results['sources_count'] > 0:
                             all_search_results.extend(search_results['results'][:2])
@@ -2578,39 +3158,49 @@ ANSWER:"""
                             term_preview = term[:30] + '...' if len(term) > 30 else term
                             self.safe_update_result(f"🔍 {term_preview}")
                     except Exception as e:
-                        print(f"Search failed for {term}: {e}")
+                        logger.warning("Search failed for %s: %s", term, e)
 
                 # Build comprehensive context
-                from datetime import datetime
                 current_date = datetime.now().strftime("%B %d, %Y")
 
+                # Join before adding this query's web results, so RAG only
+                # reflects previous knowledge
+                rag_result = rag_future.result()
+
                 # Add web results to RAG for future reference
                 if all_search_results:
                     self.rag.add_web_results(all_search_results, query)
 
+                # Keep the top 6 by priority, then lay them out in content-hash order:
+                # overlapping sources produce a byte-identical prompt prefix, so
+                # Ollama/Gemini prompt caching can reuse it
+                prompt_results = sorted(all_search_results[:6], key=lambda r: _stable_order_key(r.title))
                 web_context = ""
-                if all_search_results:
+                if prompt_results:
                     web_context = "\n\nWEB SEARCH RESULTS:\n"
-                    for i, res in enumerate(all_search_results[:6], 1):
+                    for i, res in enumerate(prompt_results, 1):
                         web_context += f"{i}. {res.title}\n   {res.snippet[:200]}...\n   Source: {res.source}\n\n"
 
                 # Build RAG context
                 rag_context = ""
                 if rag_result['has_context']:
                     rag_context = "\n\nKNOWLEDGE BASE:\n"
-                    for i, source in enumerate(rag_result['sources'], 1):
+                    rag_sources = sorted(rag_result['sources'], key=lambda src: _stable_order_key(src['text']))
+                    for i, source in enumerate(rag_sources, 1):
                         rag_context += f"[{i}] {source['text'][:200]}... (score: {source['score']:.2f})\n\n"
 
-                # Create COMPREHENSIVE prompt with RAG + Web + Clipboard
-                enhanced_prompt = f"""CURRENT DATE: {current_date}
-
-QUESTION: {query}
-
-CONTEXT FROM USER'S SELECTED TEXT:
-{selected_text[:2500]}
+                # Create COMPREHENSIVE prompt with RAG + Web + Clipboard. Context
+                # first, then the per-request date/question, for the longest
+                # reusable prefix
+                enhanced_prompt = f"""CONTEXT FROM USER'S SELECTED TEXT:
+{_truncate_tokens(selected_text, _SELECTION_TOKENS)}
 {rag_context}
 {web_context}
 
+CURRENT DATE: {current_date}
+
+QUESTION: {query}
+
 INSTRUCTIONS:
 - Answer the user's question clearly and directly in ENGLISH ONLY
 - Use information from ALL sources: selected text, knowledge base, and web search results
@@ -2626,50 +3216,46 @@ ANSWER:"""
                 self.safe_update_result(f"✅ Found {sources_found} total sources (RAG: {len(rag_result['sources'])}, Web: {len(all_search_results)})\n🧠 Generating comprehensive answer...")
 
                 # Increase max_tokens for comprehensive answer
-                result = self.brain.ask(enhanced_prompt, mode="balanced", max_tokens=800)
-                try:
-                    from src.brain.tools_gemini import LAST_USED_MODEL
-                    print(f"Model used (RAG+Web comprehensive): {LAST_USED_MODEL}")
-                except Exception:
-                    pass
+                result = self._ask_streaming(enhanced_prompt, mode="balanced", max_tokens=800)
                 try:
                     from src.brain.tools_gemini import LAST_USED_MODEL
-                    print(f"Model used (RAG+Web): {LAST_USED_MODEL}")
+                    logger.debug("Model used (RAG+Web comprehensive): %s", LAST_USED_MODEL)
                 except Exception:
                     pass
 
                 # Add sources
-                if all_search_results:
+                if prompt_results:
                     sources_text = "\n\n📚 Sources:\n"
-                    for i, res in enumerate(all_search_results[:6], 1):
+                    # Same numbering as the prompt, so citations line up
+                    for i, res in enumerate(prompt_results, 1):
                         sources_text += f"{i}. {res.title} ({res.source})\n"
                     result += sources_text
 
+                self.response_cache.put(cache_slot, result)
                 self.safe_update_result(result)
             else:
                 # Simple context query - no web search needed
                 enhanced_prompt = f"""QUESTION: {query}
 
 SELECTED TEXT:
-{selected_text[:4000]}
+{_truncate_tokens(selected_text, _SELECTION_ONLY_TOKENS)}
 
 Please answer the question about the selected text above. Be clear, detailed, and accurate. Answer in ENGLISH ONLY.
 
 ANSWER:"""
 
                 self.safe_update_result("🧠 Analyzing with AI...")
-                result = self.brain.ask(enhanced_prompt, mode="balanced", max_tokens=600)
+                result = self._ask_streaming(enhanced_prompt, mode="balanced", max_tokens=600)
                 try:
                     from src.brain.tools_gemini import LAST_USED_MODEL
-                    print(f"Model used (Simple context): {LAST_USED_MODEL}")
+                    logger.debug("Model used (Simple context): %s", LAST_USED_MODEL)
                 except Exception:
                     pass
+                self.response_cache.put(cache_slot, result)
                 self.safe_update_result(result)
 
-        # Run in background thread
-        thread = threading.Thread(target=process_in_background)
-        thread.daemon = True
-        thread.start()
+        # Run in background
+        _BG_EXECUTOR.submit(process_in_background)
     
     def safe_update_result(self, text):
         """Safely update result view from any thread"""
@@ -2686,46 +3272,183 @@ ANSWER:"""
                 return
         except Exception:
             pass
-        try:
-            # Use performSelectorOnMainThread to safely update UI
-            self.performSelectorOnMainThread_withObject_waitUntilDone_(
-                "updateResultText:", text, False
-            )
-        except Exception:
-            # Fallback: directly set (may work in some environments)
+        if threading.current_thread() is threading.main_thread():
+            # Main-thread writes win over anything a worker left pending
+            with self._pending_lock:
+                self._pending_result = None
+            self._deferred_result = None
+            self.updateResultText_(text)
+            return
+        # Worker threads only overwrite the pending slot; the first write after
+        # a drain arms the timer, so a burst of progress ticks becomes one redraw
+        with self._pending_lock:
+            arm = self._pending_result is None
+            self._pending_result = text
+        if arm:
             try:
-                self.result_view.setString_(text)
-                text_height = len(text) / 2
-                self.expand_view_for_content(text_height)
+                self.performSelectorOnMainThread_withObject_waitUntilDone_(
+                    "scheduleResultDrain:", None, False
+                )
             except Exception:
-                # Last resort: ignore UI update failure
                 pass
 
+    def scheduleResultDrain_(self, _):
+        """Arm a one-shot timer that draws the latest pending result (main thread)"""
+        NSTimer.scheduledTimerWithTimeInterval_target_selector_userInfo_repeats_(
+            _RESULT_DRAIN_INTERVAL, self, "drainPendingResult:", None, False
+        )
+
+    def drainPendingResult_(self, timer):
+        """Draw whatever result text is pending, skipping repeats"""
+        with self._pending_lock:
+            text = self._pending_result
+            self._pending_result = None
+        if text is None or text == self._last_drawn_result:
+            return
+        # Nobody can see the result view (or it isn't built yet): keep the
+        # text, skip layout until shown
+        if (self.panel is None or not self.panel.isVisible()
+                or self.scroll_border_box.isHidden()):
+            self._deferred_result = text
+            return
+        self.updateResultText_(text)
+
     def updateResultText_(self, text):
         """Update result view on the main thread (selector method - note the trailing underscore)."""
+        if self.panel is None:
+            # Panel not built yet (e.g. a result before the first open): draw on open
+            self._deferred_result = text
+            return
+        prev = self._last_drawn_result
+        self._last_drawn_result = text
+        self._chat_blocks = None  # Replaces any chat transcript on screen
         try:
-            self.result_view.setString_(text)
-            # ⭐ FORCE MONOSPACE FONT AFTER TEXT UPDATE ⭐
-            mono_font = NSFont.monospacedSystemFontOfSize_weight_(12, 0)
-            try:
-                text_storage = self.result_view.textStorage()
-                full_range = (0, text_storage.length())
-                text_storage.addAttribute_value_range_("NSFont", mono_font, full_range)
-            except:
-                pass
-            # Calculate height based on text length (optimized for longer content)
-            line_count = text.count('\n') + 1
-            # Allow more room for longer text, max 700px for scrolling
-            text_height = max(80, min(700, line_count * 18 + 40))
-            self.expand_view_for_content(text_height)
-            # CRITICAL: Force immediate layout calculation BEFORE scrolling
-            # This prevents the "lag" where scroll happens before height calculation
-            self.result_view.layoutManager().ensureLayoutForTextContainer_(self.result_view.textContainer())
-            # FORCE scroll to bottom after text update - scroll PAST the end
-            text_length = len(str(self.result_view.string()))
-            if text_length > 0:
-                # Scroll past the end to ensure we're at the very bottom
-                self.result_view.scrollRangeToVisible_((text_length + 100, 0))
+            text_storage = self.result_view.textStorage()
+            # ⭐ MONOSPACE FONT ⭐ - carried in _RESULT_TEXT_ATTRS, so the text arrives
+            # already styled instead of getting a separate font pass afterwards
+            if (prev and text.startswith(prev)
+                    and text_storage.length() == self._result_len):
+                # Streaming append: only the new tail gets styled and laid out
+                tail = text[len(prev):]
+                text_storage.appendAttributedString_(
+                    NSAttributedString.alloc().initWithString_attributes_(tail, _RESULT_TEXT_ATTRS)
+                )
+                self._result_lines += tail.count('\n')
+            else:
+                # Clear/rewrite (or the view was set elsewhere): full replace
+                text_storage.setAttributedString_(
+                    NSAttributedString.alloc().initWithString_attributes_(text, _RESULT_TEXT_ATTRS)
+                )
+                self._result_lines = text.count('\n') + 1
+            self._result_len = text_storage.length()
+            self._fit_and_scroll_result(self._result_lines)
+        except Exception:
+            pass
+
+    def _fit_and_scroll_result(self, line_count):
+        """Size the result area for line_count lines and scroll to the end (main thread)"""
+        if self.panel is None:
+            return
+        # Allow more room for longer text, max 700px for scrolling
+        text_height = max(80, min(700, line_count * 18 + 40))
+        self.expand_view_for_content(text_height)
+        # CRITICAL: Force immediate layout calculation BEFORE scrolling
+        # This prevents the "lag" where scroll happens before height calculation
+        self.result_view.layoutManager().ensureLayoutForTextContainer_(self.result_view.textContainer())
+        # FORCE scroll to bottom after text update - scroll PAST the end
+        text_length = self._result_len
+        if text_length > 0:
+            # Scroll past the end to ensure we're at the very bottom
+            self.result_view.scrollRangeToVisible_((text_length + 100, 0))
+            if self.chat_mode_active:
+                # Chat transcripts grow long; show where the scroller landed
+                self.scroll_view.flashScrollers()
+
+    def _chat_header_text(self):
+        total = len(self.chat_manager.messages)
+        if total > _CHAT_DISPLAY_LIMIT:
+            return f"💬 Chat Mode\n\n(Showing last {_CHAT_DISPLAY_LIMIT} of {total} messages)\n\n"
+        return "💬 Chat Mode\n\n"
+
+    def _render_chat_transcript(self):
+        """Draw the whole chat transcript and start tracking it for appends (main thread)"""
+        header = self._chat_header_text()
+        blocks = [_chat_block(m) for m in self.chat_manager.messages[-_CHAT_DISPLAY_LIMIT:]]
+        self.updateResultText_(header + "".join(blocks))
+        self._chat_header = header
+        self._chat_blocks = [(_utf16_len(b), b.count('\n')) for b in blocks]
+        self._chat_status = ""
+
+    def _chat_line_count(self):
+        return (self._chat_header.count('\n') + sum(lines for _, lines in self._chat_blocks)
+                + self._chat_status.count('\n') + 1)
+
+    def appendChatMessages_(self, messages):
+        """Add messages to the end of the chat transcript, laying out only the new text (main thread)"""
+        if self.panel is None:
+            return  # Messages are in chat_manager; the transcript is drawn in chat mode
+        # Anything a worker left pending is older than this turn
+        with self._pending_lock:
+            self._pending_result = None
+        self._deferred_result = None
+        if self._chat_blocks is None:
+            # The view shows something else; messages are already in chat_manager
+            self._render_chat_transcript()
+            return
+        try:
+            text_storage = self.result_view.textStorage()
+            text_storage.beginEditing()
+            # The progress line belongs below the newest message, so drop it first
+            if self._chat_status:
+                status_len = _utf16_len(self._chat_status)
+                text_storage.deleteCharactersInRange_((text_storage.length() - status_len, status_len))
+                self._chat_status = ""
+            for msg in messages:
+                block = _chat_block(msg)
+                text_storage.appendAttributedString_(
+                    NSAttributedString.alloc().initWithString_attributes_(block, _RESULT_TEXT_ATTRS)
+                )
+                self._chat_blocks.append((_utf16_len(block), block.count('\n')))
+            # Past the display limit: trim the oldest blocks from the front
+            header_len = _utf16_len(self._chat_header)
+            excess = len(self._chat_blocks) - _CHAT_DISPLAY_LIMIT
+            if excess > 0:
+                dropped = sum(length for length, _ in self._chat_blocks[:excess])
+                del self._chat_blocks[:excess]
+                text_storage.deleteCharactersInRange_((header_len, dropped))
+            # The "Showing last N of M" count changes as the history grows
+            header = self._chat_header_text()
+            if header != self._chat_header:
+                text_storage.replaceCharactersInRange_withAttributedString_(
+                    (0, header_len),
+                    NSAttributedString.alloc().initWithString_attributes_(header, _RESULT_TEXT_ATTRS),
+                )
+                self._chat_header = header
+            text_storage.endEditing()
+            self._last_drawn_result = None  # Storage no longer matches any drawn string
+            self._result_len = text_storage.length()
+            self._fit_and_scroll_result(self._chat_line_count())
+        except Exception:
+            pass
+
+    def setChatStatus_(self, text):
+        """Replace the progress line under the chat transcript (main thread)"""
+        if self.panel is None:
+            return
+        text = str(text)
+        if self._chat_blocks is None:
+            self._render_chat_transcript()
+        try:
+            text_storage = self.result_view.textStorage()
+            status_len = _utf16_len(self._chat_status)
+            text_storage.replaceCharactersInRange_withAttributedString_(
+                (text_storage.length() - status_len, status_len),
+                NSAttributedString.alloc().initWithString_attributes_(text, _RESULT_TEXT_ATTRS),
+            )
+            self._chat_status = text
+            self._last_drawn_result = None
+            self._result_len = text_storage.length()
+            self._fit_and_scroll_result(self._chat_line_count())
         except Exception:
             pass
     
@@ -2752,35 +3475,12 @@ ANSWER:"""
         except Exception:
             pass
     
-    def forceScrollToBottom_(self, _):
-        """FORCE scroll to bottom with scrollbar flash"""
-        try:
-            # Force layout calculation BEFORE scrolling
-            self.result_view.layoutManager().ensureLayoutForTextContainer_(self.result_view.textContainer())
-            
-            # Get text length
-            text_length = len(str(self.result_view.string()))
-            if text_length > 0:
-                # Scroll past very end to ensure absolute bottom
-                self.result_view.scrollRangeToVisible_((text_length + 100, 0))
-                
-                # Flash scrollers to make them visible
-                try:
-                    self.scroll_view.flashScrollers()
-                except:
-                    pass
-        except Exception:
-            pass
-    
     def quickScreenAnalysis_(self, sender):
         """Quick screen analysis from menu"""
         self.analyze_screen_with_query("what's on the screen")
     
     def analyze_screen_with_query(self, query):
         """Analyze screen content - ALWAYS captures entire screen, no clipboard"""
-        import time
-        import threading
-        
         def capture_and_analyze():
             try:
                 # Screen button = capture ENTIRE screen, NOT clipboard
@@ -2790,6 +3490,10 @@ ANSWER:"""
                 needs_search = self.needs_web_search(query)
                 
                 if needs_search:
+                    cached, cache_slot = self.response_cache.get(query, "", "screen_web")
+                    if cached:
+                        self.safe_update_result(cached)
+                        return
                     # User wants web search, not screen analysis
                     self.safe_update_result("🔍 This looks like a research question. Searching web instead of screen...")
                     time.sleep(1)
@@ -2798,7 +3502,6 @@ ANSWER:"""
                     search_results = self.web_search.search(query, include_news=True)
                     
                     if search_results['sources_count'] > 0:
-                        from datetime import datetime
                         current_date = datetime.now().strftime("%B %d, %Y")
                         
                         # Create enhanced prompt with web context
@@ -2813,19 +3516,23 @@ IMPORTANT: Provide a comprehensive answer based ONLY on the web search results a
                         self.safe_update_result(f"✅ Found {search_results['sources_count']} sources. Analyzing...\n\n🧠 Generating answer...")
                         
                         # Send to Brain with web context
-                        result = self.brain.ask(enhanced_query, mode="balanced")
+                        result = self._ask_streaming(enhanced_query, mode="balanced")
                         
                         # Add sources at the end
                         sources_text = "\n\n📚 Sources:\n"
                         for i, res in enumerate(search_results['results'][:5], 1):
                             sources_text += f"{i}. {res.title} ({res.source})\n"
                         
+                        self.response_cache.put(cache_slot, result + sources_text)
                         self.safe_update_result(result + sources_text)
                         return
                     else:
                         self.safe_update_result("⚠️ No web results. Analyzing screen instead...\n\n")
                 
-                # Continue with screen analysis
+                # Continue with screen analysis. The screenshot itself must wait
+                # for the countdown (it gives the user time to bring the content
+                # up), but loading the OCR model doesn't
+                _IO_EXECUTOR.submit(self._warm_ocr)
                 for i in range(2, 0, -1):
                     self.safe_update_result(f"📸 Capturing in {i}s...")
                     time.sleep(1)
@@ -2834,50 +3541,95 @@ IMPORTANT: Provide a comprehensive answer based ONLY on the web search results a
                 
                 if screenshot_img:
                     try:
-                        import pytesseract
-                        
                         self.safe_update_result("🔍 Reading screen...")
-                        extracted_text = pytesseract.image_to_string(screenshot_img)
+                        extracted_text = _ocr_cached(screenshot_img, self._ocr_text)
                         
                         if extracted_text and len(extracted_text.strip()) > 10:
                             self.safe_update_result(f"🧠 Analyzing ({len(extracted_text.split())} words)...")
                             
-                            # SCREEN ANALYSIS PROMPT
-                            full_query = f"""USER REQUEST: "{query}"
+                            # SCREEN ANALYSIS PROMPT (static instructions first)
+                            full_query = _SCREEN_PROMPT_PREFIX + f"""
 
-SCREEN CONTENT:
-{extracted_text[:6000]}
+USER REQUEST: "{query}"
 
-Instructions:
-1. The user wants help with what's VISIBLE on their screen
-2. If they ask to "explain" or "summarize": Focus on the screen content
-3. If they ask to "draft reply": Use names/context from screen
-4. Answer their request using the screen content as primary source
-5. Keep it natural and helpful
-6. Answer in ENGLISH ONLY - no other languages
+SCREEN CONTENT:
+{_truncate_tokens(extracted_text, _SCREEN_TOKENS)}
 
 Respond directly to their request:"""
 
-                            result = self.brain.ask(full_query, mode="balanced", max_tokens=800)
+                            # Keyed on the OCR text: an unchanged screen reuses the answer
+                            cached, cache_slot = self.response_cache.get(query, extracted_text, "screen")
+                            if cached:
+                                self.safe_update_result(cached)
+                                return
+                            result = self._ask_streaming(full_query, mode="balanced", max_tokens=800)
+                            self.response_cache.put(cache_slot, result)
                             self.safe_update_result(result)
                             
                         else:
                             self.safe_update_result("⚠️ No text found on screen")
                     except ImportError:
-                        self.safe_update_result("❌ OCR not available\n\nInstall: pip install pytesseract")
+                        self.safe_update_result("❌ OCR not available\n\nInstall: pip install tesserocr (or pytesseract)")
                 else:
                     self.safe_update_result("❌ Screenshot failed")
             except Exception as e:
                 self.safe_update_result(f"❌ Error: {str(e)}")
         
-        # Run EVERYTHING in background thread - no freezing!
-        thread = threading.Thread(target=capture_and_analyze)
-        thread.daemon = True
-        thread.start()
+        # Run EVERYTHING in background - no freezing!
+        _BG_EXECUTOR.submit(capture_and_analyze)
+    
+    def _tess_api_locked(self):
+        """The persistent tesserocr API, loading the model on first use (hold _tess_lock)"""
+        if self._tess_api is None:
+            self._tess_api = PyTessBaseAPI(lang="eng", psm=PSM.AUTO)
+        return self._tess_api
+    
+    def _warm_ocr(self):
+        """Load the Tesseract model while the capture countdown runs"""
+        if PyTessBaseAPI is not None:
+            with self._tess_lock:
+                self._tess_api_locked()
+    
+    def _ocr_text(self, img):
+        """OCR img with one persistent tesserocr API, else a pytesseract subprocess"""
+        img = self.screen_capture.prepare_for_ocr(img)
+        if PyTessBaseAPI is not None:
+            # Recognize block by block in reading order and stop once the
+            # prompt's screen budget is full - text past it would be cut by
+            # _truncate_tokens anyway, so the LLM call starts that much sooner
+            limit = _token_prefix_chars(_SCREEN_TOKENS)
+            with self._tess_lock:
+                api = self._tess_api_locked()
+                api.SetImage(img)
+                blocks = api.GetComponentImages(RIL.BLOCK, True)
+                if not blocks:
+                    return api.GetUTF8Text()
+                parts, size = [], 0
+                for _, box, _, _ in blocks:
+                    api.SetRectangle(box['x'], box['y'], box['w'], box['h'])
+                    part = api.GetUTF8Text()
+                    parts.append(part)
+                    size += len(part)
+                    if size >= limit:
+                        break
+                return "".join(parts)
+        if pytesseract is None:
+            raise ImportError("No OCR engine installed")  # reported by capture_and_analyze
+        return pytesseract.image_to_string(img)
     
     def applicationWillTerminate_(self, notification):
         """Called when the app is about to quit - ensure tunnel cleanup"""
-        print("\n⚠️  Application terminating - Cleaning up SSH tunnel...")
+        self.stop_clipboard_monitor()
+        self.remove_click_monitor()
+        _ASK_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _CHAT_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _BG_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        _IO_EXECUTOR.shutdown(wait=False, cancel_futures=True)
+        with self._tess_lock:
+            if self._tess_api is not None:
+                self._tess_api.End()
+                self._tess_api = None
+        logger.info("⚠️  Application terminating - Cleaning up SSH tunnel...")
         cleanup_tunnel()
     
     def show_notification(self, title, subtitle, message):
@@ -2898,13 +3650,15 @@ Respond directly to their request:"""
 
 def signal_handler(signum, frame):
     """Handle termination signals (SIGTERM, SIGINT) to ensure cleanup"""
-    print(f"\n⚠️  Received signal {signum} - Cleaning up before exit...")
+    logger.info("⚠️  Received signal %s - Cleaning up before exit...", signum)
     cleanup_tunnel()
     sys.exit(0)
 
 
 def main():
     """Main entry point"""
+    # Status goes through logging; SYNTH_LOG_LEVEL=DEBUG shows per-step detail
+    logging.basicConfig(level=os.getenv("SYNTH_LOG_LEVEL", "INFO").upper(), format="%(message)s")
     print("🚀 Starting Synth Menu Bar (Native)...")
     
     # ═══════════════════════════════════════════════════════════
@@ -2920,7 +3674,7 @@ def main():
     # STEP 2: Start SSH Tunnel to Delta Brain
     # ═══════════════════════════════════════════════════════════
     print("🔌 Initializing Delta Brain Connection...")
-    start_ssh_tunnel()
+    start_ssh_tunnel_async()
     
     # ═══════════════════════════════════════════════════════════
     # STEP 3: Configure Application
@@ -2947,7 +3701,7 @@ def main():
     app.setDelegate_(synth)
     
     # Run app
-    print("\n✅ Application ready - SSH tunnel active")
+    print("\n✅ Application ready - SSH tunnel connecting in background")
     print("   Press Cmd+Q or Ctrl+C to quit (tunnel will auto-close)")
     print("="*60 + "\n")
     
@@ -0,0 +1,63 @@
+"""
+Tests for route_agent_query (Agent button: tool-using agent vs. direct LLM answer)
+and the EmbeddingIndex it shares with tool pre-selection
+"""
+
+import pytest
+
+from src.brain import decision_router
+from src.brain.embedding_index import EmbeddingIndex
+
+AGENT_DIR = [1.0, 0.0]
+LLM_DIR = [0.0, 1.0]
+
+
+@pytest.fixture(autouse=True)
+def fresh_index(monkeypatch):
+    """Each test starts with un-embedded exemplars"""
+    monkeypatch.setattr(decision_router, "_exemplar_index", EmbeddingIndex(
+        [(route, text) for text, route in decision_router.ROUTE_EXEMPLARS]))
+
+
+def labelled_embed(query_vectors):
+    """Exemplars embed along their route's axis; queries use query_vectors"""
+    routes = dict(decision_router.ROUTE_EXEMPLARS)
+
+    def embed(text):
+        if text in routes:
+            return AGENT_DIR if routes[text] == "agent" else LLM_DIR
+        return query_vectors.get(text)
+    return embed
+
+
+def test_falls_back_to_agent_when_embeddings_unavailable():
+    decision = decision_router.route_agent_query("what is a hash table", lambda text: None)
+    assert decision["action"] == "agent"
+    assert decision["reason"] == "Embeddings unavailable"
+
+
+def test_falls_back_to_agent_when_batch_embedding_fails():
+    decision = decision_router.route_agent_query(
+        "what is a hash table", labelled_embed({}),
+        embed_many=lambda texts: [None] * len(texts))
+    assert decision["action"] == "agent"
+
+
+def test_falls_back_to_agent_when_query_embedding_fails():
+    decision = decision_router.route_agent_query("unseen query", labelled_embed({}))
+    assert decision["action"] == "agent"
+
+
+def test_majority_vote_picks_route():
+    embed = labelled_embed({"open Finder": [0.9, 0.1], "what is TCP": [0.1, 0.9]})
+    assert decision_router.route_agent_query("open Finder", embed)["action"] == "agent"
+    assert decision_router.route_agent_query("what is TCP", embed)["action"] == "llm"
+
+
+def test_index_retries_after_a_failed_warm_up():
+    index = EmbeddingIndex([("a", "text a"), ("b", "text b")])
+    assert index.rank("q", lambda text: None) is None
+
+    vectors = {"text a": [1.0, 0.0], "text b": [0.0, 1.0], "q": [0.2, 0.8]}
+    assert index.rank("q", vectors.get) == ["b", "a"]
+    assert index.rank("q", vectors.get, k=1) == ["b"]
@@ -0,0 +1,55 @@
+"""
+Tests for SynthMenuBarNative._input_text, the cached Python copy of the input text
+
+Needs PyObjC (macOS); skipped elsewhere.
+"""
+
+import pytest
+
+pytest.importorskip("AppKit")
+synth_native = pytest.importorskip("synth_native")
+
+
+class FakeTextView:
+    """Stands in for the NSTextView: counts string() bridge calls"""
+
+    def __init__(self, text):
+        self.text = text
+        self.calls = 0
+
+    def string(self):
+        self.calls += 1
+        return self.text
+
+
+class FakeApp:
+    def __init__(self, text):
+        self.input_text_view = FakeTextView(text)
+        self._cached_input_str = None
+
+
+def _method(name):
+    """Plain Python function behind a PyObjC selector, callable with a fake self"""
+    meth = getattr(synth_native.SynthMenuBarNative, name)
+    return getattr(meth, "callable", meth)
+
+
+def test_input_text_reads_the_view_once_per_edit():
+    app = FakeApp("what is FIPS 203")
+    input_text = _method("_input_text")
+
+    assert input_text(app) == "what is FIPS 203"
+    assert input_text(app) == "what is FIPS 203"
+    assert app.input_text_view.calls == 1
+
+
+def test_input_text_refreshes_after_edit_notification():
+    app = FakeApp("first")
+    input_text = _method("_input_text")
+    assert input_text(app) == "first"
+
+    app.input_text_view.text = "second"
+    _method("inputTextDidChange_")(app, None)
+
+    assert input_text(app) == "second"
+    assert app.input_text_view.calls == 2
@@ -0,0 +1,235 @@
+"""
+Tests for ResponseCache: exact-match tier (hit, TTL, LRU) and semantic tier (threshold, context, TTL)
+
+The semantic tier runs against an in-memory stand-in for the Qdrant client,
+so no Qdrant store or Ollama server is needed.
+"""
+
+import math
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("requests")  # src.rag's __init__ pulls in the web search module
+
+from src.rag import response_cache as rc
+from src.rag.response_cache import ResponseCache
+
+
+class Clock:
+    """Replaces the time module inside response_cache"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+class FakeQdrant:
+    """Just enough of QdrantClient for ResponseCache: one collection, cosine search"""
+
+    def __init__(self):
+        self.points = {}
+
+    def get_collections(self):
+        return SimpleNamespace(collections=[])
+
+    def create_collection(self, collection_name, vectors_config):
+        self.points = {}
+
+    def delete_collection(self, collection_name):
+        self.points = {}
+
+    def upsert(self, collection_name, points):
+        for point in points:
+            self.points[point.id] = point
+
+    def query_points(self, collection_name, query, query_filter, limit):
+        ctx = query_filter.must[0].match.value
+
+        def cosine(a, b):
+            dot = sum(x * y for x, y in zip(a, b))
+            return dot / (math.sqrt(sum(x * x for x in a)) * math.sqrt(sum(y * y for y in b)))
+
+        scored = sorted(
+            (SimpleNamespace(score=cosine(query, p.vector), payload=p.payload)
+             for p in self.points.values() if p.payload["context"] == ctx),
+            key=lambda p: p.score, reverse=True)
+        return SimpleNamespace(points=scored[:limit])
+
+
+class FakeRAG:
+    """SynthRAG stand-in: fixed embeddings per question"""
+
+    embedding_dim = 2
+
+    def __init__(self, embeddings, qdrant=None):
+        self.embeddings = embeddings
+        self.qdrant = qdrant
+        self.embed_calls = 0
+
+    def get_embedding(self, text):
+        self.embed_calls += 1
+        return self.embeddings.get(text)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(rc, "time", clock)
+    return clock
+
+
+@pytest.fixture
+def qdrant_models(monkeypatch):
+    """Plain stand-ins for the qdrant_client.models classes ResponseCache builds"""
+    for name in ("Filter", "FieldCondition", "MatchValue", "PointStruct", "VectorParams"):
+        monkeypatch.setattr(rc, name, lambda **kw: SimpleNamespace(**kw), raising=False)
+    monkeypatch.setattr(rc, "Distance", SimpleNamespace(COSINE="cosine"), raising=False)
+    monkeypatch.setattr(rc, "QDRANT_AVAILABLE", True)
+
+
+def exact_only_cache(**kwargs):
+    return ResponseCache(FakeRAG({}, qdrant=None), **kwargs)
+
+
+def semantic_cache(**kwargs):
+    rag = FakeRAG({
+        "what is ML-KEM": [1.0, 0.0],
+        "explain ML-KEM": [0.99, 0.141],   # cosine ~0.99 with the first
+        "what is BAKE": [0.8, 0.6],        # cosine 0.8 - a different question
+        "weather in Boston": [0.0, 1.0],
+        "weather in Austin": [0.1, 0.995],  # cosine ~0.995 - but a different city
+    }, qdrant=FakeQdrant())
+    return ResponseCache(rag, **kwargs), rag
+
+
+# ---- exact-match tier ----
+
+def test_exact_hit_after_put(clock):
+    cache = exact_only_cache()
+    response, slot = cache.get("What is FIPS 203?", "ctx", "ask")
+    assert response is None
+    assert cache.put(slot, "A post-quantum KEM standard")
+
+    # Normalized question: case and surrounding whitespace don't matter
+    response, slot = cache.get("  what is fips 203?", "ctx", "ask")
+    assert response == "A post-quantum KEM standard"
+    assert slot is None
+
+
+def test_exact_key_includes_context_and_mode(clock):
+    cache = exact_only_cache()
+    _, slot = cache.get("explain this", "text A", "context")
+    cache.put(slot, "about A")
+
+    assert cache.get("explain this", "text B", "context")[0] is None
+    assert cache.get("explain this", "text A", "screen")[0] is None
+
+
+def test_exact_entry_expires_after_ttl(clock):
+    cache = exact_only_cache(exact_ttl=10.0)
+    _, slot = cache.get("q", "", "ask")
+    cache.put(slot, "answer")
+
+    clock.now += 9.0
+    assert cache.get("q", "", "ask")[0] == "answer"
+    clock.now += 2.0
+    assert cache.get("q", "", "ask")[0] is None
+
+
+def test_exact_tier_evicts_least_recently_used(clock):
+    cache = exact_only_cache(exact_max_entries=2)
+    for q in ("a", "b"):
+        _, slot = cache.get(q, "", "ask")
+        cache.put(slot, f"answer {q}")
+
+    assert cache.get("a", "", "ask")[0] == "answer a"  # a is now most recent
+    _, slot = cache.get("c", "", "ask")
+    cache.put(slot, "answer c")
+
+    assert cache.get("b", "", "ask")[0] is None
+    assert cache.get("a", "", "ask")[0] == "answer a"
+    assert cache.get("c", "", "ask")[0] == "answer c"
+
+
+@pytest.mark.parametrize("response", ["❌ Error: timeout", "⚠️ No results", "Error: boom", ""])
+def test_errors_are_not_cached(clock, response):
+    cache = exact_only_cache()
+    _, slot = cache.get("q", "", "ask")
+    assert not cache.put(slot, response)
+    assert cache.get("q", "", "ask")[0] is None
+
+
+# ---- semantic tier ----
+
+def test_semantic_hit_above_threshold(clock, qdrant_models):
+    cache, _ = semantic_cache(threshold=0.95)
+    _, slot = cache.get("what is ML-KEM", "", "ask")
+    cache.put(slot, "A lattice-based KEM")
+
+    response, slot = cache.get("explain ML-KEM", "", "ask")
+    assert response == "A lattice-based KEM"
+    assert slot.embedding == [0.99, 0.141]
+
+
+def test_semantic_miss_below_threshold(clock, qdrant_models):
+    cache, _ = semantic_cache(threshold=0.95)
+    _, slot = cache.get("what is ML-KEM", "", "ask")
+    cache.put(slot, "A lattice-based KEM")
+
+    assert cache.get("what is BAKE", "", "ask")[0] is None
+
+
+def test_semantic_hit_requires_same_context(clock, qdrant_models):
+    cache, _ = semantic_cache()
+    _, slot = cache.get("what is ML-KEM", "selection A", "context")
+    cache.put(slot, "about A")
+
+    assert cache.get("explain ML-KEM", "selection B", "context")[0] is None
+
+
+def test_semantic_entry_expires_after_ttl(clock, qdrant_models):
+    cache, _ = semantic_cache(ttl=60.0, exact_ttl=5.0)
+    _, slot = cache.get("what is ML-KEM", "", "ask")
+    cache.put(slot, "A lattice-based KEM")
+
+    clock.now += 61.0
+    assert cache.get("explain ML-KEM", "", "ask")[0] is None
+
+
+def test_semantic_hit_is_promoted_to_exact_tier(clock, qdrant_models):
+    cache, rag = semantic_cache()
+    _, slot = cache.get("what is ML-KEM", "", "ask")
+    cache.put(slot, "A lattice-based KEM")
+    assert cache.get("explain ML-KEM", "", "ask")[0] == "A lattice-based KEM"
+
+    calls = rag.embed_calls
+    assert cache.get("explain ML-KEM", "", "ask")[0] == "A lattice-based KEM"
+    assert rag.embed_calls == calls  # answered without embedding again
+
+
+def test_web_modes_skip_the_semantic_tier(clock, qdrant_models):
+    cache, rag = semantic_cache()
+    _, slot = cache.get("weather in Boston", "", "ask_web")
+    assert slot.embedding is None
+    cache.put(slot, "Boston: 12°C, rain")
+
+    assert rag.embed_calls == 0
+    assert rag.qdrant.points == {}
+    assert cache.get("weather in Austin", "", "ask_web")[0] is None
+    assert cache.get("weather in Austin", "", "screen_web")[0] is None
+
+
+def test_web_mode_exact_entries_use_the_live_ttl(clock):
+    cache = exact_only_cache(exact_ttl=420.0, live_ttl=60.0)
+    for mode in ("ask", "ask_web"):
+        _, slot = cache.get("latest news", "", mode)
+        cache.put(slot, f"{mode} answer")
+
+    clock.now += 59.0
+    assert cache.get("latest news", "", "ask_web")[0] == "ask_web answer"
+    clock.now += 2.0
+    assert cache.get("latest news", "", "ask_web")[0] is None
+    assert cache.get("latest news", "", "ask")[0] == "ask answer"
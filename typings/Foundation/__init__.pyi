@@ -7,3 +7,8 @@ class NSObject:
 
 def NSMakeRect(x: float, y: float, w: float, h: float) -> Any: ...
 def NSMakeSize(w: float, h: float) -> Any: ...
+
+class NSAttributedString:
+    @staticmethod
+    def alloc() -> 'NSAttributedString': ...
+    def initWithString_attributes_(self, string: str, attributes: Any) -> 'NSAttributedString': ...